@@ -0,0 +1,89 @@
+import asyncio
+import aiohttp
+from stock_checker import StockChecker
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncStockChecker:
+    """asyncio 기반 재고 체커입니다.
+
+    상품 페이지는 연결 풀과 keep-alive를 사용하는 aiohttp 세션으로 가져오고,
+    파싱과 옵션 판정은 StockChecker와 같은 로직을 워커 스레드에서 실행하므로
+    check_stock_status()의 결과 딕셔너리는 StockChecker와 동일합니다.
+    """
+
+    def __init__(self, stock_checker=None, max_connections=None, max_connections_per_host=None):
+        self.stock_checker = stock_checker or StockChecker()
+        self.max_connections = max_connections or Config.ASYNC_MAX_CONNECTIONS
+        self.max_connections_per_host = max_connections_per_host or Config.ASYNC_MAX_CONNECTIONS_PER_HOST
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def check_stock_status(self, url):
+        """상품의 품절 상태를 비동기로 체크합니다."""
+        try:
+            website_name, website_config = self.stock_checker.detect_website(url)
+            if not website_name:
+                logger.error(f"지원하지 않는 웹사이트: {url}")
+                return None
+
+            session = self._get_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                content = await response.read()
+
+            # 파싱(및 필요 시 옵션2 조회)은 이벤트 루프를 막지 않도록 스레드에서 실행
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self.stock_checker._parse_product_page,
+                url, website_name, website_config, content
+            )
+
+        except Exception as e:
+            logger.error(f"상품 상태 체크 중 오류 발생: {url}, 오류: {e}")
+            return None
+
+    async def check_many(self, urls, concurrency=None):
+        """여러 URL을 동시에 체크하고 입력 순서대로 결과 리스트를 반환합니다.
+
+        Args:
+            urls: 체크할 URL 목록
+            concurrency: 동시에 진행할 최대 체크 수 (기본값: 연결 풀 크기)
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_connections)
+
+        async def check_one(url):
+            async with semaphore:
+                return await self.check_stock_status(url)
+
+        return await asyncio.gather(*(check_one(url) for url in urls))
+
+    async def close(self):
+        """HTTP 세션과 StockChecker 리소스를 정리합니다."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.stock_checker.close()
+
+    def _get_session(self):
+        """연결 풀을 공유하는 aiohttp 세션을 반환합니다 (처음 호출 시 생성)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=Config.ASYNC_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=dict(self.stock_checker.session.headers),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
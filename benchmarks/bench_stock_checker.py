@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재고 체크 파이프라인 벤치마크
+
+저장된 오너클랜 형태의 HTML 픽스처를 로컬 스텁 HTTP 서버로 제공하고
+(네트워크 사용 없음) 단계별 지연 시간 백분위수, 메모리 할당량, 처리량을 측정합니다.
+
+사용 예:
+    python benchmarks/bench_stock_checker.py
+    python benchmarks/bench_stock_checker.py --iterations 200 --json result.json
+    python benchmarks/bench_stock_checker.py --baseline result.json --max-regression 0.25
+"""
+
+import argparse
+import copy
+import http.server
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from urllib.parse import urlparse, parse_qs
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from config import Config
+from stock_checker import StockChecker
+from html_parsing import make_soup
+
+SINGLE_LEVEL_FIXTURE = 'ownerclan_single_level.html'
+MULTI_LEVEL_FIXTURE = 'ownerclan_multi_level.html'
+OPTION2_SIZES = ['S', 'M', 'L', 'XL', 'XXL']
+
+class FixtureHandler(http.server.BaseHTTPRequestHandler):
+    """픽스처 HTML과 옵션2 조회 응답을 제공하는 스텁 서버 핸들러입니다."""
+
+    protocol_version = 'HTTP/1.1'
+    fixtures = {}
+
+    def setup(self):
+        super().setup()
+        # 헤더와 본문을 나눠 쓸 때 Nagle 지연이 측정값에 섞이지 않도록 함
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == '/option2':
+            option1 = parse_qs(parsed.query).get('option1', [''])[0]
+            body = ''.join(
+                f'<option value="s{index}">사이즈 {size}{" [품절]" if index == 2 else ""}</option>'
+                for index, size in enumerate(OPTION2_SIZES)
+            ).encode('utf-8') if option1 else b''
+        else:
+            body = self.fixtures.get(parsed.path.lstrip('/'))
+            if body is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def start_stub_server():
+    """픽스처를 읽어 로컬 스텁 서버를 시작하고 (서버, 기본 URL)을 반환합니다."""
+    for name in os.listdir(FIXTURE_DIR):
+        with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+            FixtureHandler.fixtures[name] = f.read()
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+class StageTimer:
+    """단계별 소요 시간을 모읍니다."""
+
+    def __init__(self):
+        self.samples = {}
+
+    def measure(self, stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.samples.setdefault(stage, []).append(time.perf_counter() - start)
+        return result
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * (len(ordered) - 1)))))
+    return ordered[index]
+
+def summarize(samples):
+    return {
+        'count': len(samples),
+        'mean_ms': sum(samples) / len(samples) * 1000,
+        'p50_ms': percentile(samples, 0.50) * 1000,
+        'p90_ms': percentile(samples, 0.90) * 1000,
+        'p99_ms': percentile(samples, 0.99) * 1000,
+        'max_ms': max(samples) * 1000
+    }
+
+def make_site_config(host, **overrides):
+    """스텁 서버 호스트를 인식하도록 오너클랜 설정을 복사합니다."""
+    website_config = copy.deepcopy(Config.SUPPORTED_WEBSITES['ownerclan'])
+    website_config['base_url'] = host
+    website_config['url_patterns'] = [host]
+    website_config.update(overrides)
+    return website_config
+
+# ---------------------------------------------------------------------------
+# 시나리오: 한 번의 반복에서 파이프라인 각 단계를 StageTimer로 측정합니다.
+# ---------------------------------------------------------------------------
+
+def run_single_level(checker, timer, base_url):
+    url = f'{base_url}/{SINGLE_LEVEL_FIXTURE}'
+    website_name, website_config = timer.measure('detect', checker.detect_website, url)
+    response = timer.measure('fetch', checker.session.get, url, timeout=10)
+    soup = timer.measure('parse', make_soup, response.content, website_config)
+    stock_status = timer.measure('check_stock', checker._check_stock_availability, soup, website_config, url)
+    result = {'url': url, 'product_name': checker._extract_product_name(soup, website_name),
+              'stock_status': stock_status, 'website': website_name, 'timestamp': ''}
+    timer.measure('diff', checker.has_stock_changed, url, result)
+
+def run_multi_level_static(checker, timer, base_url):
+    url = f'{base_url}/{MULTI_LEVEL_FIXTURE}'
+    website_name, website_config = timer.measure('detect', checker.detect_website, url)
+    response = timer.measure('fetch', checker.session.get, url, timeout=10)
+    soup = timer.measure('parse', make_soup, response.content, website_config)
+    option1_element = soup.select_one(website_config['option1_selector'])
+    timer.measure('extract_options', checker._extract_option_info, option1_element)
+    stock_status = {'is_available': True, 'out_of_stock_options': [], 'all_options': [], 'option_levels': {}}
+    # url=None: 옵션2를 정적 HTML에서만 읽는 경로
+    stock_status = timer.measure('check_stock', checker._check_multi_level_stock, soup, website_config, stock_status, None)
+    result = {'url': url, 'product_name': checker._extract_product_name(soup, website_name),
+              'stock_status': stock_status, 'website': website_name, 'timestamp': ''}
+    timer.measure('diff', checker.has_stock_changed, url, result)
+
+def run_multi_level_http(checker, timer, base_url):
+    url = f'{base_url}/{MULTI_LEVEL_FIXTURE}?selfcode=WDEE1EC'
+    timer.measure('total', checker.check_stock_status, url)
+
+def run_multi_level_browser(checker, timer, base_url):
+    url = f'{base_url}/{MULTI_LEVEL_FIXTURE}'
+    timer.measure('total', checker.check_stock_status, url)
+
+def run_end_to_end_unchanged(checker, timer, base_url):
+    url = f'{base_url}/{SINGLE_LEVEL_FIXTURE}'
+    timer.measure('total', checker.check_stock_status, url)
+
+def browser_available():
+    try:
+        import selenium  # noqa: F401
+        import webdriver_manager  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def build_scenarios(host):
+    """(이름, 실행 함수, 사이트 설정, 조건부 요청 사용 여부, 사용 가능 여부) 목록"""
+    endpoint = {'url': '/option2', 'params': {'selfcode': '{selfcode}', 'option1': '{option1_value}'}}
+    return [
+        ('single_level', run_single_level, make_site_config(host, multi_level_options=False), False, True),
+        ('multi_level_static', run_multi_level_static, make_site_config(host), False, True),
+        ('multi_level_http', run_multi_level_http, make_site_config(host, option2_endpoint=endpoint), False, True),
+        ('multi_level_browser', run_multi_level_browser, make_site_config(host, option2_fetch_mode='single_page'), False, browser_available()),
+        ('end_to_end_unchanged', run_end_to_end_unchanged, make_site_config(host, multi_level_options=False), True, True),
+    ]
+
+def run_scenario(name, func, website_config, conditional_fetch, base_url, iterations, warmup):
+    """시나리오를 실행하여 단계별 지연 시간, 처리량, 메모리 할당량을 반환합니다."""
+    original_sites = Config.SUPPORTED_WEBSITES
+    original_conditional = Config.CONDITIONAL_FETCH
+    Config.SUPPORTED_WEBSITES = {'ownerclan': website_config}
+    Config.CONDITIONAL_FETCH = conditional_fetch
+    checker = StockChecker()
+
+    try:
+        for _ in range(warmup):
+            func(checker, StageTimer(), base_url)
+
+        # 지연 시간 측정
+        timer = StageTimer()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func(checker, timer, base_url)
+        elapsed = time.perf_counter() - start
+
+        # 메모리 할당 측정 (tracemalloc은 속도에 영향을 주므로 별도 실행)
+        allocation_runs = max(1, min(iterations, 20))
+        tracemalloc.start()
+        snapshot_before = tracemalloc.take_snapshot()
+        for _ in range(allocation_runs):
+            func(checker, StageTimer(), base_url)
+        snapshot_after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename') if stat.size_diff > 0)
+
+        return {
+            'iterations': iterations,
+            'throughput_per_sec': iterations / elapsed if elapsed else 0.0,
+            'stages': {stage: summarize(samples) for stage, samples in timer.samples.items()},
+            'peak_memory_kb': peak / 1024,
+            'retained_kb_per_iteration': allocated / allocation_runs / 1024
+        }
+    finally:
+        checker.close()
+        Config.SUPPORTED_WEBSITES = original_sites
+        Config.CONDITIONAL_FETCH = original_conditional
+
+def print_report(results):
+    for name, result in results.items():
+        if result is None:
+            print(f"\n[{name}] 건너뜀 (필요한 패키지 없음)")
+            continue
+        print(f"\n[{name}] {result['iterations']}회, 처리량 {result['throughput_per_sec']:.1f}건/초, "
+              f"최대 메모리 {result['peak_memory_kb']:.0f}KB, 반복당 잔존 {result['retained_kb_per_iteration']:.1f}KB")
+        print(f"  {'단계':<16}{'평균':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'최대':>10}  (ms)")
+        for stage, stats in result['stages'].items():
+            print(f"  {stage:<16}{stats['mean_ms']:>10.2f}{stats['p50_ms']:>10.2f}"
+                  f"{stats['p90_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}")
+
+def compare_with_baseline(results, baseline_path, max_regression):
+    """기준 결과 대비 p50이 max_regression 비율 이상 느려진 단계를 반환합니다."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for name, result in results.items():
+        base_result = baseline.get(name)
+        if not result or not base_result:
+            continue
+        for stage, stats in result['stages'].items():
+            base_stats = base_result['stages'].get(stage)
+            if not base_stats or base_stats['p50_ms'] <= 0:
+                continue
+            ratio = stats['p50_ms'] / base_stats['p50_ms'] - 1
+            if ratio > max_regression:
+                regressions.append((name, stage, base_stats['p50_ms'], stats['p50_ms'], ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='재고 체크 파이프라인 벤치마크')
+    parser.add_argument('--iterations', type=int, default=50, help='시나리오별 측정 반복 횟수')
+    parser.add_argument('--warmup', type=int, default=3, help='측정 전 워밍업 반복 횟수')
+    parser.add_argument('--scenarios', nargs='*', help='실행할 시나리오 이름 (기본값: 전체)')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일')
+    parser.add_argument('--max-regression', type=float, default=0.25, help='허용하는 p50 지연 증가 비율')
+    args = parser.parse_args()
+
+    # 체커의 상세 로그 출력이 측정을 왜곡하지 않도록 억제 (ERROR만 출력)
+    logging.disable(logging.WARNING)
+
+    server, base_url = start_stub_server()
+    host = urlparse(base_url).netloc
+    results = {}
+
+    try:
+        for name, func, website_config, conditional_fetch, available in build_scenarios(host):
+            if args.scenarios and name not in args.scenarios:
+                continue
+            if not available:
+                results[name] = None
+                continue
+            results[name] = run_scenario(
+                name, func, website_config, conditional_fetch, base_url, args.iterations, args.warmup
+            )
+    finally:
+        server.shutdown()
+
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.max_regression)
+        if regressions:
+            print(f"\n성능 저하 감지 (허용 {args.max_regression:.0%}):")
+            for name, stage, base_ms, current_ms, ratio in regressions:
+                print(f"  {name}/{stage}: {base_ms:.2f}ms → {current_ms:.2f}ms (+{ratio:.0%})")
+            sys.exit(1)
+        print("\n기준 대비 성능 저하 없음")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import threading
+import queue
+import time
+from contextlib import contextmanager
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BrowserSession:
+    """풀에서 관리되는 헤드리스 WebDriver 세션입니다."""
+
+    def __init__(self, driver, generation):
+        self.driver = driver
+        self.generation = generation  # 생성 당시 풀 세대 (종료 후 반납된 세션 판별용)
+        self.page_count = 0
+        self.created_at = time.time()
+
+    def load(self, url):
+        """페이지를 로드하고 페이지 수를 기록합니다."""
+        self.driver.get(url)
+        self.page_count += 1
+
+    def is_healthy(self):
+        """세션이 정상적으로 응답하는지 확인합니다."""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        """WebDriver를 종료합니다."""
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 중 오류: {e}")
+
+class BrowserPool:
+    """재사용 가능한 헤드리스 Chrome 세션 풀입니다.
+
+    브라우저는 처음 필요할 때 생성되며, 최대 max_size개까지만 동시에 유지합니다.
+    max_pages번 페이지를 로드한 세션은 반납 시 종료하고 새로 만듭니다.
+    """
+
+    def __init__(self, max_size=None, max_pages=None, acquire_timeout=None):
+        self.max_size = max_size or Config.BROWSER_POOL_SIZE
+        self.max_pages = max_pages or Config.BROWSER_MAX_PAGES_PER_SESSION
+        self.acquire_timeout = acquire_timeout or Config.BROWSER_ACQUIRE_TIMEOUT
+        self._idle = queue.LifoQueue()  # 최근 사용한 (따뜻한) 세션부터 재사용
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._driver_path = None  # ChromeDriverManager 설치 경로 캐시
+
+    @contextmanager
+    def session(self):
+        """풀에서 세션을 빌려오고 사용이 끝나면 반납합니다."""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"브라우저 세션 대기 시간 초과 ({self.acquire_timeout}초)")
+
+        browser = None
+        try:
+            browser = self._checkout()
+            yield browser
+        finally:
+            if browser is not None:
+                self._checkin(browser)
+            self._slots.release()
+
+    def shutdown(self):
+        """대기 중인 모든 세션을 종료합니다. 사용 중인 세션은 반납 시 종료됩니다."""
+        with self._lock:
+            self._generation += 1
+
+        closed_count = 0
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            browser.quit()
+            closed_count += 1
+
+        if closed_count:
+            logger.info(f"브라우저 풀 종료: {closed_count}개 세션 정리")
+
+    def _checkout(self):
+        """대기 중인 정상 세션을 꺼내거나 새 세션을 생성합니다."""
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                return self._create_session()
+
+            if browser.is_healthy():
+                return browser
+
+            logger.warning("응답하지 않는 브라우저 세션을 폐기합니다.")
+            browser.quit()
+
+    def _checkin(self, browser):
+        """세션을 풀에 반납하거나, 재생성 조건에 해당하면 종료합니다."""
+        with self._lock:
+            stale = browser.generation != self._generation
+
+        if stale:
+            browser.quit()
+        elif browser.page_count >= self.max_pages:
+            logger.info(f"브라우저 세션 재생성 ({browser.page_count}페이지 사용)")
+            browser.quit()
+        else:
+            self._idle.put(browser)
+
+    def _create_session(self):
+        """새 헤드리스 Chrome 세션을 생성합니다."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        if self._driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            self._driver_path = ChromeDriverManager().install()
+
+        logger.info("    └─ Selenium WebDriver 초기화 중...")
+
+        # Chrome 옵션 설정 (헤드리스 모드)
+        chrome_options = webdriver.ChromeOptions()
+        chrome_options.add_argument('--headless')  # 백그라운드 실행
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+
+        service = Service(self._driver_path)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver.set_page_load_timeout(Config.BROWSER_PAGE_LOAD_TIMEOUT)
+
+        with self._lock:
+            generation = self._generation
+        return BrowserSession(driver, generation)
@@ -32,42 +32,32 @@ a = Analysis(
         ('env_example.txt', '.'),
         ('README.md', '.'),
     ],
+    # python main.py --profile-startup으로 측정한 import 그래프 기준으로 정리
+    # 표준 라이브러리와 main.py에서 정적으로 찾을 수 있는 모듈은 PyInstaller가 자동으로 포함하므로 나열하지 않고,
+    # 첫 사용 시 함수 안에서 불러오는 모듈만 명시합니다 (시작 시에는 불러오지 않음).
     hiddenimports=[
-        'tkinter',
-        'tkinter.ttk',
-        'tkinter.messagebox',
-        'tkinter.scrolledtext',
-        'schedule',
+        'html_parsing',
+        'option_resolver',
+        'smtp_pool',
+        'url_import',
         'requests',
         'bs4',
-        'dotenv',
-        'email',
-        'smtplib',
-        'json',
-        'threading',
-        'time',
-        'datetime',
-        'urllib',
-        'logging',
-        # MacOS Ventura+ 호환성을 위한 추가 모듈
-        'PIL',
-        'PIL.Image',
-        'PIL.ImageDraw',
-        'PIL.ImageFont',
-        'certifi',
-        'charset_normalizer',
-        'idna',
-        'urllib3',
-        'ssl',
-        'socket',
-        'platform',
-        'sys',
-        'os',
+        'lxml',
+        'email.mime.text',
+        'email.mime.multipart',
     ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 앱에서 사용하지 않는 모듈 (비동기 체커와 벤치마크는 개발용)
+    excludes=[
+        'PIL',
+        'aiohttp',
+        'async_stock_checker',
+        'benchmarks',
+        'pydoc',
+        'test',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
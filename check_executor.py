@@ -0,0 +1,87 @@
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CheckExecutor:
+    """URL 체크를 제한된 워커 스레드 풀에서 동시에 실행합니다.
+
+    - 전체 동시 실행 수는 max_workers로 제한합니다.
+    - 같은 호스트에 대한 동시 실행 수는 max_per_host로 제한하며, 초과분은
+      호스트별 대기열에 두었다가 앞선 체크가 끝나면 이어서 실행합니다.
+    - 이미 실행 중이거나 대기 중인 URL은 다시 등록하지 않습니다.
+    """
+
+    def __init__(self, check_func, max_workers=None, max_per_host=None):
+        self.check_func = check_func
+        self.max_workers = max_workers or Config.MAX_CONCURRENT_CHECKS
+        self.max_per_host = max_per_host or Config.MAX_CONCURRENT_CHECKS_PER_HOST
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='stock-check')
+        self._lock = threading.Lock()
+        self._in_flight = set()  # 실행 중 + 대기 중인 URL
+        self._host_active = defaultdict(int)
+        self._host_pending = defaultdict(deque)
+        self._closed = False
+
+    def submit(self, url):
+        """URL 체크를 등록합니다. 이미 진행 중인 URL이면 False를 반환합니다."""
+        host = urlparse(url).netloc.lower()
+
+        with self._lock:
+            if self._closed or url in self._in_flight:
+                return False
+
+            self._in_flight.add(url)
+            if self._host_active[host] >= self.max_per_host:
+                self._host_pending[host].append(url)
+                return True
+
+            self._host_active[host] += 1
+            # shutdown()이 _closed를 잠금 안에서 설정하므로, 잠금 안에서 제출하면 종료된 풀에 제출하지 않음
+            self._executor.submit(self._run, url, host)
+        return True
+
+    def is_in_flight(self, url):
+        """URL이 실행 중이거나 대기 중인지 확인합니다."""
+        with self._lock:
+            return url in self._in_flight
+
+    def in_flight_count(self):
+        """실행 중이거나 대기 중인 URL 수를 반환합니다."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def shutdown(self, wait=False):
+        """대기 중인 체크를 버리고 워커 풀을 종료합니다."""
+        with self._lock:
+            self._closed = True
+            for pending in self._host_pending.values():
+                for url in pending:
+                    self._in_flight.discard(url)
+            self._host_pending.clear()
+
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, url, host):
+        """체크를 실행하고, 끝나면 같은 호스트의 다음 대기 URL을 이어서 실행합니다."""
+        while url is not None:
+            try:
+                self.check_func(url)
+            except Exception as e:
+                logger.error(f"URL 체크 워커 오류: {url}, 오류: {e}")
+
+            with self._lock:
+                self._in_flight.discard(url)
+                pending = self._host_pending.get(host)
+                if pending and not self._closed:
+                    url = pending.popleft()
+                else:
+                    url = None
+                    self._host_active[host] -= 1
+                    if self._host_active[host] <= 0:
+                        del self._host_active[host]
+                        self._host_pending.pop(host, None)
@@ -14,6 +14,93 @@ class Config:
     DEFAULT_INTERVAL = 5  # 기본 체크 간격 (분)
     DEFAULT_RECEIVER_EMAIL = ''  # 사용자가 입력할 수신자 이메일
     
+    # SMTP 연결 풀 설정
+    SMTP_POOL_SIZE = 2  # 동시에 유지할 최대 SMTP 연결 수
+    SMTP_IDLE_TIMEOUT = 60  # 이 시간(초) 이상 쉰 연결은 재사용하지 않고 새로 연결
+    SMTP_MAX_MESSAGES_PER_CONNECTION = 90  # 이 개수만큼 발송하면 연결 재생성 (Gmail 연결당 제한 대비)
+    SMTP_ACQUIRE_TIMEOUT = 60  # 연결 대기 최대 시간 (초)
+    SMTP_TIMEOUT = 30  # SMTP 서버 응답 대기 시간 (초)
+    
+    # 알림 발송 큐 설정
+    NOTIFICATION_QUEUE_SIZE = 1000  # 메모리 큐 최대 크기 (초과분은 스풀에 보관했다가 큐가 비면 발송)
+    NOTIFICATION_BATCH_SIZE = 20  # 한 SMTP 세션으로 이어서 보낼 최대 알림 수
+    NOTIFICATION_MAX_RETRIES = 5  # 발송 실패 시 최대 시도 횟수
+    NOTIFICATION_RETRY_BASE_DELAY = 30  # 첫 재시도 대기 시간 (초, 실패할 때마다 2배)
+    NOTIFICATION_RETRY_MAX_DELAY = 1800  # 재시도 대기 시간 상한 (초)
+    NOTIFICATION_SPOOL_DIR = os.path.join(os.path.expanduser("~"), "StockMonitor_spool")  # 미발송 알림 보관 디렉토리
+    
+    # 알림 대상 재고 이벤트 유형 (stock_events.py 참고)
+    # 'product_unavailable', 'product_available', 'option_sold_out', 'option_restocked', 'option_added', 'option_removed'
+    NOTIFY_EVENT_TYPES = ('product_unavailable', 'product_available', 'option_sold_out', 'option_restocked')
+    
+    # 설정 파일 저장
+    CONFIG_FILE_PATH = os.path.join(os.path.expanduser("~"), "StockMonitor_config.json")  # GUI/데몬 공용 설정 파일
+    CONFIG_JOURNAL_COMPACT_THRESHOLD = 200  # 변경 기록이 이 줄 수를 넘으면 설정 파일을 다시 씀
+    
+    # 재고 상태 저장 설정
+    STATE_STORE_ENABLED = True  # URL별 이전 재고 상태를 파일에 저장하여 재시작 후에도 비교 유지
+    STATE_DB_PATH = os.path.join(os.path.expanduser("~"), "StockMonitor_state.db")  # SQLite 파일 경로
+    STATE_FLUSH_INTERVAL = 5  # 변경된 상태를 모아서 기록하는 주기 (초)
+    STATE_FLUSH_BATCH = 500  # 이 개수 이상 쌓이면 주기와 관계없이 바로 기록
+    
+    # 재고 이력 설정
+    HISTORY_ENABLED = True  # 옵션별 재고 변화 이력 기록
+    HISTORY_DB_PATH = os.path.join(os.path.expanduser("~"), "StockMonitor_history.db")  # SQLite 파일 경로
+    HISTORY_RETENTION_DAYS = 365  # 이력 보관 기간 (일, 0이면 정리하지 않음)
+    HISTORY_FLUSH_INTERVAL = 60  # 체크 구간(coverage) 기록 주기 (초)
+    HISTORY_MIN_GAP_SECONDS = 300  # 체크 간격의 2.5배와 이 값 중 큰 시간 동안 체크가 없으면 구간을 끊음 (초)
+    
+    # 요약 알림 설정
+    DIGEST_ENABLED = False  # True이면 재고 변동을 수신자별로 모아 한 통의 요약 메일로 발송
+    DIGEST_WINDOW_SECONDS = 300  # 첫 변동 후 이 시간(초) 동안 모인 변동을 함께 발송
+    
+    # HTML 파싱 설정
+    HTML_PARSER = 'lxml'  # 'lxml' (빠름, 미설치 시 html.parser로 대체) 또는 'html.parser'
+    TARGETED_PARSING = True  # 사이트 설정의 선택자에 해당하는 요소(상품명, 옵션 select)만 파싱
+    
+    # 조건부 요청 설정 (ETag/Last-Modified, 옵션 영역 해시가 같으면 파싱 생략)
+    CONDITIONAL_FETCH = True
+    
+    # 동시 체크 설정
+    MAX_CONCURRENT_CHECKS = 8  # 동시에 체크할 최대 URL 수
+    MAX_CONCURRENT_CHECKS_PER_HOST = 2  # 같은 웹사이트에 동시에 보내는 최대 체크 수
+    
+    # 스케줄 분산 설정
+    SCHEDULE_JITTER_RATIO = 0.1  # 체크 간격 대비 무작위 오차 범위 (±10%)
+    SCHEDULE_RATE_WINDOW = 600  # 요청률 분산 지표 집계 구간 (초)
+    SCHEDULE_RATE_BUCKET = 10  # 요청률 분산 지표 버킷 크기 (초)
+    
+    # 비동기 체커 설정 (AsyncStockChecker)
+    ASYNC_MAX_CONNECTIONS = 100  # 전체 HTTP 연결 풀 크기
+    ASYNC_MAX_CONNECTIONS_PER_HOST = 10  # 호스트별 최대 연결 수
+    ASYNC_KEEPALIVE_TIMEOUT = 30  # 유휴 연결 유지 시간 (초)
+    
+    # 메트릭 설정
+    METRICS_ENABLED = False  # True이면 모니터링 중 Prometheus 형식 메트릭 엔드포인트 실행
+    METRICS_HOST = '127.0.0.1'  # 로컬에서만 접근 가능하도록 기본값은 루프백
+    METRICS_PORT = 9108  # http://127.0.0.1:9108/metrics
+    
+    # GUI 로그 설정
+    GUI_LOG_MAX_LINES = 1000  # 로그 창과 로그 버퍼에 보관할 최대 줄 수
+    GUI_LOG_DRAIN_INTERVAL_MS = 200  # 새 로그를 모아 로그 창에 반영하는 주기 (밀리초, 메인 루프에서 실행)
+    GUI_STATUS_TABLE_ROWS = 6  # URL 상태 표에 한 번에 보이는 줄 수
+    GUI_REFRESH_DELAY_MS = 100  # 모아 둔 모니터 이벤트를 화면에 반영하는 주기 (밀리초, 메인 루프에서 실행)
+    GUI_IDLE_POLL_MAX_MS = 1000  # 반영할 것이 없을 때 위 두 주기를 두 배씩 늘리는 상한 (밀리초)
+    
+    # URL 가져오기 설정 (범위를 벗어난 체크 간격은 잘못된 항목으로 건너뜀)
+    IMPORT_MIN_INTERVAL_MINUTES = 0.17  # GUI에서 고를 수 있는 가장 짧은 간격 (10초)
+    IMPORT_MAX_INTERVAL_MINUTES = 7 * 24 * 60  # 일주일
+    
+    # 시작 시간 설정 (python main.py --profile-startup)
+    STARTUP_IMPORT_BUDGET_MS = 300  # 시작 시 모듈 불러오기 시간 예산 (밀리초)
+    
+    # 브라우저 풀 설정 (Selenium)
+    BROWSER_POOL_SIZE = 2  # 동시에 유지할 최대 WebDriver 세션 수
+    BROWSER_MAX_PAGES_PER_SESSION = 50  # 이 횟수만큼 페이지를 로드하면 세션 재생성
+    BROWSER_ACQUIRE_TIMEOUT = 60  # 세션 대기 최대 시간 (초)
+    BROWSER_PAGE_LOAD_TIMEOUT = 30  # 페이지 로드 최대 시간 (초)
+    OPTION2_WAIT_TIMEOUT = 5  # 옵션1 선택 후 옵션2 변경을 기다리는 최대 시간 (초)
+    
     # 웹사이트 설정
     SUPPORTED_WEBSITES = {
         'ownerclan': {
@@ -30,6 +117,13 @@ class Config:
             'option1_selector': '#option1',  # 첫 번째 옵션 선택자
             'option2_selector': '#option2',  # 두 번째 옵션 선택자
             'stock_status_selector': 'option',  # 품절 상태 확인할 옵션 요소
-            'stock_check_method': 'multi_level'  # 다계층 옵션 체크 방법
+            'stock_check_method': 'multi_level',  # 다계층 옵션 체크 방법
+            'option2_fetch_mode': 'single_page',  # 옵션2 수집 방식 ('single_page': 한 번 로드, 'per_option': 옵션1마다 로드)
+            # 옵션2를 채우는 XHR 엔드포인트 (설정 시 브라우저 없이 HTTP로 조회, 형식은 option_resolver.py 참고)
+            # 오너클랜의 옵션2 요청 형식은 아직 확인되지 않아 비워 두었으며, 지금은 옵션2를 모두 브라우저로 수집합니다.
+            'option2_endpoint': None,
+            # 페이지 HTML만으로 재고가 결정되면 True (옵션2를 JS로 불러오므로 False)
+            # False이면 재고 있는 옵션1이 있는 상품은 페이지가 같아도 매번 옵션2를 다시 확인합니다.
+            'static_stock_state': False
         }
     }
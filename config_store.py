@@ -0,0 +1,243 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ConfigStore:
+    """모니터링 설정(수신자 이메일, URL 목록)을 파일에 저장하는 저장소입니다.
+
+    설정 파일(StockMonitor_config.json)에는 설정만 저장하고 체크 결과 같은 실행 상태는 저장하지 않습니다.
+    전체 저장은 임시 파일에 쓴 뒤 이름을 바꾸므로 저장 도중 종료되어도 이전 파일이 그대로 남습니다.
+    URL 하나를 추가/제거할 때는 설정 파일 옆의 변경 기록(.journal)에 한 줄만 덧붙이고,
+    기록이 compact_threshold줄을 넘으면 설정 파일을 다시 쓰고 기록을 비웁니다.
+    불러올 때는 설정 파일을 읽은 뒤 변경 기록을 순서대로 적용합니다.
+
+    read_only=True이면 파일을 읽기만 합니다 (GUI가 기록 중인 파일을 데몬이 정리하지 않도록).
+    읽을 수 없는 설정 파일을 전체 저장으로 덮어쓸 때는 먼저 백업하고 경로를 backup_path에 남깁니다.
+    """
+
+    def __init__(self, path=None, compact_threshold=None, read_only=False):
+        self.path = path or Config.CONFIG_FILE_PATH
+        self.journal_path = self.path + '.journal'
+        self.compact_threshold = compact_threshold or Config.CONFIG_JOURNAL_COMPACT_THRESHOLD
+        self.read_only = read_only
+        self.backup_path = None  # 마지막으로 백업한 읽을 수 없는 설정 파일 경로
+        self._data = _empty_config()
+        self._journal_lines = 0
+        self._loaded = False  # 저장된 설정을 읽었는지 (읽기 전에는 부분 변경으로 파일을 덮어쓰지 않음)
+        self._unreadable = False  # 설정 파일이 있지만 읽을 수 없음 (덮어쓰기 전에 백업 필요)
+        self._lock = threading.Lock()
+
+    def exists(self):
+        """저장된 설정이 있는지 반환합니다."""
+        return os.path.exists(self.path) or os.path.exists(self.journal_path)
+
+    def load(self):
+        """설정 파일과 변경 기록을 읽어 설정을 반환합니다. 읽을 수 없으면 None을 반환합니다.
+
+        Returns:
+            dict: {'receiver_email': 이메일, 'monitored_urls': {url: {'interval': 분, 'receiver_email': 이메일}}}
+        """
+        with self._lock:
+            if not self._load():
+                return None
+            return _copy_config(self._data)
+
+    def set_url(self, url, interval, receiver_email):
+        """URL 설정을 추가하거나 변경합니다."""
+        with self._lock:
+            if not self._ensure_loaded():
+                return False
+            self._data['monitored_urls'][url] = _url_entry(interval, receiver_email)
+            return self._append({'op': 'set', 'url': url, 'interval': interval, 'receiver_email': receiver_email})
+
+    def remove_url(self, url):
+        """URL 설정을 제거합니다."""
+        with self._lock:
+            if not self._ensure_loaded():
+                return False
+            if self._data['monitored_urls'].pop(url, None) is None:
+                return True
+            return self._append({'op': 'remove', 'url': url})
+
+    def set_receiver_email(self, receiver_email):
+        """기본 수신자 이메일을 변경합니다."""
+        with self._lock:
+            if not self._ensure_loaded():
+                return False
+            if self._data['receiver_email'] == receiver_email:
+                return True
+            self._data['receiver_email'] = receiver_email
+            return self._append({'op': 'receiver_email', 'value': receiver_email})
+
+    def save(self, receiver_email=None, monitored_urls=None):
+        """설정 전체를 설정 파일에 다시 쓰고 변경 기록을 비웁니다.
+
+        Args:
+            receiver_email: 기본 수신자 이메일 (생략 시 현재 값)
+            monitored_urls: {url: {'interval', 'receiver_email', ...}} (생략 시 현재 값, 실행 상태 항목은 저장하지 않음)
+        """
+        with self._lock:
+            if monitored_urls is None and not self._ensure_loaded():
+                return False
+            if receiver_email is not None:
+                self._data['receiver_email'] = receiver_email
+            if monitored_urls is not None:
+                self._data['monitored_urls'] = {
+                    url: _url_entry(url_config['interval'], url_config['receiver_email'])
+                    for url, url_config in monitored_urls.items()
+                }
+                self._loaded = True
+            if self._unreadable and not self._backup_unreadable():
+                return False
+            return self._compact()
+
+    def _ensure_loaded(self):
+        """부분 변경 전에 저장된 설정을 읽어 둡니다 (읽지 못하면 False)."""
+        return self._loaded or self._load()
+
+    def _load(self):
+        """설정 파일과 변경 기록을 읽어 self._data에 반영합니다."""
+        data = _empty_config()
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    loaded = json.load(f)
+                data['receiver_email'] = loaded.get('receiver_email', '')
+                for url, url_config in loaded.get('monitored_urls', {}).items():
+                    try:
+                        interval = _checked_interval(url_config.get('interval', 5))
+                    except ValueError as e:
+                        logger.warning(f"잘못된 체크 간격으로 URL 설정을 건너뜁니다: {url}, 오류: {e}")
+                        continue
+                    data['monitored_urls'][url] = _url_entry(interval, url_config.get('receiver_email', ''))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.error(f"설정 파일을 읽을 수 없습니다: {self.path}, 오류: {e}")
+            self._unreadable = True
+            return False
+
+        applied, damaged = self._replay_journal(data)
+        self._data = data
+        self._journal_lines = applied
+        self._loaded = True
+        self._unreadable = False
+        if damaged and not self.read_only:
+            # 잘린 줄 뒤에 기록을 덧붙이면 새 기록까지 깨지므로 바로 정리
+            self._compact()
+        return True
+
+    def _backup_unreadable(self):
+        """읽을 수 없는 설정 파일과 변경 기록을 덮어쓰기 전에 복사해 둡니다."""
+        backup_path = f"{self.path}.{datetime.now().strftime('%Y%m%d-%H%M%S')}.bak"
+        try:
+            if os.path.exists(self.path):
+                shutil.copy2(self.path, backup_path)
+            if os.path.exists(self.journal_path):
+                shutil.copy2(self.journal_path, backup_path + '.journal')
+        except OSError as e:
+            logger.error(f"읽을 수 없는 설정 파일을 백업하지 못해 저장하지 않습니다: {self.path}, 오류: {e}")
+            return False
+        logger.warning(f"읽을 수 없는 설정 파일을 백업했습니다: {backup_path}")
+        self.backup_path = backup_path
+        self._unreadable = False
+        return True
+
+    def _append(self, record):
+        """변경 기록에 한 줄을 덧붙입니다. 기록이 길어지면 설정 파일을 다시 씁니다."""
+        if self.read_only:
+            logger.error(f"읽기 전용으로 연 설정은 변경할 수 없습니다: {self.path}")
+            return False
+        if self._journal_lines >= self.compact_threshold:
+            return self._compact()
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"설정 변경 기록 실패: {self.journal_path}, 오류: {e}")
+            return False
+        self._journal_lines += 1
+        return True
+
+    def _compact(self):
+        """현재 설정을 임시 파일에 쓰고 설정 파일과 바꾼 뒤 변경 기록을 지웁니다."""
+        if self.read_only:
+            logger.error(f"읽기 전용으로 연 설정은 저장할 수 없습니다: {self.path}")
+            return False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, ensure_ascii=False, separators=(',', ':'))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            # 설정 파일을 바꾼 뒤에 지우므로, 그 사이에 종료되어도 기록을 다시 적용할 뿐 (같은 결과)
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        except OSError as e:
+            logger.error(f"설정 파일 저장 실패: {self.path}, 오류: {e}")
+            return False
+        self._journal_lines = 0
+        return True
+
+    def _replay_journal(self, data):
+        """변경 기록을 data에 순서대로 적용하고 (적용한 줄 수, 손상된 줄 수)를 반환합니다."""
+        if not os.path.exists(self.journal_path):
+            return 0, 0
+        count = 0
+        damaged = 0
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        op = record.get('op')
+                        if op == 'set':
+                            interval = _checked_interval(record['interval'])
+                            data['monitored_urls'][record['url']] = _url_entry(interval, record['receiver_email'])
+                        elif op == 'remove':
+                            data['monitored_urls'].pop(record['url'], None)
+                        elif op == 'receiver_email':
+                            data['receiver_email'] = record['value']
+                    except (ValueError, KeyError, AttributeError):
+                        # 기록 도중 종료되어 잘린 줄이나 체크 간격이 잘못된 기록은 건너뜀
+                        logger.warning(f"설정 변경 기록의 손상된 줄을 건너뜁니다: {self.journal_path}")
+                        damaged += 1
+                        continue
+                    count += 1
+        except OSError as e:
+            logger.error(f"설정 변경 기록을 읽을 수 없습니다: {self.journal_path}, 오류: {e}")
+        return count, damaged
+
+def _empty_config():
+    return {'receiver_email': '', 'monitored_urls': {}}
+
+def _checked_interval(value):
+    """저장된 체크 간격을 URL 가져오기와 같은 규칙으로 검사합니다 (잘못되면 ValueError)."""
+    from url_import import parse_interval
+    interval = parse_interval(value)
+    if interval is None:
+        raise ValueError("체크 간격이 비어 있습니다")
+    return interval
+
+def _url_entry(interval, receiver_email):
+    return {'interval': interval, 'receiver_email': receiver_email}
+
+def _copy_config(data):
+    return {
+        'receiver_email': data['receiver_email'],
+        'monitored_urls': {url: dict(url_config) for url, url_config in data['monitored_urls'].items()}
+    }
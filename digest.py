@@ -0,0 +1,78 @@
+import threading
+from datetime import datetime
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DigestAggregator:
+    """수신자별로 재고 변동을 모았다가 일정 시간마다 한 통의 요약 메일로 보내는 집계기입니다.
+
+    수신자의 첫 변동이 들어오면 window_seconds 뒤에 그동안 모인 변동을 한 번에 발송합니다.
+    같은 URL이 창 안에서 여러 번 바뀌면 창 시작 전 상태(previous_status)와 마지막 상태만 남깁니다.
+    모인 변동이 하나뿐이면 일반 변동 알림으로 보냅니다.
+    """
+
+    def __init__(self, send, window_seconds=None):
+        self.send = send  # send(receiver_email, stock_info, email_type) 발송(또는 큐 등록) 함수
+        self.window_seconds = window_seconds or Config.DIGEST_WINDOW_SECONDS
+        self._pending = {}  # receiver_email -> {url: stock_info}
+        self._timers = {}  # receiver_email -> threading.Timer
+        self._lock = threading.Lock()
+
+    def add(self, receiver_email, stock_info):
+        """재고 변동을 수신자의 요약에 추가합니다."""
+        url = stock_info['url']
+        with self._lock:
+            changes = self._pending.setdefault(receiver_email, {})
+            earlier = changes.get(url)
+            if earlier:
+                # 창 안에서 여러 번 바뀐 경우 창 시작 전 상태와 비교하도록 유지하고 이벤트는 이어 붙임
+                stock_info = dict(stock_info)
+                if 'previous_status' in earlier:
+                    stock_info['previous_status'] = earlier['previous_status']
+                if earlier.get('events') or stock_info.get('events'):
+                    stock_info['events'] = earlier.get('events', []) + stock_info.get('events', [])
+            changes[url] = stock_info
+
+            if receiver_email not in self._timers:
+                timer = threading.Timer(self.window_seconds, self._flush_receiver, args=(receiver_email,))
+                timer.daemon = True
+                self._timers[receiver_email] = timer
+                timer.start()
+
+    def pending_count(self):
+        """발송 대기 중인 변동 수를 반환합니다."""
+        with self._lock:
+            return sum(len(changes) for changes in self._pending.values())
+
+    def flush(self):
+        """모든 수신자의 대기 중인 요약을 즉시 발송합니다."""
+        with self._lock:
+            receivers = list(self._pending)
+        for receiver_email in receivers:
+            self._flush_receiver(receiver_email)
+
+    def _flush_receiver(self, receiver_email):
+        with self._lock:
+            timer = self._timers.pop(receiver_email, None)
+            changes = self._pending.pop(receiver_email, None)
+        if timer:
+            timer.cancel()
+        if not changes:
+            return
+
+        items = list(changes.values())
+        try:
+            if len(items) == 1:
+                self.send(receiver_email, items[0], "change")
+            else:
+                digest = {
+                    'items': items,
+                    'url': f"{len(items)}개 상품",
+                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+                self.send(receiver_email, digest, "digest")
+                logger.info(f"재고 변동 {len(items)}건을 요약 메일로 묶었습니다: {receiver_email}")
+        except Exception as e:
+            logger.error(f"요약 알림 발송 중 오류 발생: {receiver_email}, 오류: {e}")
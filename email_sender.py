@@ -1,7 +1,6 @@
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
 from config import Config
+from stock_events import EVENT_ICONS, EVENT_LABELS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +11,20 @@ class EmailSender:
         self.smtp_port = Config.SMTP_PORT
         self.email_user = Config.EMAIL_USER
         self.email_password = Config.EMAIL_PASSWORD
+        # 로그인까지 마친 SMTP 연결을 메일마다 새로 만들지 않고 재사용 (smtplib은 첫 발송 때 로드)
+        self._smtp_pool = None
+        self._smtp_pool_lock = threading.Lock()
+    
+    @property
+    def smtp_pool(self):
+        """SMTP 연결 풀을 반환합니다. 처음 발송할 때 생성합니다."""
+        with self._smtp_pool_lock:
+            if self._smtp_pool is None:
+                from smtp_pool import SMTPConnectionPool
+                self._smtp_pool = SMTPConnectionPool(
+                    self.smtp_server, self.smtp_port, self.email_user, self.email_password
+                )
+            return self._smtp_pool
     
     def send_stock_notification(self, receiver_email, stock_info, email_type="initial"):
         """재고 상태 알림을 이메일로 발송합니다.
@@ -21,43 +34,89 @@ class EmailSender:
             stock_info: 재고 정보
             email_type: 이메일 유형 ("initial", "change", "status")
         """
-        try:
-            # 이메일 설정이 완료되지 않은 경우
-            if not self.email_user or not self.email_password:
-                logger.error("이메일 설정이 완료되지 않았습니다.")
-                return False
-            
-            # 이메일 유형에 따른 제목과 본문 구성
-            if email_type == "initial":
-                subject = f"[재고 모니터링 시작] {stock_info['product_name']} 재고 상태"
-            elif email_type == "change":
-                subject = f"[재고 변동 알림] {stock_info['product_name']} 재고 상태 변화"
-            else:
-                subject = f"[재고 상태 알림] {stock_info['product_name']} 재고 현황"
-            
-            # 이메일 본문 구성
-            body = self._create_email_body(stock_info, email_type)
-            
-            # 이메일 메시지 생성
-            msg = MIMEMultipart()
-            msg['From'] = self.email_user
-            msg['To'] = receiver_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
-            
-            # 이메일 발송
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_user, self.email_password)
-                server.send_message(msg)
+        return self.send_many([(receiver_email, stock_info, email_type)])[0]
+    
+    def send_many(self, notifications):
+        """여러 알림을 하나의 SMTP 연결로 이어서 발송합니다.
+        
+        Args:
+            notifications: (receiver_email, stock_info, email_type) 목록
             
-            logger.info(f"재고 알림 이메일을 {receiver_email}로 발송했습니다. (유형: {email_type})")
-            return True
+        Returns:
+            list: 입력 순서대로 각 알림의 발송 성공 여부
+        """
+        notifications = list(notifications)
+        results = [False] * len(notifications)
+        if not notifications:
+            return results
+        
+        # 이메일 설정이 완료되지 않은 경우
+        if not self.email_user or not self.email_password:
+            logger.error("이메일 설정이 완료되지 않았습니다.")
+            return results
+        
+        import smtplib
+        try:
+            with self.smtp_pool.connection() as connection:
+                for index, (receiver_email, stock_info, email_type) in enumerate(notifications):
+                    try:
+                        msg = self._create_message(receiver_email, stock_info, email_type)
+                    except Exception as e:
+                        logger.error(f"이메일 메시지 생성 중 오류 발생: {receiver_email}, 오류: {e}")
+                        continue
+                    
+                    try:
+                        connection.send(msg)
+                        results[index] = True
+                        logger.info(f"재고 알림 이메일을 {receiver_email}로 발송했습니다. (유형: {email_type})")
+                    except smtplib.SMTPException as e:
+                        if isinstance(e, (smtplib.SMTPServerDisconnected, smtplib.SMTPAuthenticationError)):
+                            raise
+                        logger.error(f"이메일 발송 중 오류 발생: {receiver_email}, 오류: {e}")
             
         except Exception as e:
             logger.error(f"이메일 발송 중 오류 발생: {e}")
-            return False
+        
+        return results
+    
+    def close(self):
+        """재사용 중이던 SMTP 연결을 닫습니다."""
+        with self._smtp_pool_lock:
+            pool, self._smtp_pool = self._smtp_pool, None
+        if pool is not None:
+            pool.shutdown()
+    
+    def _create_message(self, receiver_email, stock_info, email_type):
+        """알림 이메일 메시지를 생성합니다."""
+        # 요약 메일 (여러 상품의 변동을 한 통으로)
+        if email_type == "digest":
+            subject = f"[재고 변동 요약] {len(stock_info['items'])}개 상품 재고 상태 변화"
+            body = self._create_digest_body(stock_info)
+            return self._build_mime_message(receiver_email, subject, body)
+        
+        # 이메일 유형에 따른 제목과 본문 구성
+        if email_type == "initial":
+            subject = f"[재고 모니터링 시작] {stock_info['product_name']} 재고 상태"
+        elif email_type == "change":
+            subject = f"[재고 변동 알림] {stock_info['product_name']} 재고 상태 변화"
+        else:
+            subject = f"[재고 상태 알림] {stock_info['product_name']} 재고 현황"
+        
+        # 이메일 본문 구성
+        body = self._create_email_body(stock_info, email_type)
+        return self._build_mime_message(receiver_email, subject, body)
+    
+    def _build_mime_message(self, receiver_email, subject, body):
+        """제목과 본문으로 MIME 메시지를 생성합니다."""
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        msg = MIMEMultipart()
+        msg['From'] = self.email_user
+        msg['To'] = receiver_email
+        msg['Subject'] = subject
+        
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        return msg
     
     def _create_email_body(self, stock_info, email_type="initial"):
         """이메일 본문을 생성합니다."""
@@ -65,7 +124,26 @@ class EmailSender:
 {'='*50}
 재고 모니터링 시스템 알림
 {'='*50}
-
+"""
+        body += self._create_product_summary(stock_info)
+        
+        # 이메일 유형에 따른 메시지 구성
+        if email_type == "initial":
+            body += self._create_initial_status_message(stock_info)
+        elif email_type == "change":
+            body += self._create_change_notification_message(stock_info)
+        else:
+            body += self._create_status_message(stock_info)
+        
+        body += f"""
+{'='*50}
+이 메일은 자동으로 발송되었습니다.
+{'='*50}"""
+        return body
+    
+    def _create_product_summary(self, stock_info):
+        """상품 기본 정보와 재고 요약을 생성합니다."""
+        return f"""
 상품명: {stock_info['product_name']}
 웹사이트: {stock_info['website']}
 체크 시간: {stock_info['timestamp']}
@@ -73,15 +151,24 @@ class EmailSender:
 
 재고 요약: {stock_info['stock_status']['all_options'].__len__()}개 옵션 중 {stock_info['stock_status']['out_of_stock_options'].__len__()}개 품절
 
+"""
+    
+    def _create_digest_body(self, digest):
+        """여러 상품의 재고 변동을 묶은 요약 메일 본문을 생성합니다."""
+        items = digest['items']
+        body = f"""
+{'='*50}
+재고 모니터링 시스템 알림 (변동 요약)
+{'='*50}
+
+요약 시간: {digest['timestamp']}
+재고 변동 상품: {len(items)}개
 """
         
-        # 이메일 유형에 따른 메시지 구성
-        if email_type == "initial":
-            body += self._create_initial_status_message(stock_info)
-        elif email_type == "change":
+        for index, stock_info in enumerate(items, 1):
+            body += f"\n{'-'*50}\n[{index}/{len(items)}]\n"
+            body += self._create_product_summary(stock_info)
             body += self._create_change_notification_message(stock_info)
-        else:
-            body += self._create_status_message(stock_info)
         
         body += f"""
 {'='*50}
@@ -108,6 +195,10 @@ class EmailSender:
         """재고 변동 알림 메시지를 생성합니다."""
         message = f"🔄 {stock_info['product_name']} 상품의 재고 변동이 발생했습니다.\n\n"
         
+        # 재고 이벤트가 있으면 바뀐 옵션만 표시
+        if stock_info.get('events'):
+            return message + self._create_event_list_message(stock_info['events'])
+        
         # 이전 상태와 현재 상태 비교 정보 추가
         if 'previous_status' in stock_info:
             message += "변동 전 품절 옵션:\n"
@@ -122,6 +213,18 @@ class EmailSender:
         
         return message
     
+    def _create_event_list_message(self, events):
+        """재고 이벤트 목록 메시지를 생성합니다."""
+        message = "변동 내역:\n"
+        for event in events:
+            icon = EVENT_ICONS.get(event['type'], '•')
+            label = EVENT_LABELS.get(event['type'], event['type'])
+            if event.get('option'):
+                message += f"  {icon} {label}: {event['option']}\n"
+            else:
+                message += f"  {icon} {label}\n"
+        return message
+    
     def _create_status_message(self, stock_info):
         """일반 상태 메시지를 생성합니다."""
         return self._create_initial_status_message(stock_info)
@@ -132,6 +235,7 @@ class EmailSender:
             if not self.email_user or not self.email_password:
                 return False, "이메일 계정 정보가 설정되지 않았습니다."
             
+            import smtplib
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.email_user, self.email_password)
@@ -2,10 +2,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import time
-from monitor import StockMonitor
+from monitor import StockMonitor, CHECK_COMPLETED
 from email_sender import EmailSender
+from config_store import ConfigStore
+from log_buffer import LogBuffer
+from status_table import StatusTable, format_status_row
 from config import Config
-import json
 import os
 
 class StockMonitorGUI:
@@ -17,24 +19,46 @@ class StockMonitorGUI:
         self.monitor = StockMonitor()
         self.email_sender = EmailSender()
         
-        # 모니터에 로그 콜백 설정
+        # 체크 스레드의 로그는 버퍼에 쌓고 메인 루프가 모아서 한꺼번에 로그 창에 반영
+        self.log_buffer = LogBuffer(Config.GUI_LOG_MAX_LINES)
+        self._log_seq = 0  # 로그 창에 마지막으로 반영한 로그 번호
         self.monitor.log_callback = self._add_log
         
-        # 설정 파일 경로 (사용자 홈 디렉토리에 저장)
-        import os
-        home_dir = os.path.expanduser("~")
-        self.config_file = os.path.join(home_dir, "StockMonitor_config.json")
+        # 모니터 상태 변화 이벤트를 받아 바뀐 부분만 다시 그림
+        # 다른 스레드는 아래 상태만 기록하고, Tk 호출은 메인 루프의 after 반복에서만 함
+        self._ui_lock = threading.Lock()
+        self._full_refresh = False  # 상태 표시와 URL 표 전체를 다시 그려야 하는지
+        self._dirty_urls = set()  # 체크가 끝나 표의 해당 줄만 다시 그릴 URL
+        self._pending_calls = []  # 다른 스레드가 메인 루프에서 실행하도록 넘긴 함수
+        # 메인 루프의 반복 작업: 이름 -> {'func', 'base', 'delay', 'after_id'}
+        # 반영할 것이 없으면 간격을 GUI_IDLE_POLL_MAX_MS까지 늘리고, 반영할 것이 생기면 기본 간격으로 되돌림
+        self._ui_loops = {
+            'log': {'func': self._drain_log, 'base': Config.GUI_LOG_DRAIN_INTERVAL_MS},
+            'events': {'func': self._apply_monitor_events, 'base': Config.GUI_REFRESH_DELAY_MS},
+        }
+        for loop in self._ui_loops.values():
+            loop['delay'] = loop['base']
+            loop['after_id'] = None
+        self.monitor.subscribe(self._on_monitor_event)
+        
+        # 설정 파일 (사용자 홈 디렉토리에 저장, URL 추가/제거는 변경분만 기록)
+        self.config_file = Config.CONFIG_FILE_PATH
+        self.config_store = ConfigStore(self.config_file)
         
         # GUI 구성
         self._create_widgets()
         self._load_config()
         
-        # 상태 업데이트 타이머
-        self._start_status_update()
+        # 초기 상태 표시
+        self._update_status_display()
         
         # 초기 로그 추가
         self._add_log("INFO", "상품 재고 모니터링 시스템이 시작되었습니다.")
         self._add_log("INFO", "모니터링할 URL을 추가하고 모니터링을 시작하세요.")
+        
+        # 로그 반영과 이벤트 반영 반복 시작 (반영할 것이 없으면 위젯을 건드리지 않고 간격을 늘림)
+        self._drain_log()
+        self._apply_monitor_events()
     
     def _create_widgets(self):
         """GUI 위젯들을 생성합니다."""
@@ -126,8 +150,15 @@ class StockMonitorGUI:
         # 모니터링 중인 URL 목록
         ttk.Label(url_frame, text="모니터링 중인 URL:").grid(row=3, column=0, sticky=tk.W, pady=(10, 5))
         
-        self.url_listbox = tk.Listbox(url_frame, height=4)
-        self.url_listbox.grid(row=4, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(0, 10))
+        # URL 일괄 가져오기/내보내기 (csv, json, 줄 단위 목록)
+        bulk_frame = ttk.Frame(url_frame)
+        bulk_frame.grid(row=3, column=1, columnspan=3, sticky=tk.E, pady=(10, 5))
+        ttk.Button(bulk_frame, text="URL 가져오기", command=self._import_urls).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(bulk_frame, text="URL 내보내기", command=self._export_urls).pack(side=tk.LEFT)
+        
+        # URL별 상태 표 (보이는 줄만 그리는 가상화 표)
+        self.status_table = StatusTable(url_frame, self._status_row, visible_rows=Config.GUI_STATUS_TABLE_ROWS)
+        self.status_table.grid(row=4, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(0, 10))
         
         # 그리드 가중치
         url_frame.columnconfigure(1, weight=1)
@@ -468,6 +499,10 @@ class StockMonitorGUI:
                                                 font=("Consolas", 9))
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # 로그 레벨에 따른 색상
+        self.log_text.tag_configure("WARNING", foreground="orange")
+        self.log_text.tag_configure("ERROR", foreground="red")
+        
         # 로그 제어 버튼들
         log_control_frame = ttk.Frame(log_frame)
         log_control_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -495,6 +530,7 @@ class StockMonitorGUI:
                                       values=["ALL", "INFO", "WARNING", "ERROR"], 
                                       state="readonly", width=10)
         log_level_combo.pack(side=tk.LEFT)
+        log_level_combo.bind("<<ComboboxSelected>>", lambda event: self._refresh_log())
         
         # 그리드 가중치
         log_frame.columnconfigure(0, weight=1)
@@ -575,13 +611,15 @@ class StockMonitorGUI:
         
         # URL 추가 시도
         if self.monitor.add_url(url, interval, receiver_email):
-            self.url_var.set("")  # 입력 필드 초기화
-            self._update_url_list()
+            self.url_var.set("")  # 입력 필드 초기화 (URL 표는 모니터 이벤트로 갱신)
             interval_text = self._format_interval(interval)
             self._add_log("INFO", f"URL 추가 성공: {url} (간격: {interval_text})")
             
-            # URL 추가 후 자동 저장
-            self._save_config()
+            # URL 추가 후 자동 저장 (추가한 URL만 기록)
+            if self.config_store.set_url(url, interval, receiver_email):
+                self._log_message("설정이 자동 저장되었습니다.")
+            else:
+                self._warn_config_not_saved()
             
             # 성공 메시지
             messagebox.showinfo("성공", f"URL이 추가되었습니다.\n\nURL: {url}\n체크 간격: {interval_text}")
@@ -591,30 +629,110 @@ class StockMonitorGUI:
     
     def _remove_url(self):
         """선택된 URL을 모니터링에서 제거합니다."""
-        selection = self.url_listbox.curselection()
-        if not selection:
+        url = self.status_table.selected_url
+        if not url:
             messagebox.showwarning("경고", "제거할 URL을 선택해주세요.")
             return
         
-        # 표시된 텍스트에서 실제 URL 추출
-        display_text = self.url_listbox.get(selection[0])
-        # "URL (간격: X)" 형태에서 URL 부분만 추출
-        url = display_text.split(" (간격:")[0].strip()
-        
         # URL 제거 확인
         confirm = messagebox.askyesno("확인", f"다음 URL을 모니터링에서 제거하시겠습니까?\n\n{url}")
         if not confirm:
             return
         
         if self.monitor.remove_url(url):
-            self._update_url_list()
             self._add_log("INFO", f"URL 제거됨: {url}")
             
-            # URL 제거 후 자동 저장
-            self._save_config()
+            # URL 제거 후 자동 저장 (제거한 URL만 기록)
+            if self.config_store.remove_url(url):
+                self._log_message("설정이 자동 저장되었습니다.")
+            else:
+                self._warn_config_not_saved()
         else:
             messagebox.showerror("오류", f"URL 제거에 실패했습니다: {url}")
     
+    def _import_urls(self):
+        """파일(csv/json/txt)에서 URL 목록을 일괄 가져옵니다. 검증과 상품명 조회는 백그라운드에서 실행합니다."""
+        receiver_email = self.receiver_email_var.get().strip()
+        if not receiver_email or not self._is_valid_email(receiver_email):
+            messagebox.showwarning("경고", "가져온 URL에 사용할 수신자 이메일을 먼저 입력해주세요.")
+            return
+        
+        from tkinter import filedialog
+        filename = filedialog.askopenfilename(
+            title="URL 가져오기",
+            filetypes=[("URL 목록", "*.csv *.json *.txt"), ("모든 파일", "*.*")]
+        )
+        if not filename:
+            return
+        
+        try:
+            with open(filename, 'r', encoding='utf-8-sig') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("오류", f"파일을 읽을 수 없습니다: {e}")
+            return
+        
+        probe = messagebox.askyesno(
+            "상품명 확인",
+            "추가할 URL을 한 번씩 조회하여 상품명을 미리 가져올까요?\n(URL이 많으면 시간이 걸립니다)"
+        )
+        
+        from url_import import detect_format
+        fmt = detect_format(text, filename)
+        interval = float(self.interval_var.get())
+        self._add_log("INFO", f"URL 가져오기 시작: {filename}")
+        
+        def run_import():
+            try:
+                summary = self.monitor.import_urls(text, interval, receiver_email, fmt=fmt, probe=probe)
+                error = None
+            except Exception as e:
+                summary = None
+                error = e
+            self._call_in_main_loop(lambda: self._finish_import(summary, error))
+        
+        threading.Thread(target=run_import, name='url-import', daemon=True).start()
+    
+    def _finish_import(self, summary, error):
+        """URL 가져오기 결과를 저장하고 요약을 한 번에 보여 줍니다."""
+        if error is not None:
+            self._add_log("ERROR", f"URL 가져오기 실패: {error}")
+            messagebox.showerror("오류", f"URL 가져오기에 실패했습니다: {error}")
+            return
+        
+        from url_import import format_import_summary
+        if summary['added']:
+            self._save_config()
+        self._add_log("INFO", f"URL 가져오기 완료: {summary['total']}개 중 {summary['added']}개 추가")
+        messagebox.showinfo("URL 가져오기 결과", format_import_summary(summary))
+    
+    def _export_urls(self):
+        """모니터링 중인 URL 설정을 파일로 내보냅니다 (형식은 확장자로 결정)."""
+        if not self.monitor.monitored_urls:
+            messagebox.showwarning("경고", "내보낼 URL이 없습니다.")
+            return
+        
+        from tkinter import filedialog
+        from url_import import SUPPORTED_FORMATS
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV 파일", "*.csv"), ("JSON 파일", "*.json"), ("텍스트 파일", "*.txt")],
+            title="URL 내보내기"
+        )
+        if not filename:
+            return
+        
+        fmt = filename.rsplit('.', 1)[-1].lower()
+        if fmt not in SUPPORTED_FORMATS:
+            fmt = 'csv'
+        try:
+            with open(filename, 'w', encoding='utf-8', newline='') as f:
+                f.write(self.monitor.export_urls(fmt))
+            self._add_log("INFO", f"URL {len(self.monitor.monitored_urls)}개를 {filename}에 내보냈습니다.")
+        except OSError as e:
+            self._add_log("ERROR", f"URL 내보내기 실패: {e}")
+            messagebox.showerror("오류", f"URL 내보내기에 실패했습니다: {e}")
+    
     def _start_monitoring(self):
         """모니터링을 시작합니다."""
         if not self.monitor.monitored_urls:
@@ -658,19 +776,23 @@ class StockMonitorGUI:
         # 수신자 이메일만 업데이트
         os.environ['DEFAULT_RECEIVER_EMAIL'] = self.receiver_email_var.get()
         
-        # EmailSender 인스턴스 재생성
+        # EmailSender 인스턴스 재생성 (기존 SMTP 연결은 정리)
+        self.email_sender.close()
         self.email_sender = EmailSender()
     
     def _update_url_list(self):
-        """URL 목록을 업데이트합니다."""
-        self.url_listbox.delete(0, tk.END)
-        for url, config in self.monitor.monitored_urls.items():
-            interval_text = self._format_interval(config['interval'])
-            display_text = f"{url} (간격: {interval_text})"
-            self.url_listbox.insert(tk.END, display_text)
+        """URL 상태 표를 업데이트합니다. 표시 값은 화면에 보이는 줄만 만들어 다시 그립니다."""
+        self.status_table.update_rows(list(self.monitor.monitored_urls))
         
         # URL 수 업데이트
-        self.url_count_label.config(text=f"모니터링 URL 수: {len(self.monitor.monitored_urls)}")
+        self.url_count_label.config(text=f"모니터링 URL 수: {len(self.status_table)}")
+    
+    def _status_row(self, url):
+        """URL 상태 표의 한 줄 값을 만듭니다 (표가 보이는 줄을 그릴 때만 호출)."""
+        config = self.monitor.monitored_urls.get(url)
+        if config is None:
+            return (url,)
+        return format_status_row(url, config, self.monitor.get_next_check_time(url))
     
     def _format_interval(self, interval):
         """체크 간격을 읽기 쉬운 형태로 포맷합니다."""
@@ -697,25 +819,69 @@ class StockMonitorGUI:
         except ValueError:
             return interval
     
-    def _start_status_update(self):
-        """상태 업데이트 타이머를 시작합니다."""
-        def update_status():
-            while True:
-                try:
-                    # UI 업데이트는 메인 스레드에서 실행
-                    self.root.after(0, self._update_status_display)
-                    
-                    # 모니터링 중일 때만 로그 업데이트 (5초마다)
-                    if hasattr(self, 'monitor') and getattr(self.monitor, 'is_monitoring', False):
-                        self.root.after(0, self._update_monitoring_log)
-                        time.sleep(5)  # 로그 부하 감소
-                    else:
-                        time.sleep(1)
-                except:
-                    break
-        
-        status_thread = threading.Thread(target=update_status, daemon=True)
-        status_thread.start()
+    def _on_monitor_event(self, event_type, url):
+        """모니터 이벤트를 기록합니다 (체크 스레드에서 호출되므로 Tk는 건드리지 않음).
+        
+        짧은 시간에 들어온 이벤트는 _apply_monitor_events()가 모아서 한 번만 다시 그립니다.
+        """
+        with self._ui_lock:
+            if event_type == CHECK_COMPLETED:
+                self._dirty_urls.add(url)
+            else:
+                self._full_refresh = True
+        self._wake_ui_loops()
+    
+    def _call_in_main_loop(self, func):
+        """다른 스레드에서 func를 메인 루프에서 실행하도록 넘깁니다."""
+        with self._ui_lock:
+            self._pending_calls.append(func)
+    
+    def _schedule(self, delay_ms, func):
+        """메인 루프에서 func를 예약하고 예약 ID를 반환합니다. 창이 닫혔으면 예약하지 않고 None을 반환합니다."""
+        try:
+            return self.root.after(delay_ms, func)
+        except (tk.TclError, RuntimeError):
+            return None
+    
+    def _schedule_loop(self, name, active):
+        """반복 작업의 다음 실행을 예약합니다. 이번에 반영한 것이 없으면 간격을 두 배로 늘립니다."""
+        loop = self._ui_loops[name]
+        loop['delay'] = loop['base'] if active else min(loop['delay'] * 2, Config.GUI_IDLE_POLL_MAX_MS)
+        loop['after_id'] = self._schedule(loop['delay'], loop['func'])
+    
+    def _wake_ui_loops(self):
+        """메인 루프에서 호출되면 늘어난 반복 간격을 기본 간격으로 되돌립니다 (다른 스레드는 다음 반복을 기다림)."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for loop in self._ui_loops.values():
+            if loop['after_id'] is None or loop['delay'] <= loop['base']:
+                continue
+            try:
+                self.root.after_cancel(loop['after_id'])
+            except tk.TclError:
+                continue
+            loop['delay'] = loop['base']
+            loop['after_id'] = self._schedule(loop['base'], loop['func'])
+    
+    def _apply_monitor_events(self):
+        """모아 둔 모니터 이벤트를 화면에 반영하고, 다른 스레드가 넘긴 작업을 예약한 뒤 다음 반영을 예약합니다."""
+        self._ui_loops['events']['after_id'] = None  # 실행 중에는 _wake_ui_loops가 다시 예약하지 않음
+        with self._ui_lock:
+            full_refresh, self._full_refresh = self._full_refresh, False
+            dirty_urls, self._dirty_urls = self._dirty_urls, set()
+            pending_calls, self._pending_calls = self._pending_calls, []
+        
+        try:
+            if full_refresh:
+                self._update_status_display()
+            else:
+                for url in dirty_urls:
+                    self.status_table.update_row(url)
+        finally:
+            # 넘겨받은 작업은 각각 따로 예약하여, 오류가 나거나 대화상자로 오래 걸려도 표 갱신 반복은 계속됨
+            for func in pending_calls:
+                self._schedule(0, func)
+            self._schedule_loop('events', full_refresh or bool(dirty_urls) or bool(pending_calls))
     
     def _update_status_display(self):
         """상태 표시를 업데이트합니다."""
@@ -731,23 +897,19 @@ class StockMonitorGUI:
                 self.start_btn.config(state="normal")
                 self.stop_btn.config(state="disabled")
             
-            self.url_count_label.config(text=f"모니터링 URL 수: {status['total_urls']}")
+            self._update_url_list()
             
         except:
             pass
     
     def _log_message(self, message):
         """로그 메시지를 추가합니다."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
+        self._add_log("INFO", message)
     
     def _clear_log(self):
         """로그를 지웁니다."""
         self.log_text.delete(1.0, tk.END)
+        self._log_seq = self.log_buffer.clear()
         self._add_log("INFO", "로그가 지워졌습니다.")
     
     def _save_log(self):
@@ -767,78 +929,80 @@ class StockMonitorGUI:
             self._add_log("ERROR", f"로그 저장 실패: {e}")
     
     def _add_log(self, level, message):
-        """로그를 추가합니다."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # 로그 레벨에 따른 색상 설정
-        level_colors = {
-            "INFO": "black",
-            "WARNING": "orange",
-            "ERROR": "red"
-        }
-        
-        # 현재 선택된 로그 레벨 확인
-        if self.log_level_var.get() != "ALL" and self.log_level_var.get() != level:
-            return
-        
-        # 로그 텍스트에 추가
-        log_entry = f"[{timestamp}] [{level}] {message}\n"
+        """로그를 추가합니다. 어느 스레드에서 호출해도 되며 로그 창에는 잠시 뒤 모아서 표시됩니다."""
+        self.log_buffer.append(level, message)
+        self._wake_ui_loops()
+    
+    def _drain_log(self):
+        """버퍼에 새로 쌓인 로그를 한 번에 로그 창에 반영하고 다음 반영을 예약합니다."""
+        self._ui_loops['log']['after_id'] = None  # 실행 중에는 _wake_ui_loops가 다시 예약하지 않음
+        previous_seq = self._log_seq
+        try:
+            entries, self._log_seq, skipped = self.log_buffer.read(self._log_seq, self.log_level_var.get())
+            if skipped:
+                self._insert_log_text([f"... 로그가 너무 많아 {skipped}줄을 생략했습니다.\n", "WARNING"])
+            if entries:
+                self._insert_log_entries(entries)
+        except tk.TclError:
+            pass  # 창이 닫힌 경우 (다음 예약도 _schedule에서 생략됨)
+        finally:
+            self._schedule_loop('log', self._log_seq != previous_seq)
+    
+    def _refresh_log(self):
+        """로그 레벨 필터가 바뀌면 버퍼에 남아 있는 로그로 로그 창을 다시 그립니다."""
+        self.log_text.delete(1.0, tk.END)
+        entries, self._log_seq, _ = self.log_buffer.read(0, self.log_level_var.get())
+        if entries:
+            self._insert_log_entries(entries)
+    
+    def _insert_log_entries(self, entries):
+        """로그 목록을 같은 레벨끼리 묶어 한 번의 insert로 추가합니다."""
+        chunks = []
+        lines = []
+        level = None
+        for entry in entries:
+            if entry.level != level and lines:
+                chunks += ["".join(lines), level]
+                lines = []
+            level = entry.level
+            lines.append(entry.format())
+        chunks += ["".join(lines), level]
+        self._insert_log_text(chunks)
+    
+    def _insert_log_text(self, chunks):
+        """(텍스트, 태그) 목록을 로그 창 끝에 추가하고 오래된 줄을 정리합니다."""
+        self.log_text.insert(tk.END, *chunks)
         
-        # 로그 레벨에 따른 색상 적용
-        self.log_text.insert(tk.END, log_entry)
+        # 로그가 너무 많으면 오래된 것 삭제 (반영할 때마다 한 번만 계산)
+        lines = int(self.log_text.index('end-1c').split('.')[0])
+        if lines > Config.GUI_LOG_MAX_LINES:
+            self.log_text.delete(1.0, f"{lines - Config.GUI_LOG_MAX_LINES}.0")
         
         # 자동 스크롤
         if self.auto_scroll_var.get():
             self.log_text.see(tk.END)
-        
-        # 로그가 너무 많으면 오래된 것 삭제 (최대 1000줄)
-        lines = int(self.log_text.index('end-1c').split('.')[0])
-        if lines > 1000:
-            self.log_text.delete(1.0, f"{lines-1000}.0")
-    
-    def _update_monitoring_log(self):
-        """모니터링 상태를 로그로 업데이트합니다."""
-        if hasattr(self, 'monitor') and self.monitor.is_monitoring:
-            # 현재 모니터링 중인 URL 수
-            url_count = len(self.monitor.monitored_urls)
-            # 마지막 체크 시간
-            last_check = getattr(self.monitor, 'last_check_time', '알 수 없음')
-            if last_check != '알 수 없음':
-                last_check = last_check.strftime("%H:%M:%S")
-            
-            self._add_log("INFO", f"모니터링 중: {url_count}개 URL, 마지막 체크: {last_check}")
-            
-            # 다음 체크까지 남은 시간
-            if hasattr(self.monitor, 'next_check_time'):
-                next_check = self.monitor.next_check_time
-                if next_check:
-                    remaining = (next_check - datetime.datetime.now()).total_seconds()
-                    if remaining > 0:
-                        self._add_log("INFO", f"다음 체크까지 {int(remaining)}초 남음")
+    
+    def _warn_config_not_saved(self):
+        """변경 내용을 설정 파일에 기록하지 못했음을 알립니다."""
+        self._add_log("WARNING", f"설정 변경을 기록하지 못했습니다: {self.config_file}")
+        messagebox.showwarning(
+            "경고",
+            f"설정 파일을 읽거나 쓸 수 없어 변경 내용을 저장하지 못했습니다.\n{self.config_file}\n\n"
+            "설정 저장 시 지금 목록으로 새로 저장하며, 읽을 수 없는 기존 파일은 백업해 둡니다."
+        )
     
     def _save_config(self):
-        """설정을 파일에 저장합니다."""
-        config_data = {
-            'receiver_email': self.receiver_email_var.get(),
-            'monitored_urls': self.monitor.monitored_urls
-        }
-        
-        try:
-            # 설정 파일이 저장될 디렉토리 생성
-            config_dir = os.path.dirname(self.config_file)
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
-            
+        """설정 전체를 파일에 저장합니다 (체크 결과 같은 실행 상태는 저장하지 않음)."""
+        previous_backup = self.config_store.backup_path
+        if self.config_store.save(self.receiver_email_var.get(), dict(self.monitor.monitored_urls)):
             # 자동 저장 시에는 팝업을 표시하지 않음 (로그만 기록)
             self._log_message("설정이 자동 저장되었습니다.")
-            
-        except Exception as e:
-            self._log_message(f"설정 저장 실패: {e}")
-            messagebox.showerror("오류", f"설정 저장에 실패했습니다: {e}")
+            if self.config_store.backup_path != previous_backup:
+                self._add_log("WARNING", f"읽을 수 없던 기존 설정 파일을 백업했습니다: {self.config_store.backup_path}")
+                messagebox.showwarning("경고", f"읽을 수 없던 기존 설정 파일을 백업한 뒤 새로 저장했습니다.\n\n백업: {self.config_store.backup_path}")
+        else:
+            self._log_message("설정 저장 실패")
+            messagebox.showerror("오류", f"설정 저장에 실패했습니다: {self.config_file}")
     
     def _manual_save_config(self):
         """수동으로 설정을 저장합니다."""
@@ -850,12 +1014,18 @@ class StockMonitorGUI:
     
     def _load_config(self):
         """설정을 파일에서 불러옵니다."""
-        if not os.path.exists(self.config_file):
+        if not self.config_store.exists():
             return
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = self.config_store.load()
+            if config_data is None:
+                messagebox.showerror(
+                    "오류",
+                    f"설정 파일을 읽을 수 없습니다: {self.config_file}\n\n"
+                    "설정을 저장하면 기존 파일을 백업한 뒤 지금 목록으로 새로 저장합니다."
+                )
+                return
             
             # 수신자 이메일만 불러오기
             self.receiver_email_var.set(config_data.get('receiver_email', Config.DEFAULT_RECEIVER_EMAIL))
@@ -865,7 +1035,6 @@ class StockMonitorGUI:
             for url, config in monitored_urls.items():
                 self.monitor.add_url(url, config['interval'], config['receiver_email'])
             
-            self._update_url_list()
             self._log_message("설정을 불러왔습니다.")
             
         except Exception as e:
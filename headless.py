@@ -0,0 +1,141 @@
+"""
+GUI 없이 StockMonitor를 실행하는 데몬 모드
+
+설정 파일은 GUI가 저장하는 StockMonitor_config.json과 같은 형식입니다 (같은 위치의 .journal 변경 기록도 반영).
+    {
+        "receiver_email": "기본 수신자 이메일",
+        "monitored_urls": {"URL": {"interval": 분, "receiver_email": "수신자 이메일"}}
+    }
+
+SIGTERM/SIGINT를 받으면 진행 중인 체크를 정리하고 종료하며,
+SIGHUP을 받으면 설정 파일을 다시 읽어 URL 목록을 재시작 없이 반영합니다.
+tkinter, Selenium, webdriver_manager는 불러오지 않습니다 (Selenium은 옵션 체크에 필요할 때만 로드).
+"""
+
+import logging
+import signal
+import threading
+from config import Config
+from config_store import ConfigStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = Config.CONFIG_FILE_PATH
+LOG_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+
+class HeadlessRunner:
+    """설정 파일의 URL 목록으로 StockMonitor를 실행하고 시그널로 종료/재적재합니다."""
+
+    def __init__(self, config_path=None):
+        self.config_path = config_path or DEFAULT_CONFIG_PATH
+        self.monitor = None
+        self._stop_event = threading.Event()
+        self._reload_requested = threading.Event()
+
+    def run(self):
+        """모니터링을 시작하고 종료 시그널을 받을 때까지 대기합니다. 종료 코드를 반환합니다."""
+        config_data = self._load_config()
+        if config_data is None:
+            return 1
+
+        from monitor import StockMonitor
+        self.monitor = StockMonitor()
+        self._apply_config(config_data)
+        if not self.monitor.monitored_urls:
+            logger.warning(f"모니터링할 URL이 없습니다. 설정 파일에 URL을 추가한 뒤 SIGHUP으로 다시 불러오세요: {self.config_path}")
+
+        self._install_signal_handlers()
+        self.monitor.start_monitoring()
+
+        try:
+            while not self._stop_event.wait(1):
+                if self._reload_requested.is_set():
+                    self._reload_requested.clear()
+                    self.reload()
+        finally:
+            logger.info("데몬을 종료합니다...")
+            self.monitor.stop_monitoring()
+            for store in (self.monitor.state_store, self.monitor.history):
+                if store is not None:
+                    store.close()
+        return 0
+
+    def stop(self):
+        """실행 루프를 종료합니다."""
+        self._stop_event.set()
+
+    def reload(self):
+        """설정 파일을 다시 읽어 URL 목록 변경 사항을 반영합니다."""
+        config_data = self._load_config()
+        if config_data is None:
+            logger.error("설정을 다시 불러오지 못해 기존 설정을 유지합니다.")
+            return
+        self._apply_config(config_data)
+
+    def _load_config(self):
+        """설정 파일(과 GUI가 남긴 변경 기록)을 읽습니다. 실패하면 None을 반환합니다.
+
+        GUI가 같은 파일에 기록 중일 수 있으므로 읽기만 하고 정리(다시 쓰기)는 하지 않습니다.
+        """
+        store = ConfigStore(self.config_path, read_only=True)
+        if not store.exists():
+            logger.error(f"설정 파일을 찾을 수 없습니다: {self.config_path}")
+            return None
+        return store.load()
+
+    def _apply_config(self, config_data):
+        """설정의 URL 목록과 현재 모니터링 목록을 비교하여 추가/변경/제거합니다."""
+        from url_import import parse_interval
+
+        default_email = config_data.get('receiver_email', '')
+        wanted = {}
+        skipped = set()  # 체크 간격이 잘못되어 적용하지 않은 URL (이미 모니터링 중이면 기존 설정 유지)
+        for url, url_config in config_data.get('monitored_urls', {}).items():
+            try:
+                interval = parse_interval(url_config.get('interval', 5))
+                if interval is None:
+                    raise ValueError("값이 비어 있습니다")
+            except (AttributeError, ValueError) as e:
+                logger.error(f"잘못된 체크 간격으로 URL을 건너뜁니다: {url}, 오류: {e}")
+                skipped.add(url)
+                continue
+            wanted[url] = (interval, url_config.get('receiver_email') or default_email)
+
+        removed = [url for url in self.monitor.monitored_urls if url not in wanted and url not in skipped]
+        for url in removed:
+            self.monitor.remove_url(url)
+
+        added = 0
+        updated = 0
+        for url, (interval, receiver_email) in wanted.items():
+            current = self.monitor.monitored_urls.get(url)
+            if current and current['interval'] == interval and current['receiver_email'] == receiver_email:
+                continue
+            if self.monitor.add_url(url, interval, receiver_email):
+                if current:
+                    updated += 1
+                else:
+                    added += 1
+
+        logger.info(f"설정 적용: {len(wanted)}개 URL (추가 {added}, 변경 {updated}, 제거 {len(removed)}, 건너뜀 {len(skipped)})")
+
+    def _install_signal_handlers(self):
+        """종료/재적재 시그널 처리기를 등록합니다 (처리기는 플래그만 설정)."""
+        def handle_stop(signum, frame):
+            logger.info(f"종료 시그널 수신: {signal.Signals(signum).name}")
+            self._stop_event.set()
+
+        def handle_reload(signum, frame):
+            logger.info("SIGHUP 수신: 설정을 다시 불러옵니다.")
+            self._reload_requested.set()
+
+        signal.signal(signal.SIGTERM, handle_stop)
+        signal.signal(signal.SIGINT, handle_stop)
+        if hasattr(signal, 'SIGHUP'):  # Windows에는 SIGHUP이 없음
+            signal.signal(signal.SIGHUP, handle_reload)
+
+def run_daemon(config_path=None, log_level='INFO'):
+    """데몬 모드로 실행하고 종료 코드를 반환합니다."""
+    # 모듈을 불러오기 전에 시각이 포함된 로그 형식을 먼저 설정
+    logging.basicConfig(level=getattr(logging, log_level.upper(), logging.INFO), format=LOG_FORMAT)
+    return HeadlessRunner(config_path).run()
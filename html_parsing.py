@@ -0,0 +1,115 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 상품명 추출에 사용하는 태그 (StockChecker._extract_product_name 참고)
+PRODUCT_NAME_TAGS = ('h1', 'title')
+
+# 사이트 설정에서 파싱 대상 요소를 찾을 선택자 키
+TARGET_SELECTOR_KEYS = ('option1_selector', 'option2_selector', 'stock_check_selector')
+
+# "tag#id.class1.class2" 형태의 단순 선택자
+SIMPLE_SELECTOR_PATTERN = re.compile(r'^([a-zA-Z][\w-]*)?(?:#([\w-]+))?((?:\.[\w-]+)*)$')
+
+_resolved_parsers = {}
+_strainer_cache = {}
+
+def resolve_html_parser(preferred=None):
+    """사용할 BeautifulSoup 파서 이름을 반환합니다. lxml이 없으면 html.parser로 대체합니다."""
+    preferred = preferred or Config.HTML_PARSER
+    if preferred not in _resolved_parsers:
+        parser = preferred
+        if preferred == 'lxml':
+            try:
+                import lxml  # noqa: F401
+            except ImportError:
+                logger.warning("lxml이 설치되지 않아 html.parser를 사용합니다.")
+                parser = 'html.parser'
+        _resolved_parsers[preferred] = parser
+    return _resolved_parsers[preferred]
+
+def make_soup(content, website_config=None, parser=None):
+    """HTML을 파싱합니다. 타겟 파싱이 켜져 있으면 사이트 선택자에 해당하는 요소만 만듭니다."""
+    parser = resolve_html_parser(parser)
+    strainer = build_strainer(website_config) if website_config and Config.TARGETED_PARSING else None
+    if strainer is None:
+        return BeautifulSoup(content, parser)
+    return BeautifulSoup(content, parser, parse_only=strainer)
+
+def build_strainer(website_config):
+    """사이트 설정의 선택자에서 파싱할 최상위 요소 규칙을 만들어 SoupStrainer로 반환합니다.
+
+    선택자의 첫 단계(예: '.detail04 select option' → '.detail04')와 일치하는 요소는
+    하위 요소까지 모두 파싱됩니다. 해석할 수 없는 선택자가 있으면 None을 반환하여 전체 파싱합니다.
+    """
+    cache_key = tuple(website_config.get(key) for key in TARGET_SELECTOR_KEYS)
+    if cache_key in _strainer_cache:
+        return _strainer_cache[cache_key]
+
+    rules = [(tag, None, ()) for tag in PRODUCT_NAME_TAGS]
+    strainer = None
+    try:
+        for key in TARGET_SELECTOR_KEYS:
+            selector = website_config.get(key)
+            if not selector:
+                continue
+            for part in selector.split(','):
+                rules.append(_parse_simple_selector(part.split()[0]))
+        strainer = TargetedStrainer(rules)
+    except ValueError as e:
+        logger.warning(f"타겟 파싱을 사용할 수 없어 전체 페이지를 파싱합니다: {e}")
+
+    _strainer_cache[cache_key] = strainer
+    return strainer
+
+def _parse_simple_selector(selector):
+    """'tag#id.class' 형태의 선택자를 (tag, id, classes) 규칙으로 변환합니다."""
+    match = SIMPLE_SELECTOR_PATTERN.match(selector.strip())
+    if not match or not any(match.groups()):
+        raise ValueError(f"지원하지 않는 선택자: {selector}")
+
+    tag, element_id, classes = match.groups()
+    class_names = tuple(name for name in classes.split('.') if name)
+    return (tag.lower() if tag else None, element_id, class_names)
+
+class TargetedStrainer(SoupStrainer):
+    """(tag, id, classes) 규칙 중 하나라도 맞는 요소만 생성하는 SoupStrainer입니다.
+
+    beautifulsoup4 4.12(search_tag)와 4.13 이상(allow_tag_creation)의 파싱 훅을 모두 지원합니다.
+    """
+
+    def __init__(self, rules):
+        super().__init__()
+        self.rules = rules
+
+    def allows(self, name, attrs):
+        attrs = attrs or {}
+        for tag, element_id, class_names in self.rules:
+            if tag and tag != name:
+                continue
+            if element_id and attrs.get('id') != element_id:
+                continue
+            if class_names:
+                element_classes = attrs.get('class') or ''
+                if isinstance(element_classes, str):
+                    element_classes = element_classes.split()
+                if not all(class_name in element_classes for class_name in class_names):
+                    continue
+            return True
+        return False
+
+    # beautifulsoup4 4.13 이상
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.allows(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # beautifulsoup4 4.12
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if isinstance(markup_name, str):
+            return self.allows(markup_name, markup_attrs)
+        return super().search_tag(markup_name, markup_attrs)
@@ -0,0 +1,69 @@
+import itertools
+import threading
+from collections import deque
+from datetime import datetime
+
+class LogEntry:
+    """로그 한 줄입니다. seq는 버퍼에 들어온 순서대로 1부터 증가합니다."""
+
+    __slots__ = ('seq', 'timestamp', 'level', 'message')
+
+    def __init__(self, seq, timestamp, level, message):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.level = level
+        self.message = message
+
+    def format(self):
+        return f"[{self.timestamp}] [{self.level}] {self.message}\n"
+
+class LogBuffer:
+    """여러 스레드가 로그를 쌓고 GUI 메인 루프가 주기적으로 한꺼번에 가져가는 링 버퍼입니다.
+
+    append()는 잠금 안에서 deque에 추가만 하므로 체크 스레드에서 바로 호출해도 Tk를 건드리지 않습니다.
+    최근 capacity줄만 보관하고, 읽는 쪽은 마지막으로 읽은 seq 이후의 로그만 가져갑니다.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self._entries = deque(maxlen=capacity)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def append(self, level, message):
+        """로그를 추가합니다. StockMonitor.log_callback으로 그대로 사용할 수 있습니다."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self._seq += 1
+            self._entries.append(LogEntry(self._seq, timestamp, level, message))
+
+    def read(self, after_seq=0, level=None):
+        """after_seq 이후에 들어온 로그를 가져옵니다.
+
+        Args:
+            after_seq: 마지막으로 읽은 seq (0이면 보관 중인 로그 전체)
+            level: 이 레벨의 로그만 반환 (None 또는 "ALL"이면 전체)
+
+        Returns:
+            tuple: (로그 목록, 마지막 seq, 읽기 전에 버퍼에서 밀려나 놓친 로그 수)
+        """
+        with self._lock:
+            last_seq = self._seq
+            if last_seq == after_seq:
+                return [], last_seq, 0
+            oldest_seq = self._entries[0].seq if self._entries else last_seq + 1
+            skipped = max(oldest_seq - after_seq - 1, 0)
+            # 새 로그는 deque 뒤쪽에 있으므로 필요한 개수만 잘라 복사
+            new_count = min(last_seq - after_seq, len(self._entries))
+            entries = list(itertools.islice(reversed(self._entries), new_count))
+        entries.reverse()
+
+        if level and level != "ALL":
+            entries = [entry for entry in entries if entry.level == level]
+        return entries, last_seq, skipped
+
+    def clear(self):
+        """보관 중인 로그를 비우고 마지막 seq를 반환합니다 (seq는 이어서 증가)."""
+        with self._lock:
+            self._entries.clear()
+            return self._seq
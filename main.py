@@ -3,16 +3,45 @@
 """
 상품 재고 모니터링 시스템
 도매 웹사이트의 상품 품절 상태를 체크하고 알림을 발송하는 프로그램
+
+사용 예:
+    python main.py                                  # GUI 실행
+    python main.py --daemon                         # GUI 없이 실행 (~/StockMonitor_config.json 사용)
+    python main.py --daemon --config monitor.json   # 지정한 설정 파일로 GUI 없이 실행
+    python main.py --profile-startup                # 시작 시 모듈 불러오기 시간 측정
 """
 
+import argparse
 import sys
 import os
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def parse_args(argv=None):
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description='상품 재고 모니터링 시스템')
+    parser.add_argument('--daemon', action='store_true', help='GUI 없이 백그라운드 모드로 실행')
+    parser.add_argument('--config', help='데몬 모드 설정 파일 경로 (기본값: ~/StockMonitor_config.json)')
+    parser.add_argument('--log-level', default='INFO', help='데몬 모드 로그 레벨 (DEBUG, INFO, WARNING, ERROR)')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='실행하지 않고 시작 시 모듈 불러오기 시간을 측정하여 출력 (--daemon과 함께 쓰면 데몬 경로 측정)')
+    return parser.parse_args(argv)
+
 def main():
     """메인 함수"""
+    args = parse_args()
+
+    if args.profile_startup:
+        # 다른 모듈을 불러오기 전에 측정해야 하므로 가장 먼저 처리
+        from startup_profile import profile_startup
+        sys.exit(profile_startup('daemon' if args.daemon else 'gui'))
+
+    if args.daemon:
+        # GUI(tkinter)를 불러오지 않고 모니터만 실행
+        from headless import run_daemon
+        sys.exit(run_daemon(args.config, args.log_level))
+
     try:
         from gui import main as gui_main
         print("상품 재고 모니터링 시스템을 시작합니다...")
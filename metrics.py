@@ -0,0 +1,160 @@
+import threading
+import time
+from contextlib import contextmanager
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 단계별 소요 시간 히스토그램 이름과 버킷 (초)
+STAGE_METRIC = 'stock_check_stage_seconds'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+class MetricsSink:
+    """메트릭 수집 인터페이스입니다. 기본 구현은 아무것도 기록하지 않습니다.
+
+    다른 모니터링 시스템으로 보내려면 observe()와 increment()를 구현한 하위 클래스를
+    StockMonitor(metrics=...)에 전달합니다.
+    """
+
+    def observe(self, name, value, labels=None):
+        """히스토그램에 값을 기록합니다."""
+
+    def increment(self, name, value=1, labels=None):
+        """카운터를 증가시킵니다."""
+
+    @contextmanager
+    def timer(self, stage):
+        """블록 실행 시간을 단계별 히스토그램에 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(STAGE_METRIC, time.perf_counter() - start, {'stage': stage})
+
+class InMemoryMetrics(MetricsSink):
+    """카운터와 히스토그램을 메모리에 모으고 Prometheus 텍스트 형식으로 출력합니다."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}  # (이름, 레이블) -> 값
+        self._histograms = {}  # (이름, 레이블) -> [버킷별 개수, 합계, 개수]
+
+    def observe(self, name, value, labels=None):
+        key = (name, self._label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = [[0] * len(self.buckets), 0.0, 0]
+                self._histograms[key] = histogram
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[0][index] += 1
+                    break
+            histogram[1] += value
+            histogram[2] += 1
+
+    def increment(self, name, value=1, labels=None):
+        key = (name, self._label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self):
+        """현재 카운터와 히스토그램(합계, 개수)을 딕셔너리로 반환합니다."""
+        with self._lock:
+            return {
+                'counters': {self._format_name(name, labels): value for (name, labels), value in self._counters.items()},
+                'histograms': {
+                    self._format_name(name, labels): {'sum': histogram[1], 'count': histogram[2]}
+                    for (name, labels), histogram in self._histograms.items()
+                }
+            }
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 노출 형식으로 메트릭을 출력합니다."""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, (list(value[0]), value[1], value[2])) for key, value in self._histograms.items())
+
+        typed = set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{self._format_name(name, labels)} {value}")
+
+        for (name, labels), (bucket_counts, total, count) in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f"{self._format_name(name + '_bucket', labels + (('le', repr(float(bound))),))} {cumulative}")
+            lines.append(f"{self._format_name(name + '_bucket', labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{self._format_name(name + '_sum', labels)} {total}")
+            lines.append(f"{self._format_name(name + '_count', labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def _label_key(self, labels):
+        return tuple(sorted((labels or {}).items()))
+
+    def _escape_label(self, value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def _format_name(self, name, labels):
+        if not labels:
+            return name
+        label_text = ",".join(f'{key}="{self._escape_label(value)}"' for key, value in labels)
+        return f"{name}{{{label_text}}}"
+
+class MetricsServer:
+    """InMemoryMetrics를 /metrics 경로로 노출하는 로컬 HTTP 서버입니다."""
+
+    def __init__(self, registry, host=None, port=None):
+        self.registry = registry
+        self.host = host or Config.METRICS_HOST
+        self.port = Config.METRICS_PORT if port is None else port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        if self._server:
+            return
+
+        import http.server
+        registry = self.registry
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = registry.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = http.server.ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True)
+        self._thread.start()
+        logger.info(f"메트릭 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+
+    def stop(self):
+        """서버를 종료합니다."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
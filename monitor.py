@@ -1,24 +1,87 @@
-import schedule
-import time
+import random
 import threading
+import time
 from datetime import datetime
+from urllib.parse import urlparse
 from stock_checker import StockChecker
 from email_sender import EmailSender
+from notification_queue import NotificationDispatcher
+from digest import DigestAggregator
+from stock_events import compute_stock_events
+from state_store import StockStateStore
+from stock_history import StockHistory
+from check_executor import CheckExecutor
+from scheduler import CheckScheduler
+from metrics import InMemoryMetrics, MetricsServer
 from config import Config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# subscribe()로 받는 모니터 이벤트 유형
+MONITOR_STARTED = 'started'
+MONITOR_STOPPED = 'stopped'
+URL_ADDED = 'url_added'
+URL_REMOVED = 'url_removed'
+CHECK_COMPLETED = 'check_completed'
+
 class StockMonitor:
-    def __init__(self):
-        self.stock_checker = StockChecker()
+    def __init__(self, metrics=None):
+        self.metrics = metrics or InMemoryMetrics()  # 단계별 소요 시간/카운터 (교체 가능한 메트릭 싱크)
+        self.metrics_server = None  # Config.METRICS_ENABLED일 때 Prometheus 엔드포인트
+        self.state_store = self._open_state_store()  # 재시작 후에도 유지되는 URL별 이전 재고 상태
+        self.stock_checker = StockChecker(metrics=self.metrics, previous_states=self.state_store)
+        self.history = self._open_history()  # 옵션별 재고 변화 이력 (변화가 있을 때만 기록)
         self.email_sender = EmailSender()
+        # 알림 발송은 백그라운드 큐에서 처리 (체크 스레드는 큐에 넣기만 함)
+        self.notifier = NotificationDispatcher(
+            self.email_sender, metrics=self.metrics, on_result=self._on_notification_result
+        )
+        # 요약 모드에서 수신자별 변동 알림을 모아 한 통으로 발송
+        self.digest = DigestAggregator(self._enqueue_notification)
         self.monitored_urls = {}  # {url: {'interval': minutes, 'receiver_email': email}}
         self.is_running = False
-        self.monitor_thread = None
+        self.scheduler = CheckScheduler(self._dispatch_check)  # URL별 체크 시각 관리 (힙 기반)
+        self.check_executor = None  # 동시 URL 체크 워커 풀 (모니터링 중에만 존재)
         self.last_check_time = None
-        self.next_check_time = None
         self.log_callback = None  # GUI에서 로그를 받을 콜백 함수
+        self._listeners = []  # 상태 변화 이벤트를 받을 함수 목록 (subscribe 참고)
+        self._listeners_lock = threading.Lock()
+    
+    def subscribe(self, listener):
+        """상태 변화 이벤트를 받을 함수를 등록합니다.
+        
+        listener(event_type, url)은 이벤트가 발생한 스레드(체크 워커 등)에서 호출되므로
+        GUI는 받은 이벤트를 메인 루프로 넘겨 처리해야 합니다. url은 URL 관련 이벤트가 아니면 None입니다.
+        """
+        with self._listeners_lock:
+            self._listeners.append(listener)
+        return listener
+    
+    def unsubscribe(self, listener):
+        """등록한 이벤트 함수를 해제합니다."""
+        with self._listeners_lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+    
+    def _publish(self, event_type, url=None):
+        """등록된 함수들에 상태 변화 이벤트를 전달합니다."""
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event_type, url)
+            except Exception as e:
+                logger.error(f"모니터 이벤트 처리 중 오류 발생: {event_type}, 오류: {e}")
+    
+    @property
+    def next_check_time(self):
+        """모니터링 중인 URL 중 가장 빠른 다음 체크 시각입니다."""
+        return self.scheduler.next_check_time()
+    
+    def get_next_check_time(self, url):
+        """특정 URL의 다음 체크 시각을 반환합니다."""
+        return self.scheduler.next_check_time(url)
     
     def add_url(self, url, interval_minutes, receiver_email):
         """모니터링할 URL을 추가합니다."""
@@ -26,12 +89,22 @@ class StockMonitor:
             logger.error(f"유효하지 않은 URL: {url}")
             return False
         
-        self.monitored_urls[url] = {
-            'interval': interval_minutes,
-            'receiver_email': receiver_email,
-            'last_check': None,
-            'status': None
-        }
+        # 0 이하/nan 같은 간격은 스케줄러를 멈추게 하므로 추가하지 않음
+        from url_import import parse_interval
+        try:
+            interval_minutes = parse_interval(interval_minutes)
+        except ValueError as e:
+            interval_minutes = None
+            logger.error(f"유효하지 않은 체크 간격: {url}, 오류: {e}")
+        if interval_minutes is None:
+            return False
+        
+        self.monitored_urls[url] = self._new_url_entry(interval_minutes, receiver_email)
+        
+        # 모니터링 중이면 재시작 없이 바로 스케줄에 반영 (첫 체크 시각은 간격 안에서 무작위)
+        if self.is_running:
+            interval_seconds = interval_minutes * 60
+            self.scheduler.add(url, interval_seconds, random.uniform(0, interval_seconds))
         
         logger.info(f"URL 추가됨: {url} (간격: {interval_minutes}분)")
         
@@ -39,18 +112,138 @@ class StockMonitor:
         if self.log_callback:
             self.log_callback("INFO", f"URL 추가됨: {url} (간격: {interval_minutes}분)")
         
+        self._publish(URL_ADDED, url)
         return True
     
+    def add_urls(self, entries, product_names=None):
+        """검증을 마친 여러 URL을 한 번에 추가합니다. 로그와 이벤트는 URL마다가 아니라 한 번만 남깁니다.
+        
+        Args:
+            entries: (url, interval_minutes, receiver_email) 목록
+            product_names: 미리 조회한 상품명 {url: 상품명} (체크 전 상태 표시에 사용)
+            
+        Returns:
+            int: 추가(또는 설정 변경)된 URL 수
+        """
+        product_names = product_names or {}
+        scheduled = []
+        for url, interval_minutes, receiver_email in entries:
+            entry = self._new_url_entry(interval_minutes, receiver_email)
+            if product_names.get(url):
+                entry['product_name'] = product_names[url]
+            self.monitored_urls[url] = entry
+            scheduled.append((url, interval_minutes * 60))
+        
+        if not scheduled:
+            return 0
+        
+        # 모니터링 중이면 첫 체크 시각을 각자의 간격 안에 고르게 분산
+        if self.is_running:
+            self.scheduler.add_staggered(scheduled)
+        
+        logger.info(f"URL {len(scheduled)}개 일괄 추가됨")
+        if self.log_callback:
+            self.log_callback("INFO", f"URL {len(scheduled)}개 일괄 추가됨")
+        
+        self._publish(URL_ADDED)
+        return len(scheduled)
+    
+    def import_urls(self, text, interval_minutes, receiver_email, fmt=None, probe=False):
+        """URL 목록(csv/json/txt, 형식은 url_import.py 참고)을 검증하여 한 번에 추가하고 결과 요약을 반환합니다.
+        
+        형식이 잘못되었거나 지원하지 않는 웹사이트의 URL, 형식이 잘못된 항목별 수신자 이메일,
+        파일 안의 중복과 이미 모니터링 중인 URL은 건너뜁니다.
+        
+        Args:
+            text: URL 목록 텍스트
+            interval_minutes: 항목에 체크 간격이 없을 때 사용할 간격 (분)
+            receiver_email: 항목에 수신자가 없을 때 사용할 수신자 이메일
+            fmt: 'csv', 'json', 'txt' (생략 시 내용으로 추정)
+            probe: True이면 추가할 URL을 동시에 한 번씩 조회하여 상품명을 미리 가져옴
+            
+        Returns:
+            dict: 항목 수 요약 (url_import.format_import_summary()로 표시)
+        """
+        from url_import import detect_format, is_valid_email, parse_url_list, position_label, probe_product_names
+        
+        fmt = fmt or detect_format(text)
+        entries, errors = parse_url_list(text, fmt)
+        summary = {
+            'total': len(entries) + len(errors),
+            'added': 0,
+            'already_monitored': 0,
+            'duplicates': 0,
+            'invalid': len(errors),
+            'unsupported': 0,
+            'probed': 0,
+            'probe_failed': 0,
+            'errors': list(errors),
+            'position_label': position_label(fmt)  # 오류 위치 번호의 단위 (줄 또는 json 항목)
+        }
+        
+        websites = {}  # 도메인 -> (website_name, website_config) (웹사이트 감지는 도메인만 보므로 도메인당 한 번)
+        seen = set()
+        accepted = []
+        for entry in entries:
+            url = entry['url']
+            if not url or not self._validate_url(url):
+                summary['invalid'] += 1
+                summary['errors'].append((entry['line'], f"유효하지 않은 URL: {url}"))
+                continue
+            if entry['receiver_email'] is not None and not is_valid_email(entry['receiver_email']):
+                summary['invalid'] += 1
+                summary['errors'].append((entry['line'], f"유효하지 않은 수신자 이메일: {entry['receiver_email']}"))
+                continue
+            if url in seen:
+                summary['duplicates'] += 1
+                continue
+            seen.add(url)
+            if url in self.monitored_urls:
+                summary['already_monitored'] += 1
+                continue
+            
+            domain = urlparse(url).netloc.lower()
+            if domain not in websites:
+                websites[domain] = self.stock_checker.detect_website(url)
+            if not websites[domain][0]:
+                summary['unsupported'] += 1
+                summary['errors'].append((entry['line'], f"지원하지 않는 웹사이트: {domain}"))
+                continue
+            
+            accepted.append((url, entry['interval'] or interval_minutes, entry['receiver_email'] or receiver_email))
+        
+        product_names = {}
+        if probe and accepted:
+            def fetch_name(url):
+                website_name, website_config = websites[urlparse(url).netloc.lower()]
+                return self.stock_checker.fetch_product_name(url, website_name, website_config)
+            
+            product_names = probe_product_names(fetch_name, [url for url, _, _ in accepted])
+            summary['probed'] = len(product_names)
+            summary['probe_failed'] = sum(1 for name in product_names.values() if not name)
+        
+        summary['added'] = self.add_urls(accepted, product_names)
+        logger.info(f"URL 가져오기 완료: {summary['total']}개 중 {summary['added']}개 추가")
+        return summary
+    
+    def export_urls(self, fmt='csv'):
+        """모니터링 중인 URL 설정을 csv/json/txt 텍스트로 반환합니다."""
+        from url_import import export_url_list
+        return export_url_list(dict(self.monitored_urls), fmt)
+    
     def remove_url(self, url):
         """모니터링에서 URL을 제거합니다."""
         if url in self.monitored_urls:
             del self.monitored_urls[url]
+            self.scheduler.remove(url)
+            self.stock_checker.previous_states.pop(url, None)
             logger.info(f"URL 제거됨: {url}")
             
             # GUI 로그 콜백 호출
             if self.log_callback:
                 self.log_callback("INFO", f"URL 제거됨: {url}")
             
+            self._publish(URL_REMOVED, url)
             return True
         return False
     
@@ -62,14 +255,28 @@ class StockMonitor:
         
         self.is_running = True
         
-        # 각 URL에 대해 스케줄 설정
-        for url, config in self.monitored_urls.items():
-            interval = config['interval']
-            schedule.every(interval).minutes.do(self._check_url, url)
+        # 동시 체크 워커 풀 생성
+        self.check_executor = CheckExecutor(self._check_url)
+        
+        # 각 URL에 대해 스케줄 설정 (첫 체크를 간격 안에 고르게 분산, 스케줄러 스레드는 워커 풀에 등록만 함)
+        self.scheduler.add_staggered(
+            (url, config['interval'] * 60) for url, config in list(self.monitored_urls.items())
+        )
         
-        # 모니터링 스레드 시작
-        self.monitor_thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        self.monitor_thread.start()
+        # 알림 디스패처 시작 (이전 실행에서 남은 미발송 알림도 이때 복구)
+        self.notifier.start()
+        
+        # 스케줄러 스레드 시작
+        self.scheduler.start()
+        
+        # 메트릭 엔드포인트 시작 (설정 시, Prometheus 텍스트 형식만 지원하는 InMemoryMetrics 필요)
+        if Config.METRICS_ENABLED and isinstance(self.metrics, InMemoryMetrics) and not self.metrics_server:
+            try:
+                self.metrics_server = MetricsServer(self.metrics)
+                self.metrics_server.start()
+            except OSError as e:
+                logger.error(f"메트릭 엔드포인트 시작 실패: {e}")
+                self.metrics_server = None
         
         logger.info("모니터링이 시작되었습니다.")
         
@@ -77,6 +284,8 @@ class StockMonitor:
         if self.log_callback:
             self.log_callback("INFO", "모니터링이 시작되었습니다.")
             self.log_callback("INFO", f"모니터링 URL 수: {len(self.monitored_urls)}")
+        
+        self._publish(MONITOR_STARTED)
     
     def stop_monitoring(self):
         """모니터링을 중지합니다."""
@@ -84,24 +293,59 @@ class StockMonitor:
             return
         
         self.is_running = False
-        schedule.clear()
+        self.scheduler.stop(timeout=1)
+        
+        # 대기 중인 체크 취소 (실행 중인 체크는 끝까지 진행)
+        if self.check_executor:
+            self.check_executor.shutdown(wait=False)
+            self.check_executor = None
+        
+        # 재사용 중이던 브라우저 세션 정리, 이전 재고 상태 저장
+        self.stock_checker.close()
+        if self.state_store is not None:
+            self.state_store.flush()
+        if self.history is not None:
+            self.history.flush()
         
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1)
+        # 모아 둔 요약 알림을 큐에 넣고, 알림 디스패처 중지 (미발송 알림은 스풀에 남아 다음 시작 때 발송) 후 SMTP 연결 정리
+        self.digest.flush()
+        self.notifier.stop()
+        self.email_sender.close()
+        
+        if self.metrics_server:
+            self.metrics_server.stop()
+            self.metrics_server = None
         
         logger.info("모니터링이 중지되었습니다.")
         
         # GUI 로그 콜백 호출
         if self.log_callback:
             self.log_callback("INFO", "모니터링이 중지되었습니다.")
+        
+        self._publish(MONITOR_STOPPED)
     
-    def _run_scheduler(self):
-        """스케줄러를 실행합니다."""
-        while self.is_running:
-            schedule.run_pending()
-            time.sleep(1)
+    def _dispatch_check(self, url):
+        """URL 체크를 워커 풀에 등록합니다. 같은 URL이 이미 체크 중이면 건너뜁니다."""
+        executor = self.check_executor
+        if not executor:
+            return
+        
+        if not executor.submit(url):
+            logger.info(f"이전 체크가 진행 중이어서 건너뜀: {url}")
+            if self.log_callback:
+                self.log_callback("INFO", f"이전 체크가 진행 중이어서 건너뜀: {url}")
     
     def _check_url(self, url):
+        """특정 URL의 재고 상태를 체크하고 전체 소요 시간을 기록합니다."""
+        started = time.perf_counter()
+        with self.metrics.timer('check'):
+            self._run_check(url)
+        entry = self.monitored_urls.get(url)
+        if entry is not None:
+            entry['latency'] = time.perf_counter() - started
+            self._publish(CHECK_COMPLETED, url)
+    
+    def _run_check(self, url):
         """특정 URL의 재고 상태를 체크합니다."""
         try:
             # 마지막 체크 시간 업데이트
@@ -121,58 +365,148 @@ class StockMonitor:
                     self.log_callback("ERROR", f"상태 체크 실패: {url}")
                 return
             
+            # 페이지가 이전과 같으면 상태 로그와 변화 감지 생략
+            if current_status.get('content_unchanged') and url in self.stock_checker.previous_states:
+                logger.info(f"페이지 변경 없음, 변화 감지 생략: {url}")
+                if self.log_callback:
+                    self.log_callback("INFO", f"페이지 변경 없음, 변화 감지 생략: {url}")
+                self.monitored_urls[url]['last_check'] = datetime.now()
+                self.monitored_urls[url]['status'] = current_status
+                self._record_history(url, current_status)
+                return
+            
             # 상품 정보 로그 출력
             self._log_product_status(current_status)
             
-            # 상태 변화 감지
-            if self.stock_checker.has_stock_changed(url, current_status):
+            # 상태 변화 감지 (이전 상태와 비교하여 옵션별 재고 이벤트 계산)
+            previous_status = self.stock_checker.previous_states.get(url)
+            with self.metrics.timer('diff'):
+                events = compute_stock_events(previous_status, current_status)
+                stock_changed = self.stock_checker.has_stock_changed(url, current_status)
+            
+            for event in events:
+                self.metrics.increment('stock_events_total', labels={'type': event.type})
+                logger.info(f"재고 이벤트: {event.describe()}")
+                if self.log_callback:
+                    self.log_callback("WARNING", f"재고 이벤트: {event.describe()}")
+            
+            # 알림 대상으로 설정된 유형의 이벤트만 메일로 발송
+            notify_events = [event for event in events if event.type in Config.NOTIFY_EVENT_TYPES]
+            
+            if stock_changed or events:
                 logger.info(f"재고 상태 변화 감지: {url}")
+                self.metrics.increment('stock_changes_total')
                 
                 # GUI 로그 콜백 호출
                 if self.log_callback:
                     self.log_callback("WARNING", f"재고 상태 변화 감지: {url}")
                 
-                # 이메일 알림 발송 (변동 알림)
-                receiver_email = self.monitored_urls[url]['receiver_email']
-                
-                # 이전 상태 정보 추가
-                if url in self.stock_checker.previous_states:
-                    current_status['previous_status'] = self.stock_checker.previous_states[url]['stock_status']
-                
-                if self.email_sender.send_stock_notification(receiver_email, current_status, "change"):
-                    logger.info(f"재고 변동 알림 이메일 발송 완료: {url}")
-                    if self.log_callback:
-                        self.log_callback("INFO", f"재고 변동 알림 이메일 발송 완료: {url}")
+                if notify_events:
+                    # 이메일 알림 발송 (변동 알림)
+                    receiver_email = self.monitored_urls[url]['receiver_email']
+                    
+                    # 이전 상태와 이벤트 정보 추가
+                    current_status['previous_status'] = previous_status['stock_status']
+                    current_status['events'] = [event.to_dict() for event in notify_events]
+                    
+                    if Config.DIGEST_ENABLED:
+                        self.digest.add(receiver_email, current_status)
+                        logger.info(f"재고 변동을 요약 알림에 추가: {url}")
+                    else:
+                        self._enqueue_notification(receiver_email, current_status, "change")
                 else:
-                    logger.error(f"재고 변동 알림 이메일 발송 실패: {url}")
-                    if self.log_callback:
-                        self.log_callback("ERROR", f"재고 변동 알림 이메일 발송 실패: {url}")
+                    logger.info(f"알림 대상 이벤트가 없어 메일을 보내지 않습니다: {url}")
             else:
                 logger.info(f"재고 상태 변화 없음: {url}")
                 if self.log_callback:
                     self.log_callback("INFO", f"재고 상태 변화 없음: {url}")
                 
                 # 첫 번째 체크인 경우 초기 상태 이메일 발송
-                if url not in self.stock_checker.previous_states:
+                if previous_status is None:
                     receiver_email = self.monitored_urls[url]['receiver_email']
-                    if self.email_sender.send_stock_notification(receiver_email, current_status, "initial"):
-                        logger.info(f"초기 재고 상태 이메일 발송 완료: {url}")
-                        if self.log_callback:
-                            self.log_callback("INFO", f"초기 재고 상태 이메일 발송 완료: {url}")
-                    else:
-                        logger.error(f"초기 재고 상태 이메일 발송 실패: {url}")
-                        if self.log_callback:
-                            self.log_callback("ERROR", f"초기 재고 상태 이메일 발송 실패: {url}")
+                    self._enqueue_notification(receiver_email, current_status, "initial")
             
             # 마지막 체크 시간 업데이트
             self.monitored_urls[url]['last_check'] = datetime.now()
             self.monitored_urls[url]['status'] = current_status
+            self._record_history(url, current_status)
             
         except Exception as e:
             logger.error(f"URL 체크 중 오류 발생: {url}, 오류: {e}")
             if self.log_callback:
                 self.log_callback("ERROR", f"URL 체크 중 오류 발생: {url}, 오류: {e}")
     
+    def _enqueue_notification(self, receiver_email, stock_info, email_type):
+        """알림 이메일을 발송 큐에 넣습니다. 실제 발송 결과는 _on_notification_result로 전달됩니다."""
+        self.notifier.enqueue(receiver_email, stock_info, email_type)
+        logger.info(f"알림 이메일 발송 대기: {stock_info['url']} (유형: {email_type})")
+    
+    def _on_notification_result(self, notification, sent, final):
+        """알림 디스패처의 발송 결과를 로그로 남깁니다."""
+        url = notification['stock_info']['url']
+        label = {"change": "재고 변동 알림", "digest": "재고 변동 요약"}.get(notification['email_type'], "초기 재고 상태")
+        
+        if sent:
+            message = f"{label} 이메일 발송 완료: {url}"
+            logger.info(message)
+            level = "INFO"
+        elif final:
+            message = f"{label} 이메일 발송 실패: {url}"
+            logger.error(message)
+            level = "ERROR"
+        else:
+            message = f"{label} 이메일 발송 실패, 재시도 예정 ({notification['attempts']}회 시도): {url}"
+            level = "WARNING"
+        
+        if self.log_callback:
+            self.log_callback(level, message)
+    
+    def _open_state_store(self):
+        """이전 재고 상태 저장소를 엽니다. 사용할 수 없으면 None (메모리에만 보관)을 반환합니다."""
+        if not Config.STATE_STORE_ENABLED:
+            return None
+        try:
+            return StockStateStore()
+        except Exception as e:
+            logger.error(f"재고 상태 저장소를 열 수 없어 메모리에만 보관합니다: {e}")
+            return None
+    
+    def _open_history(self):
+        """재고 이력 저장소를 엽니다. 사용할 수 없으면 None (이력 기록 안 함)을 반환합니다."""
+        if not Config.HISTORY_ENABLED:
+            return None
+        try:
+            return StockHistory()
+        except Exception as e:
+            logger.error(f"재고 이력 저장소를 열 수 없어 이력을 기록하지 않습니다: {e}")
+            return None
+    
+    def _record_history(self, url, status):
+        """체크 결과를 재고 이력에 기록합니다."""
+        if self.history is None:
+            return
+        try:
+            interval_seconds = self.monitored_urls.get(url, {}).get('interval', 0) * 60
+            self.history.record(url, status, interval_seconds)
+        except Exception as e:
+            logger.error(f"재고 이력 기록 중 오류: {url}, 오류: {e}")
+    
+    def get_stock_history(self, url, start=None, end=None):
+        """구간 동안 옵션별 재고 유지 비율과 품절 횟수를 반환합니다 (시각은 epoch 초)."""
+        if self.history is None:
+            return []
+        return self.history.availability(url, start, end)
+    
+    def _new_url_entry(self, interval_minutes, receiver_email):
+        """monitored_urls에 넣을 URL 항목을 만듭니다."""
+        return {
+            'interval': interval_minutes,
+            'receiver_email': receiver_email,
+            'last_check': None,
+            'status': None,
+            'latency': None  # 마지막 체크 소요 시간 (초)
+        }
+    
     def _validate_url(self, url):
         """URL 유효성을 검사합니다."""
         try:
@@ -187,7 +521,9 @@ class StockMonitor:
         return {
             'is_running': self.is_running,
             'monitored_urls': self.monitored_urls,
-            'total_urls': len(self.monitored_urls)
+            'total_urls': len(self.monitored_urls),
+            'next_check_time': self.next_check_time,
+            'dispatch_rate': self.scheduler.rate_tracker.get_stats()
         }
     
     def manual_check(self, url):
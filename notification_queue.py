@@ -0,0 +1,265 @@
+import heapq
+import itertools
+import json
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+from config import Config
+from metrics import MetricsSink
+import logging
+
+logger = logging.getLogger(__name__)
+
+class NotificationDispatcher:
+    """재고 알림 이메일을 백그라운드 스레드에서 발송하는 디스패처입니다.
+
+    enqueue()는 알림을 스풀 디렉토리에 파일로 기록한 뒤 메모리 큐에 넣고 바로 반환하므로,
+    재고 체크는 SMTP 지연을 기다리지 않습니다. 워커는 큐에 쌓인 알림을 묶어서
+    EmailSender.send_many()로 발송하고, 실패한 알림은 지수 백오프로 재시도합니다.
+    발송이 끝난 알림만 스풀에서 지우므로, 종료 시 남은 알림은 다음 시작 때 다시 발송됩니다.
+    재시도 횟수를 모두 쓴 알림은 .failed 파일로 남깁니다.
+    워커는 start()로만 시작하며, 중지된 동안 enqueue()한 알림은 스풀에만 기록됩니다.
+    """
+
+    def __init__(self, email_sender, spool_dir=None, max_queue_size=None, metrics=None, on_result=None):
+        self.email_sender = email_sender
+        self.spool_dir = spool_dir or Config.NOTIFICATION_SPOOL_DIR
+        self.max_queue_size = max_queue_size or Config.NOTIFICATION_QUEUE_SIZE
+        self.metrics = metrics or MetricsSink()
+        self.on_result = on_result  # on_result(notification, sent, final) 발송 결과 콜백
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        self._retries = []  # [다음 시도 시각(time.time), seq, 알림]
+        self._sequence = itertools.count()
+        self._known_ids = set()  # 메모리에 올라온(큐 또는 재시도 대기) 알림 ID
+        self._lock = threading.Lock()
+        self._overflowed = False  # 큐가 가득 차 스풀에만 기록된 알림이 있음
+        # 현재 워커의 중지 신호 (워커마다 새로 만들어, 이전 워커가 새 워커의 시작으로 되살아나지 않게 함)
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # 시작 전에는 중지 상태
+        self._thread = None  # 마지막으로 시작한 워커 (중지 후에도 발송 중이면 끝날 때까지 유지)
+
+    def start(self):
+        """워커 스레드를 시작합니다. 워커는 스풀에 남아 있던 알림을 다시 큐에 넣은 뒤 발송을 시작합니다."""
+        with self._lock:
+            if not self._stop_event.is_set():
+                return
+            previous = self._thread if self._thread and self._thread.is_alive() else None
+            stop_event = threading.Event()
+            thread = threading.Thread(target=self._run, args=(stop_event, previous),
+                                      name='notification-dispatcher', daemon=True)
+            self._stop_event = stop_event
+            self._thread = thread
+        thread.start()
+
+    def stop(self, timeout=5):
+        """워커 스레드를 중지합니다. 미발송 알림은 스풀에 남아 다음 시작 때 발송됩니다."""
+        with self._lock:
+            self._stop_event.set()
+            thread = self._thread
+        if thread:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                # 발송 중인 SMTP 요청이 끝나지 않음: 스레드는 그대로 두고, 다음 워커는 이 스레드가 끝난 뒤 스풀을 읽음
+                logger.warning("발송 중인 알림이 끝나지 않아 알림 워커가 종료되기를 기다리지 않고 중지합니다.")
+        with self._lock:
+            if thread is not None and self._thread is thread and not thread.is_alive():
+                self._thread = None
+            self._retries.clear()
+            self._known_ids.clear()
+            self._overflowed = False
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def enqueue(self, receiver_email, stock_info, email_type):
+        """알림을 스풀에 기록하고 발송 큐에 넣습니다.
+
+        Returns:
+            bool: 메모리 큐에 들어갔으면 True, 큐가 가득 찼거나 워커가 중지되어 스풀에만 기록되었으면 False
+        """
+        notification = {
+            'id': f"{time.time():.6f}-{uuid.uuid4().hex[:8]}",
+            'receiver_email': receiver_email,
+            'stock_info': stock_info,
+            'email_type': email_type,
+            'attempts': 0,
+            'next_attempt': time.time()
+        }
+        self._write_spool(notification)
+        return self._offer(notification)
+
+    def pending_count(self):
+        """발송 대기 중인 알림 수 (재시도 대기 포함)를 반환합니다."""
+        with self._lock:
+            return len(self._known_ids)
+
+    def _offer(self, notification):
+        with self._lock:
+            if self._stop_event.is_set():
+                # 중지된 뒤 끝난 체크의 알림: 스풀에만 남겨 다음 시작 때 발송
+                return False
+            if notification['id'] in self._known_ids:
+                return True
+            try:
+                self._queue.put_nowait(notification)
+            except queue.Full:
+                self._overflowed = True
+                logger.warning(f"알림 큐가 가득 차 스풀에 보관합니다: {notification['receiver_email']}")
+                self.metrics.increment('notifications_total', labels={'result': 'overflow'})
+                return False
+            self._known_ids.add(notification['id'])
+            return True
+
+    def _run(self, stop_event, previous):
+        """큐와 재시도 대기열에서 발송할 알림을 모아 일괄 발송합니다."""
+        # 이전 워커가 아직 발송 중이면 끝날 때까지 기다린 뒤 스풀을 읽음 (같은 알림 중복 발송 방지)
+        while previous is not None and previous.is_alive():
+            if stop_event.is_set():
+                return
+            previous.join(timeout=1.0)
+
+        restored = self._load_spool()
+        if restored:
+            logger.info(f"미발송 알림 {restored}건을 스풀에서 복구했습니다.")
+
+        while not stop_event.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._deliver(batch, stop_event)
+            elif self._overflowed and self._queue.empty():
+                with self._lock:
+                    self._overflowed = False
+                self._load_spool()
+
+    def _collect_batch(self):
+        """발송 시각이 된 알림을 최대 NOTIFICATION_BATCH_SIZE개 모읍니다."""
+        with self._lock:
+            wait_seconds = self._retries[0][0] - time.time() if self._retries else 1.0
+        wait_seconds = min(max(wait_seconds, 0), 1.0)  # 중지 신호를 확인할 수 있도록 최대 1초씩 대기
+
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=wait_seconds) if wait_seconds else self._queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        while len(batch) < Config.NOTIFICATION_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        now = time.time()
+        with self._lock:
+            while self._retries and self._retries[0][0] <= now and len(batch) < Config.NOTIFICATION_BATCH_SIZE:
+                batch.append(heapq.heappop(self._retries)[2])
+        return batch
+
+    def _deliver(self, batch, stop_event):
+        """알림 묶음을 하나의 SMTP 세션으로 발송하고 결과에 따라 스풀을 정리하거나 재시도를 예약합니다."""
+        with self.metrics.timer('email'):
+            results = self.email_sender.send_many(
+                (item['receiver_email'], item['stock_info'], item['email_type']) for item in batch
+            )
+
+        for notification, sent in zip(batch, results):
+            notification['attempts'] += 1
+            final = sent or notification['attempts'] >= Config.NOTIFICATION_MAX_RETRIES
+
+            if sent:
+                self._remove_spool(notification, failed=False)
+                self.metrics.increment('notifications_total', labels={'result': 'sent'})
+            elif final:
+                logger.error(f"알림 발송 재시도 횟수 초과: {notification['receiver_email']} ({notification['attempts']}회)")
+                self._remove_spool(notification, failed=True)
+                self.metrics.increment('notifications_total', labels={'result': 'failed'})
+            else:
+                delay = min(
+                    Config.NOTIFICATION_RETRY_BASE_DELAY * (2 ** (notification['attempts'] - 1)),
+                    Config.NOTIFICATION_RETRY_MAX_DELAY
+                ) * random.uniform(0.8, 1.2)
+                notification['next_attempt'] = time.time() + delay
+                self._write_spool(notification)
+                if not stop_event.is_set():
+                    # 중지된 뒤 끝난 발송은 재시도 대기열에 넣지 않음 (스풀에서 다음 워커가 불러옴)
+                    with self._lock:
+                        heapq.heappush(self._retries, [notification['next_attempt'], next(self._sequence), notification])
+                logger.warning(f"알림 발송 실패, {int(delay)}초 후 재시도: {notification['receiver_email']}")
+                self.metrics.increment('notifications_total', labels={'result': 'retry'})
+
+            if final:
+                with self._lock:
+                    self._known_ids.discard(notification['id'])
+
+            if self.on_result:
+                try:
+                    self.on_result(notification, sent, final)
+                except Exception as e:
+                    logger.error(f"알림 결과 콜백 오류: {e}")
+
+    def _load_spool(self):
+        """스풀 디렉토리의 미발송 알림 중 메모리에 없는 것을 큐 또는 재시도 대기열에 넣습니다."""
+        try:
+            names = sorted(name for name in os.listdir(self.spool_dir) if name.endswith('.json'))
+        except FileNotFoundError:
+            return 0
+
+        restored = 0
+        now = time.time()
+        for name in names:
+            try:
+                with open(os.path.join(self.spool_dir, name), 'r', encoding='utf-8') as f:
+                    notification = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"스풀 파일을 읽을 수 없습니다: {name}, 오류: {e}")
+                continue
+
+            if notification.get('next_attempt', 0) > now:
+                with self._lock:
+                    if notification['id'] in self._known_ids:
+                        continue
+                    self._known_ids.add(notification['id'])
+                    heapq.heappush(self._retries, [notification['next_attempt'], next(self._sequence), notification])
+            elif not self._offer(notification):
+                break
+            restored += 1
+        return restored
+
+    def _spool_path(self, notification, suffix='.json'):
+        return os.path.join(self.spool_dir, notification['id'] + suffix)
+
+    def _write_spool(self, notification):
+        """알림을 스풀 파일로 기록합니다 (임시 파일에 쓴 뒤 교체하여 손상 방지)."""
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            path = self._spool_path(notification)
+            temp_path = path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(notification, f, ensure_ascii=False, default=_to_json)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error(f"알림 스풀 기록 실패: {e}")
+
+    def _remove_spool(self, notification, failed):
+        """발송이 끝난 알림을 스풀에서 지웁니다. 최종 실패한 알림은 .failed 파일로 남깁니다."""
+        path = self._spool_path(notification)
+        try:
+            if failed:
+                os.replace(path, self._spool_path(notification, '.failed'))
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"알림 스풀 정리 실패: {e}")
+
+def _to_json(value):
+    """스풀 기록 시 JSON으로 바로 쓸 수 없는 값(예: OptionMatrix)을 변환합니다."""
+    if hasattr(value, 'to_compact'):
+        return value.to_compact()
+    return str(value)
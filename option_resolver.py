@@ -0,0 +1,129 @@
+from abc import ABC, abstractmethod
+from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlparse, parse_qsl
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Option2Resolver(ABC):
+    """옵션1 선택 시 채워지는 옵션2 목록을 가져오는 전략의 기본 클래스입니다.
+
+    resolve()는 _extract_option_info()와 같은 형태의 옵션 정보를 반환하고,
+    가져올 수 없으면 None을 반환하여 브라우저 방식으로 폴백하게 합니다.
+    """
+
+    @abstractmethod
+    def resolve(self, url, soup, option1):
+        """옵션1에 대한 옵션2 정보를 반환합니다. 가져올 수 없으면 None."""
+
+class AjaxOption2Resolver(Option2Resolver):
+    """옵션2를 채우는 XHR 요청을 requests 세션으로 직접 재현합니다.
+
+    endpoint 설정 예시 (Config.SUPPORTED_WEBSITES의 'option2_endpoint'):
+        {
+            'url': '/V2/product/option.php',   # 상품 페이지 기준 상대 경로 가능
+            'method': 'POST',                   # GET 또는 POST
+            'params': {'selfcode': '{selfcode}', 'option1': '{option1_value}'},
+            'response_type': 'html',            # 'html' (option 태그) 또는 'json'
+            'options_key': 'options',           # json 응답의 옵션 목록 키
+            'text_key': 'text',                 # json 옵션 항목의 텍스트 키
+            'value_key': 'value'                # json 옵션 항목의 값 키
+        }
+
+    params 값에는 {option1_value}, {option1_text}와 상품 URL의 쿼리 파라미터
+    (예: {selfcode})를 사용할 수 있습니다.
+    """
+
+    def __init__(self, session, endpoint):
+        self.session = session
+        self.endpoint = endpoint
+        self.timeout = endpoint.get('timeout', 10)
+
+    def resolve(self, url, soup, option1):
+        """옵션1에 대한 옵션2 목록을 HTTP 요청으로 가져옵니다."""
+        try:
+            placeholders = dict(parse_qsl(urlparse(url).query))
+            placeholders['option1_value'] = option1.get('value', '')
+            placeholders['option1_text'] = option1['text']
+
+            params = {
+                key: str(value).format_map(placeholders)
+                for key, value in self.endpoint.get('params', {}).items()
+            }
+            endpoint_url = urljoin(url, self.endpoint['url'])
+            method = self.endpoint.get('method', 'GET').upper()
+
+            headers = {
+                'Referer': url,
+                'X-Requested-With': 'XMLHttpRequest'
+            }
+
+            if method == 'POST':
+                response = self.session.post(endpoint_url, data=params, headers=headers, timeout=self.timeout)
+            else:
+                response = self.session.get(endpoint_url, params=params, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+
+            if self.endpoint.get('response_type', 'html') == 'json':
+                return self._parse_json_options(response.json())
+            return self._parse_html_options(response.text)
+
+        except KeyError as e:
+            logger.warning(f"    └─ 옵션2 엔드포인트 파라미터를 채울 수 없음: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"    └─ 옵션2 엔드포인트 요청 실패 (옵션1: {option1['text']}): {e}")
+            return None
+
+    def _parse_html_options(self, html):
+        """option 태그로 구성된 HTML 조각에서 옵션 정보를 추출합니다."""
+        fragment = BeautifulSoup(html, 'html.parser')
+        options = []
+        for option in fragment.find_all('option'):
+            option_text = option.get_text(strip=True)
+            if option_text:
+                options.append({
+                    'text': option_text,
+                    'value': option.get('value', ''),
+                    'selected': option.get('selected') is not None
+                })
+        return {'options': options, 'total_count': len(options)}
+
+    def _parse_json_options(self, data):
+        """JSON 응답에서 옵션 정보를 추출합니다."""
+        options_key = self.endpoint.get('options_key')
+        text_key = self.endpoint.get('text_key', 'text')
+        value_key = self.endpoint.get('value_key', 'value')
+
+        items = data.get(options_key, []) if options_key else data
+        if not isinstance(items, list):
+            return None
+
+        options = []
+        for item in items:
+            option_text = str(item.get(text_key, '')).strip()
+            if option_text:
+                options.append({
+                    'text': option_text,
+                    'value': str(item.get(value_key, '')),
+                    'selected': False
+                })
+        return {'options': options, 'total_count': len(options)}
+
+# 'option2_endpoint' 설정의 'type' 값과 리졸버 클래스 매핑
+OPTION2_RESOLVERS = {
+    'ajax': AjaxOption2Resolver
+}
+
+def create_option2_resolver(session, website_config):
+    """웹사이트 설정에 맞는 옵션2 리졸버를 생성합니다. 엔드포인트가 없으면 None을 반환합니다."""
+    endpoint = website_config.get('option2_endpoint')
+    if not endpoint or not endpoint.get('url'):
+        return None
+
+    resolver_class = OPTION2_RESOLVERS.get(endpoint.get('type', 'ajax'))
+    if resolver_class is None:
+        logger.warning(f"알 수 없는 옵션2 리졸버 유형: {endpoint.get('type')}")
+        return None
+
+    return resolver_class(session, endpoint)
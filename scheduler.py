@@ -0,0 +1,255 @@
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CheckScheduler:
+    """URL별 다음 체크 시각을 우선순위 큐(힙)로 관리하는 스케줄러입니다.
+
+    스케줄러 스레드는 가장 빠른 체크 시각까지 정확히 대기하며,
+    실행 중에도 URL을 추가/제거할 수 있습니다. 추가와 재스케줄은 O(log n)이고,
+    제거는 항목을 무효화만 해 두었다가 힙에서 꺼낼 때 버립니다.
+
+    요청이 한순간에 몰리지 않도록 각 체크 시각에는 간격 대비 jitter_ratio
+    범위의 무작위 오차를 더합니다. 오차는 기준 시각에 누적되지 않습니다.
+    """
+
+    def __init__(self, dispatch, jitter_ratio=None):
+        self.dispatch = dispatch  # 체크 시각이 된 URL을 넘겨받는 함수
+        self.jitter_ratio = Config.SCHEDULE_JITTER_RATIO if jitter_ratio is None else jitter_ratio
+        self.rate_tracker = DispatchRateTracker()
+        self._heap = []  # [due(monotonic), seq, url, valid]
+        self._entries = {}  # url -> (힙 항목, 간격(초), 기준 시각)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def add(self, url, interval_seconds, delay_seconds=None):
+        """URL을 스케줄에 추가합니다. 이미 있으면 간격과 다음 체크 시각을 갱신합니다.
+
+        Args:
+            url: 체크할 URL
+            interval_seconds: 체크 간격 (초)
+            delay_seconds: 첫 체크까지의 대기 시간 (기본값: interval_seconds)
+
+        Raises:
+            ValueError: 간격이 0 이하이거나 유한한 숫자가 아닐 때
+        """
+        _check_seconds(interval_seconds, '체크 간격', positive=True)
+        if delay_seconds is None:
+            delay_seconds = interval_seconds
+        _check_seconds(delay_seconds, '첫 체크 대기 시간')
+
+        with self._condition:
+            self._invalidate(url)
+            self._push(url, time.monotonic() + delay_seconds, interval_seconds)
+            self._condition.notify()
+
+    def add_staggered(self, items):
+        """여러 URL을 첫 체크 시각이 각자의 간격 안에 고르게 퍼지도록 추가합니다.
+
+        Args:
+            items: (url, interval_seconds) 목록
+
+        Raises:
+            ValueError: 간격이 잘못된 항목이 있을 때 (아무 URL도 추가하지 않음)
+        """
+        items = list(items)
+        for url, interval_seconds in items:
+            _check_seconds(interval_seconds, f'체크 간격 ({url})', positive=True)
+        count = len(items)
+        now = time.monotonic()
+
+        with self._condition:
+            for index, (url, interval_seconds) in enumerate(items):
+                self._invalidate(url)
+                delay_seconds = interval_seconds * (index + 1) / count
+                self._push(url, now + delay_seconds, interval_seconds)
+            self._condition.notify()
+
+    def remove(self, url):
+        """URL을 스케줄에서 제거합니다."""
+        with self._condition:
+            removed = self._invalidate(url)
+            self._condition.notify()
+        return removed
+
+    def clear(self):
+        """모든 스케줄을 제거합니다."""
+        with self._condition:
+            self._heap.clear()
+            self._entries.clear()
+            self._condition.notify()
+
+    def next_check_time(self, url=None):
+        """URL(생략 시 전체 중 가장 빠른)의 다음 체크 시각을 datetime으로 반환합니다."""
+        with self._condition:
+            if url is not None:
+                entry = self._entries.get(url)
+                due = entry[0][0] if entry else None
+            else:
+                self._discard_invalid_head()
+                due = self._heap[0][0] if self._heap else None
+
+        if due is None:
+            return None
+        return datetime.now() + timedelta(seconds=due - time.monotonic())
+
+    def next_check_times(self):
+        """스케줄에 있는 모든 URL의 다음 체크 시각을 {url: datetime}으로 반환합니다 (잠금은 한 번만)."""
+        with self._condition:
+            dues = [(url, entry[0][0]) for url, entry in self._entries.items()]
+        now = datetime.now()
+        monotonic_now = time.monotonic()
+        return {url: now + timedelta(seconds=due - monotonic_now) for url, due in dues}
+
+    def start(self):
+        """스케줄러 스레드를 시작합니다."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        self._thread = threading.Thread(target=self._run, name='check-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1):
+        """스케줄러 스레드를 중지하고 모든 스케줄을 제거합니다."""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._entries.clear()
+            self._condition.notify()
+
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        """가장 빠른 체크 시각까지 대기했다가 해당 URL들을 실행하고 재스케줄합니다."""
+        while True:
+            due_urls = []
+            with self._condition:
+                while self._running:
+                    self._discard_invalid_head()
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+
+                    wait_seconds = self._heap[0][0] - time.monotonic()
+                    if wait_seconds > 0:
+                        self._condition.wait(wait_seconds)
+                        continue
+                    break
+
+                if not self._running:
+                    return
+
+                now = time.monotonic()
+                # 한 번에 꺼내는 항목 수를 제한하여 잠금을 잡은 채 계속 도는 일이 없게 함
+                remaining_pops = len(self._heap)
+                while self._heap and self._heap[0][0] <= now and remaining_pops > 0:
+                    remaining_pops -= 1
+                    _, _, url, valid = heapq.heappop(self._heap)
+                    if not valid:
+                        continue
+
+                    _, interval_seconds, base_due = self._entries[url]
+                    next_base = base_due + interval_seconds
+                    if next_base <= now:
+                        # 처리가 밀린 경우 누적 실행하지 않고 지금부터 다시 계산
+                        next_base = now + interval_seconds
+                    self._push(url, next_base, interval_seconds)
+                    due_urls.append(url)
+
+            self.rate_tracker.record(len(due_urls))
+            for url in due_urls:
+                try:
+                    self.dispatch(url)
+                except Exception as e:
+                    logger.error(f"스케줄 실행 중 오류: {url}, 오류: {e}")
+
+    def _push(self, url, base_due, interval_seconds):
+        jitter = random.uniform(-self.jitter_ratio, self.jitter_ratio) * interval_seconds
+        entry = [base_due + jitter, next(self._sequence), url, True]
+        self._entries[url] = (entry, interval_seconds, base_due)
+        heapq.heappush(self._heap, entry)
+
+    def _invalidate(self, url):
+        existing = self._entries.pop(url, None)
+        if existing:
+            existing[0][3] = False
+            return True
+        return False
+
+    def _discard_invalid_head(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+def _check_seconds(value, name, positive=False):
+    """스케줄 시간 값이 유한한 숫자인지 확인합니다 (positive=True면 0보다 커야 함)."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{name}은(는) 유한한 숫자여야 합니다: {value!r}")
+    if positive and value <= 0:
+        raise ValueError(f"{name}은(는) 0보다 커야 합니다: {value!r}")
+
+class DispatchRateTracker:
+    """최근 체크 실행 시각을 모아 요청률이 얼마나 고르게 분산되는지 측정합니다."""
+
+    def __init__(self, window_seconds=None, bucket_seconds=None):
+        self.window_seconds = window_seconds or Config.SCHEDULE_RATE_WINDOW
+        self.bucket_seconds = bucket_seconds or Config.SCHEDULE_RATE_BUCKET
+        self._events = deque()  # (monotonic, 실행 수)
+        self._lock = threading.Lock()
+
+    def record(self, count, now=None):
+        """count개의 체크가 실행되었음을 기록합니다."""
+        if count <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._events.append((now, count))
+            self._trim(now)
+
+    def get_stats(self, now=None):
+        """최근 구간의 구간별 실행 수 통계를 반환합니다.
+
+        peak_to_mean이 1에 가까울수록, cv(변동계수)가 0에 가까울수록 고르게 분산된 것입니다.
+        """
+        now = time.monotonic() if now is None else now
+        bucket_count = max(1, int(self.window_seconds // self.bucket_seconds))
+        buckets = [0] * bucket_count
+
+        with self._lock:
+            self._trim(now)
+            for timestamp, count in self._events:
+                index = min(bucket_count - 1, int((now - timestamp) // self.bucket_seconds))
+                buckets[index] += count
+
+        total = sum(buckets)
+        mean = total / bucket_count
+        peak = max(buckets)
+        variance = sum((bucket - mean) ** 2 for bucket in buckets) / bucket_count
+
+        return {
+            'window_seconds': self.window_seconds,
+            'bucket_seconds': self.bucket_seconds,
+            'dispatches': total,
+            'mean_per_bucket': mean,
+            'peak_per_bucket': peak,
+            'peak_to_mean': peak / mean if mean else 0.0,
+            'cv': variance ** 0.5 / mean if mean else 0.0
+        }
+
+    def _trim(self, now):
+        while self._events and now - self._events[0][0] >= self.window_seconds:
+            self._events.popleft()
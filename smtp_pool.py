@@ -0,0 +1,175 @@
+import smtplib
+import threading
+import queue
+import time
+from contextlib import contextmanager
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class SMTPConnection:
+    """풀에서 관리되는 인증 완료된 SMTP 연결입니다."""
+
+    def __init__(self, server, generation):
+        self.server = server
+        self.generation = generation  # 생성 당시 풀 세대 (종료 후 반납된 연결 판별용)
+        self.message_count = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+    def send(self, msg):
+        """메시지를 발송하고 사용 기록을 갱신합니다."""
+        self.server.send_message(msg)
+        self.message_count += 1
+        self.last_used = time.monotonic()
+
+    def idle_seconds(self):
+        """마지막 사용 후 지난 시간(초)을 반환합니다."""
+        return time.monotonic() - self.last_used
+
+    def is_healthy(self):
+        """NOOP 명령으로 연결이 살아 있는지 확인합니다."""
+        try:
+            return self.server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def close(self):
+        """QUIT을 보내고 연결을 닫습니다."""
+        try:
+            self.server.quit()
+        except Exception:
+            try:
+                self.server.close()
+            except Exception:
+                pass
+
+class SMTPConnectionPool:
+    """STARTTLS와 로그인을 마친 SMTP 연결을 재사용하는 풀입니다.
+
+    연결은 처음 필요할 때 생성되며, 최대 max_size개까지만 동시에 유지합니다.
+    idle_timeout보다 오래 쉬었거나 NOOP에 응답하지 않는 연결은 꺼낼 때 버리고 새로 연결하며,
+    max_messages개를 보낸 연결은 반납 시 종료합니다 (서버의 연결당 발송 제한 대비).
+    """
+
+    def __init__(self, smtp_server, smtp_port, email_user, email_password,
+                 max_size=None, idle_timeout=None, max_messages=None, acquire_timeout=None):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.email_user = email_user
+        self.email_password = email_password
+        self.max_size = max_size or Config.SMTP_POOL_SIZE
+        self.idle_timeout = idle_timeout or Config.SMTP_IDLE_TIMEOUT
+        self.max_messages = max_messages or Config.SMTP_MAX_MESSAGES_PER_CONNECTION
+        self.acquire_timeout = acquire_timeout or Config.SMTP_ACQUIRE_TIMEOUT
+        self._idle = queue.LifoQueue()  # 최근 사용한 연결부터 재사용
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @contextmanager
+    def connection(self):
+        """풀에서 연결을 빌려오고 사용이 끝나면 반납합니다."""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"SMTP 연결 대기 시간 초과 ({self.acquire_timeout}초)")
+
+        holder = _ConnectionHolder(self)
+        try:
+            yield holder
+        finally:
+            holder.release()
+            self._slots.release()
+
+    def shutdown(self):
+        """대기 중인 모든 연결을 닫습니다. 사용 중인 연결은 반납 시 닫힙니다."""
+        with self._lock:
+            self._generation += 1
+
+        closed_count = 0
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            closed_count += 1
+
+        if closed_count:
+            logger.info(f"SMTP 연결 풀 종료: {closed_count}개 연결 정리")
+
+    def _checkout(self):
+        """대기 중인 정상 연결을 꺼내거나 새로 연결합니다."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+
+            if conn.idle_seconds() < self.idle_timeout and conn.is_healthy():
+                return conn
+
+            conn.close()
+
+    def _checkin(self, conn):
+        """연결을 풀에 반납하거나, 재연결 조건에 해당하면 닫습니다."""
+        with self._lock:
+            stale = conn.generation != self._generation
+
+        if stale or conn.message_count >= self.max_messages:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    def _connect(self):
+        """SMTP 서버에 연결하고 STARTTLS와 로그인을 수행합니다."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=Config.SMTP_TIMEOUT)
+        try:
+            server.starttls()
+            server.login(self.email_user, self.email_password)
+        except Exception:
+            server.close()
+            raise
+
+        with self._lock:
+            generation = self._generation
+        return SMTPConnection(server, generation)
+
+class _ConnectionHolder:
+    """connection() 블록 안에서 사용하는 연결 핸들입니다. 끊긴 연결은 한 번 재연결하여 다시 보냅니다."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._conn = None
+
+    def send(self, msg):
+        """메시지를 발송합니다. 서버가 연결을 끊었으면 새로 연결하여 한 번 재시도합니다."""
+        if self._conn is not None and self._conn.message_count >= self._pool.max_messages:
+            # 연결당 발송 제한에 도달하면 일괄 발송 도중이라도 연결 교체
+            self._pool._checkin(self._conn)
+            self._conn = None
+        if self._conn is None:
+            self._conn = self._pool._checkout()
+
+        try:
+            self._conn.send(msg)
+        except smtplib.SMTPServerDisconnected as e:
+            self._reconnect(e)
+            self._conn.send(msg)
+        except smtplib.SMTPException:
+            # 수신자 거부 등 메시지 단위 오류는 연결을 유지한 채 호출자에게 전달
+            raise
+        except OSError as e:
+            self._reconnect(e)
+            self._conn.send(msg)
+
+    def _reconnect(self, error):
+        logger.warning(f"SMTP 연결이 끊어져 재연결합니다: {error}")
+        self._conn.close()
+        self._conn = None
+        self._conn = self._pool._connect()
+
+    def release(self):
+        if self._conn is not None:
+            self._pool._checkin(self._conn)
+            self._conn = None
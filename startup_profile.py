@@ -0,0 +1,142 @@
+"""
+프로그램 시작 시 모듈 불러오기 시간 측정 (python main.py --profile-startup)
+
+GUI/데몬이 시작할 때 불러오는 모듈을 실제로 import하면서 모듈별 소요 시간을 기록하고,
+오래 걸린 모듈과 시작 시 불러오지 않도록 미뤄 둔 무거운 패키지를 출력합니다.
+패키징된 앱에서도 동작하도록 `python -X importtime` 대신 import 시스템에 측정기를 끼워 넣어 잽니다.
+"""
+
+import importlib.abc
+import sys
+import time
+
+# 시작 경로에서 불러오는 최상위 모듈
+STARTUP_TARGETS = {
+    'gui': ['gui'],
+    'daemon': ['headless', 'monitor'],
+}
+
+# 첫 사용 시점까지 불러오지 않아야 하는 무거운 패키지
+DEFERRED_PACKAGES = ['requests', 'bs4', 'lxml', 'smtplib', 'email.mime', 'http.server', 'selenium', 'webdriver_manager']
+
+class _TimedLoader:
+    """모듈 실행(exec_module) 시간을 측정하는 로더 래퍼입니다."""
+
+    def __init__(self, loader, profiler, name):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter(self._name)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name, time.perf_counter() - start)
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """sys.meta_path 맨 앞에 설치되어 새로 불러오는 모듈의 누적/자체 소요 시간을 기록합니다."""
+
+    def __init__(self):
+        self.records = {}  # 모듈 이름 -> {'cumulative', 'self', 'parent'} (초)
+        self.order = []  # 불러온 순서
+        self._stack = []  # [모듈 이름, 하위 모듈 소요 시간]
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _enter(self, name):
+        self._stack.append([name, 0.0])
+
+    def _exit(self, name, elapsed):
+        _, children = self._stack.pop()
+        parent = self._stack[-1][0] if self._stack else None
+        if self._stack:
+            self._stack[-1][1] += elapsed
+        self.records[name] = {'cumulative': elapsed, 'self': max(elapsed - children, 0.0), 'parent': parent}
+        self.order.append(name)
+
+    def total(self):
+        """최상위에서 불러온 모듈들의 소요 시간 합계(초)를 반환합니다."""
+        return sum(record['cumulative'] for record in self.records.values() if record['parent'] is None)
+
+    def by_package(self):
+        """최상위 패키지별 자체 소요 시간 합계(초)를 큰 순서로 반환합니다."""
+        packages = {}
+        for name, record in self.records.items():
+            package = name.split('.')[0]
+            packages[package] = packages.get(package, 0.0) + record['self']
+        return sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+def profile_startup(target='gui', top=15, budget_ms=None, stream=None):
+    """시작 경로의 모듈을 불러오며 소요 시간을 출력합니다.
+
+    이미 불러온 모듈은 측정되지 않으므로 다른 모듈을 불러오기 전(main.py 시작 직후)에 호출해야 합니다.
+
+    Returns:
+        int: 예산 안이면 0, 초과했거나 불러오기에 실패하면 1
+    """
+    stream = stream or sys.stdout
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        for module_name in STARTUP_TARGETS[target]:
+            __import__(module_name)
+    except ImportError as e:
+        print(f"시작 모듈을 불러올 수 없습니다: {e}", file=stream)
+        return 1
+    finally:
+        profiler.uninstall()
+
+    # 설정은 측정이 끝난 뒤에 읽음 (config 자체도 측정 대상)
+    if budget_ms is None:
+        from config import Config
+        budget_ms = Config.STARTUP_IMPORT_BUDGET_MS
+
+    total_ms = profiler.total() * 1000
+    print(f"시작 모듈 불러오기 ({target}): {total_ms:.1f}ms / 예산 {budget_ms}ms, 모듈 {len(profiler.records)}개", file=stream)
+
+    print(f"\n누적 시간 상위 {top}개 모듈:", file=stream)
+    ranked = sorted(profiler.records.items(), key=lambda item: item[1]['cumulative'], reverse=True)
+    for name, record in ranked[:top]:
+        print(f"  {record['cumulative'] * 1000:8.1f}ms  (자체 {record['self'] * 1000:6.1f}ms)  {name}", file=stream)
+
+    print(f"\n패키지별 자체 시간 상위 {top}개:", file=stream)
+    for package, seconds in profiler.by_package()[:top]:
+        print(f"  {seconds * 1000:8.1f}ms  {package}", file=stream)
+
+    loaded = [name for name in DEFERRED_PACKAGES if name in sys.modules]
+    deferred = [name for name in DEFERRED_PACKAGES if name not in sys.modules]
+    print(f"\n첫 사용 시 로드 (시작 시 불러오지 않음): {', '.join(deferred) or '없음'}", file=stream)
+    if loaded:
+        print(f"⚠️ 시작 시 불러온 무거운 패키지: {', '.join(loaded)}", file=stream)
+
+    if total_ms > budget_ms:
+        print(f"\n⚠️ 시작 시간 예산을 {total_ms - budget_ms:.1f}ms 초과했습니다.", file=stream)
+        return 1
+    return 0
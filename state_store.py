@@ -0,0 +1,166 @@
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import MutableMapping
+from config import Config
+from stock_state import OptionMatrix
+import logging
+
+logger = logging.getLogger(__name__)
+
+class StockStateStore(MutableMapping):
+    """URL별 마지막 재고 상태를 SQLite(WAL)에 보관하는 딕셔너리형 저장소입니다.
+
+    StockChecker.previous_states 대신 사용하면 재시작 후에도 이전 상태와 비교를 이어가므로
+    모든 URL에 초기 알림을 다시 보내지 않습니다. 상태는 처음 조회될 때 URL 단위로 읽어 오고,
+    변경 사항은 메모리에 모았다가 flush_interval마다(또는 flush_batch개가 쌓이면) 한 트랜잭션으로 기록합니다.
+    """
+
+    def __init__(self, path=None, flush_interval=None, flush_batch=None):
+        self.path = path or Config.STATE_DB_PATH
+        self.flush_interval = flush_interval or Config.STATE_FLUSH_INTERVAL
+        self.flush_batch = flush_batch or Config.STATE_FLUSH_BATCH
+        self._cache = {}  # 읽었거나 기록한 상태 (url -> 상태)
+        self._missing = set()  # DB에 없다고 확인된 URL
+        self._dirty = {}  # 기록 대기 (url -> 상태, 삭제는 None)
+        self._lock = threading.RLock()
+        self._flush_event = threading.Event()
+        self._closed = False
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stock_states ("
+            "url TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        self._thread = threading.Thread(target=self._run, name='state-store-flusher', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __getitem__(self, url):
+        with self._lock:
+            if url in self._cache:
+                return self._cache[url]
+            if url in self._missing or url in self._dirty:
+                raise KeyError(url)
+
+            row = self._conn.execute("SELECT data FROM stock_states WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                self._missing.add(url)
+                raise KeyError(url)
+
+            status = _decode_status(row[0])
+            self._cache[url] = status
+            return status
+
+    def __setitem__(self, url, status):
+        with self._lock:
+            self._cache[url] = status
+            self._missing.discard(url)
+            self._dirty[url] = status
+            pending = len(self._dirty)
+        if pending >= self.flush_batch:
+            self._flush_event.set()
+
+    def __delitem__(self, url):
+        with self._lock:
+            if url not in self:
+                raise KeyError(url)
+            self._cache.pop(url, None)
+            self._missing.add(url)
+            self._dirty[url] = None
+
+    def __contains__(self, url):
+        try:
+            self[url]
+            return True
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        self.flush()
+        with self._lock:
+            urls = [row[0] for row in self._conn.execute("SELECT url FROM stock_states")]
+        return iter(urls)
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM stock_states").fetchone()[0]
+
+    def flush(self):
+        """대기 중인 변경 사항을 한 트랜잭션으로 기록합니다."""
+        with self._lock:
+            if not self._dirty or self._closed:
+                return 0
+            dirty, self._dirty = self._dirty, {}
+
+            now = time.time()
+            upserts = [(url, _encode_status(status), now) for url, status in dirty.items() if status is not None]
+            deletes = [(url,) for url, status in dirty.items() if status is None]
+            try:
+                with self._conn:
+                    if upserts:
+                        self._conn.executemany(
+                            "INSERT OR REPLACE INTO stock_states (url, data, updated_at) VALUES (?, ?, ?)", upserts
+                        )
+                    if deletes:
+                        self._conn.executemany("DELETE FROM stock_states WHERE url = ?", deletes)
+            except sqlite3.Error as e:
+                logger.error(f"재고 상태 저장 실패: {e}")
+                # 실패한 변경은 다음 기록 때 다시 시도 (그 사이 새로 바뀐 값이 우선)
+                dirty.update(self._dirty)
+                self._dirty = dirty
+                return 0
+            return len(dirty)
+
+    def close(self):
+        """남은 변경 사항을 기록하고 DB를 닫습니다."""
+        if self._closed:
+            return
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._flush_event.set()
+            self._conn.close()
+
+    def _run(self):
+        """flush_interval마다 (또는 대기 건수가 많아지면 바로) 변경 사항을 기록합니다."""
+        while not self._closed:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            if not self._closed:
+                self.flush()
+
+def _encode_status(status):
+    """비교에 필요한 항목만 JSON으로 직렬화합니다."""
+    stock_status = status['stock_status']
+    matrix = stock_status.get('matrix')
+    return json.dumps({
+        'url': status.get('url'),
+        'product_name': status.get('product_name'),
+        'website': status.get('website'),
+        'timestamp': status.get('timestamp'),
+        'stock_status': {
+            'is_available': stock_status['is_available'],
+            'out_of_stock_options': stock_status['out_of_stock_options'],
+            'matrix': matrix.to_compact() if matrix is not None else None
+        }
+    }, ensure_ascii=False)
+
+def _decode_status(data):
+    """_encode_status()로 저장한 상태를 체크 결과 형식으로 복원합니다."""
+    status = json.loads(data)
+    stock_status = status['stock_status']
+    stock_status.setdefault('all_options', [])
+    stock_status.setdefault('option_levels', {})
+    if stock_status.get('matrix') is not None:
+        stock_status['matrix'] = OptionMatrix.from_compact(stock_status['matrix'])
+    else:
+        stock_status.pop('matrix', None)
+    return status
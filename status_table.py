@@ -0,0 +1,182 @@
+import tkinter as tk
+from tkinter import ttk
+
+# (열 이름, 제목, 너비, 늘어남 여부)
+COLUMNS = [
+    ('url', 'URL', 260, True),
+    ('product', '상품명', 180, True),
+    ('stock', '재고', 110, False),
+    ('last_check', '마지막 체크', 80, False),
+    ('next_check', '다음 체크', 80, False),
+    ('latency', '응답 시간', 70, False),
+]
+
+def format_status_row(url, url_config, next_check=None):
+    """monitored_urls 항목 하나를 표에 표시할 값 튜플로 변환합니다."""
+    status = url_config.get('status')
+    if status:
+        product_name = status.get('product_name') or '-'
+        stock_status = status.get('stock_status', {})
+        out_of_stock = len(stock_status.get('out_of_stock_options', []))
+        if not stock_status.get('is_available', True):
+            stock_text = "품절"
+        elif out_of_stock:
+            stock_text = f"일부 품절 ({out_of_stock}개)"
+        else:
+            stock_text = "재고 있음"
+    else:
+        # 체크 전에는 일괄 가져오기에서 미리 조회한 상품명이 있으면 표시
+        product_name = url_config.get('product_name') or '-'
+        stock_text = "확인 전"
+
+    last_check = url_config.get('last_check')
+    latency = url_config.get('latency')
+    return (
+        url,
+        product_name,
+        stock_text,
+        last_check.strftime("%H:%M:%S") if last_check else '-',
+        next_check.strftime("%H:%M:%S") if next_check else '-',
+        f"{latency:.2f}초" if latency is not None else '-',
+    )
+
+class StatusTable:
+    """URL별 재고 상태를 보여 주는 가상화된 Treeview 표입니다.
+
+    Treeview에는 화면에 보이는 줄 수만큼의 항목(슬롯)만 만들어 두고, 스크롤하면 슬롯에 표시할
+    URL만 바꿉니다. 줄의 표시 값은 표가 가지고 있지 않고, 슬롯을 그릴 때 row_source(url)로
+    그 줄만 가져옵니다. 따라서 URL이 수천 개여도 갱신할 때 만드는 줄과 Tk 위젯 작업은
+    보이는 줄 수에 비례합니다.
+    """
+
+    def __init__(self, parent, row_source, visible_rows=10):
+        self.row_source = row_source  # row_source(url) -> 표시 값 튜플 (format_status_row 결과)
+        self.visible_rows = visible_rows
+        self._order = []  # 표시 순서의 URL 목록
+        self._index = {}  # url -> self._order 위치
+        self._offset = 0  # 첫 슬롯에 표시 중인 줄 번호
+        self._slot_urls = [None] * visible_rows  # 슬롯별로 표시 중인 URL
+        self._slot_values = [()] * visible_rows  # 슬롯별로 표시 중인 값 (바뀐 슬롯만 다시 쓰기 위해)
+        self.selected_url = None
+
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=[name for name, _, _, _ in COLUMNS],
+                                 show='headings', height=visible_rows, selectmode='browse')
+        for name, heading, width, stretch in COLUMNS:
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width, minwidth=40, stretch=stretch)
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Treeview 자체 스크롤 대신 줄 번호 기준으로 스크롤
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self._slots = [self.tree.insert('', tk.END, values=()) for _ in range(visible_rows)]
+
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)  # Windows, MacOS
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))  # Linux
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+        self._update_scrollbar()
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def __len__(self):
+        return len(self._order)
+
+    def update_rows(self, urls):
+        """표시할 URL 목록을 갱신하고 보이는 슬롯을 다시 그립니다. 다시 쓴 슬롯 수를 반환합니다.
+
+        URL 목록이 같으면 순서 정보는 그대로 두고 보이는 줄의 값만 다시 가져옵니다.
+        """
+        urls = list(urls)
+        if urls != self._order:
+            self._order = urls
+            self._index = {url: index for index, url in enumerate(urls)}
+            if self.selected_url not in self._index:
+                self.selected_url = None
+            self._offset = max(0, min(self._offset, len(urls) - self.visible_rows))
+        return self._render()
+
+    def update_row(self, url):
+        """한 줄만 다시 가져와 그립니다. 화면에 보이고 값이 바뀌었으면 True를 반환합니다."""
+        index = self._index.get(url)
+        if index is None:
+            return False
+        position = index - self._offset
+        if not 0 <= position < self.visible_rows:
+            return False  # 화면 밖의 줄은 스크롤할 때 가져옴
+        return self._write_slot(position, url)
+
+    def scroll(self, lines):
+        """lines만큼 스크롤합니다 (음수면 위로)."""
+        self.scroll_to(self._offset + lines)
+
+    def scroll_to(self, offset):
+        """offset번째 줄이 맨 위에 오도록 스크롤합니다."""
+        offset = max(0, min(int(offset), len(self._order) - self.visible_rows))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _write_slot(self, position, url):
+        """슬롯에 url 줄을 가져와 쓰고, 값이 바뀌었으면 True를 반환합니다."""
+        values = tuple(self.row_source(url)) if url is not None else ()
+        self._slot_urls[position] = url
+        if values == self._slot_values[position]:
+            return False
+        self._slot_values[position] = values
+        self.tree.item(self._slots[position], values=values)
+        return True
+
+    def _render(self):
+        """보이는 슬롯을 현재 위치의 줄로 다시 채우고 다시 쓴 슬롯 수를 반환합니다."""
+        selected_slot = None
+        changed = 0
+        for position, slot in enumerate(self._slots):
+            index = self._offset + position
+            url = self._order[index] if index < len(self._order) else None
+            changed += self._write_slot(position, url)
+            if url is not None and url == self.selected_url:
+                selected_slot = slot
+
+        # 선택한 URL이 화면 밖으로 나가면 선택도 해제 (보이지 않는 줄을 제거 대상으로 남기지 않음)
+        if selected_slot:
+            self.tree.selection_set(selected_slot)
+        else:
+            self.selected_url = None
+            if self.tree.selection():
+                self.tree.selection_remove(self.tree.selection())
+        self._update_scrollbar()
+        return changed
+
+    def _update_scrollbar(self):
+        total = len(self._order)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / total, (self._offset + self.visible_rows) / total)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self.scroll_to(round(float(value) * len(self._order)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll(int(value) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows는 120 단위, MacOS는 작은 정수로 전달됨
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll(-delta * 3 if delta else 0)
+        return "break"
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        url = self._slot_urls[self._slots.index(selection[0])] if selection else None
+        self.selected_url = url
+        if selection and url is None:
+            # 빈 슬롯을 누르면 선택 해제
+            self.tree.selection_remove(selection)
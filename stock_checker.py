@@ -1,20 +1,47 @@
-import requests
-from bs4 import BeautifulSoup
 import re
+import hashlib
+import threading
 from urllib.parse import urlparse
 from config import Config
+from browser_pool import BrowserPool
+from stock_state import OptionMatrixBuilder
+from metrics import MetricsSink
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 변경 여부 판단에 사용할 페이지 영역 (상품명과 옵션 select)
+STOCK_REGION_PATTERN = re.compile(rb'<select\b.*?</select>|<h1\b.*?</h1>|<title\b.*?</title>', re.IGNORECASE | re.DOTALL)
+
 class StockChecker:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        self.previous_states = {}  # 이전 상태 저장
+    def __init__(self, metrics=None, previous_states=None):
+        # requests/bs4는 불러오는 데 시간이 걸려 첫 체크 때 로드 (프로그램 시작 시간 단축)
+        self._session = None  # requests 세션 (처음 사용할 때 생성)
+        self._session_lock = threading.Lock()
+        # 이전 상태 저장 (딕셔너리 또는 StockStateStore 같은 영구 저장소)
+        self.previous_states = {} if previous_states is None else previous_states
+        self.browser_pool = BrowserPool()  # 옵션 선택 시뮬레이션용 브라우저 풀 (필요할 때 생성)
+        self.option2_resolvers = {}  # 웹사이트별 옵션2 HTTP 리졸버 캐시
+        self.page_cache = {}  # URL별 조건부 요청 검증값, 옵션 영역 해시, 마지막 파싱 결과
+        self.metrics = metrics or MetricsSink()  # 단계별 소요 시간 기록 (기본값: 기록 안 함)
+    
+    @property
+    def session(self):
+        """HTTP 세션을 반환합니다. requests는 처음 요청할 때 불러옵니다."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                session = requests.Session()
+                session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                })
+                self._session = session
+            return self._session
+    
+    def close(self):
+        """브라우저 풀 등 체커가 보유한 리소스를 정리합니다."""
+        self.browser_pool.shutdown()
     
     def detect_website(self, url):
         """URL에서 지원하는 웹사이트를 감지합니다."""
@@ -46,37 +73,143 @@ class StockChecker:
         logger.error(f"지원하지 않는 웹사이트: {url} (도메인: {domain})")
         return None, None
     
+    def fetch_product_name(self, url, website_name=None, website_config=None):
+        """상품 페이지를 한 번 조회하여 상품명만 추출합니다 (옵션 재고는 확인하지 않음). 실패하면 None을 반환합니다."""
+        try:
+            if not website_name:
+                website_name, website_config = self.detect_website(url)
+                if not website_name:
+                    return None
+            
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            
+            from html_parsing import make_soup
+            soup = make_soup(response.content, website_config)
+            return self._extract_product_name(soup, website_name)
+        except Exception as e:
+            logger.error(f"상품명 조회 실패: {url}, 오류: {e}")
+            return None
+    
     def check_stock_status(self, url):
         """상품의 품절 상태를 체크합니다."""
         try:
-            website_name, website_config = self.detect_website(url)
+            with self.metrics.timer('detect'):
+                website_name, website_config = self.detect_website(url)
             if not website_name:
                 logger.error(f"지원하지 않는 웹사이트: {url}")
+                self.metrics.increment('stock_checks_total', labels={'result': 'unsupported'})
                 return None
             
-            response = self.session.get(url, timeout=10)
+            cached = self.page_cache.get(url) if Config.CONDITIONAL_FETCH else None
+            
+            with self.metrics.timer('fetch'):
+                response = self.session.get(url, headers=self._conditional_headers(cached), timeout=10)
+            
+            # 304: 서버가 변경 없음을 알려줌 → 파싱과 변화 감지 생략
+            if response.status_code == 304 and cached:
+                logger.info(f"페이지 변경 없음 (304): {url}")
+                self.metrics.increment('stock_checks_total', labels={'result': 'not_modified'})
+                return self._reuse_cached_result(cached)
+            
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # 검증값을 지원하지 않는 서버: 옵션 영역 해시가 같으면 파싱 생략
+            content_hash = self._hash_stock_region(response.content) if Config.CONDITIONAL_FETCH else None
+            if cached and content_hash == cached['content_hash']:
+                logger.info(f"옵션 영역 변경 없음 (해시 일치): {url}")
+                self._store_validators(cached, response)
+                self.metrics.increment('stock_checks_total', labels={'result': 'unchanged'})
+                return self._reuse_cached_result(cached)
             
-            # 상품명 추출
-            product_name = self._extract_product_name(soup, website_name)
+            result = self._parse_product_page(url, website_name, website_config, response.content)
             
-            # 품절 상태 체크
-            stock_status = self._check_stock_availability(soup, website_config, url)
+            if content_hash and self._is_static_result(website_config, result):
+                entry = {'content_hash': content_hash, 'result': result}
+                self._store_validators(entry, response)
+                self.page_cache[url] = entry
+            else:
+                # 옵션2를 동적으로 불러온 결과는 페이지가 같아도 재고가 바뀔 수 있으므로 캐시하지 않음
+                self.page_cache.pop(url, None)
             
-            return {
-                'url': url,
-                'product_name': product_name,
-                'stock_status': stock_status,
-                'website': website_name,
-                'timestamp': self._get_current_timestamp()
-            }
+            self.metrics.increment('stock_checks_total', labels={'result': 'parsed'})
+            return result
             
         except Exception as e:
             logger.error(f"상품 상태 체크 중 오류 발생: {e}")
+            self.metrics.increment('stock_checks_total', labels={'result': 'error'})
             return None
     
+    def _conditional_headers(self, cached):
+        """캐시된 검증값으로 조건부 요청 헤더를 만듭니다."""
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _store_validators(self, entry, response):
+        """응답의 ETag/Last-Modified 값을 캐시 항목에 저장합니다."""
+        entry['etag'] = response.headers.get('ETag')
+        entry['last_modified'] = response.headers.get('Last-Modified')
+    
+    def _hash_stock_region(self, content):
+        """상품명과 옵션 select 영역만 해시합니다. 해당 영역이 없으면 전체 페이지를 해시합니다."""
+        digest = hashlib.sha256()
+        matched = False
+        for match in STOCK_REGION_PATTERN.finditer(content):
+            digest.update(match.group(0))
+            matched = True
+        if not matched:
+            digest.update(content)
+        return digest.hexdigest()
+    
+    def _is_static_result(self, website_config, result):
+        """재고 상태가 페이지 HTML만으로 결정되었는지 확인합니다.
+        
+        다계층 옵션 상품에서 재고가 있는 옵션1이 하나라도 있으면 옵션2를 별도로 불러오므로
+        페이지가 같아도 재고가 바뀔 수 있습니다.
+        """
+        if website_config.get('static_stock_state') or not website_config.get('multi_level_options', False):
+            return True
+        
+        option1_info = result['stock_status']['option_levels'].get('option1')
+        if not option1_info:
+            return True
+        
+        out_of_stock_text = website_config['out_of_stock_text']
+        return all(out_of_stock_text in option1['text'] for option1 in option1_info['options'])
+    
+    def _reuse_cached_result(self, cached):
+        """마지막 파싱 결과를 현재 시각으로 재사용합니다."""
+        result = dict(cached['result'])
+        result['timestamp'] = self._get_current_timestamp()
+        result['content_unchanged'] = True
+        return result
+    
+    def _parse_product_page(self, url, website_name, website_config, content):
+        """가져온 상품 페이지를 파싱하여 재고 상태 결과를 만듭니다."""
+        from html_parsing import make_soup
+        with self.metrics.timer('parse'):
+            soup = make_soup(content, website_config)
+        
+        # 상품명 추출
+        product_name = self._extract_product_name(soup, website_name)
+        
+        # 품절 상태 체크 (옵션 추출, 옵션2 조회 포함)
+        with self.metrics.timer('options'):
+            stock_status = self._check_stock_availability(soup, website_config, url)
+        
+        return {
+            'url': url,
+            'product_name': product_name,
+            'stock_status': stock_status,
+            'website': website_name,
+            'timestamp': self._get_current_timestamp()
+        }
+    
     def _extract_product_name(self, soup, website_name):
         """상품명을 추출합니다."""
         if website_name == 'ownerclan':
@@ -108,6 +241,7 @@ class StockChecker:
             stock_status['option_levels'] = {}
             all_options = []
             out_of_stock_options = []
+            matrix_builder = OptionMatrixBuilder(website_config['out_of_stock_text'])
             
             # 첫 번째 옵션 선택자로 옵션1 찾기
             option1_element = soup.select_one(website_config.get('option1_selector', '#option1'))
@@ -137,10 +271,16 @@ class StockChecker:
                 option2_candidates = soup.select(website_config.get('option2_selector', '#option2'))
                 logger.info(f"옵션2 선택자 '{website_config.get('option2_selector', '#option2')}'로 {len(option2_candidates)}개 요소 발견")
                 
+                # 옵션2 사전 수집: HTTP 엔드포인트 우선, 남은 옵션1은 single_page 모드로 브라우저에서 한 번에 수집
+                prefetched_option2 = {}
+                if url:
+                    prefetched_option2 = self._prefetch_option2(soup, website_config, option1_info['options'], url)
+                
                 # 옵션1의 각 선택지에 대해 순차적으로 체크
                 for option1 in option1_info['options']:
                     option1_text = option1['text']
                     all_options.append(f"option1: {option1_text}")
+                    row = matrix_builder.add_row(option1_text)
                     
                     logger.info(f"옵션1 체크 중: {option1_text}")
                     
@@ -154,7 +294,11 @@ class StockChecker:
                     logger.info(f"옵션1 '{option1_text}' 선택 후 옵션2 체크 시작")
                     
                     # 옵션1 선택 후 옵션2 체크
-                    if url:
+                    if option1_text in prefetched_option2:
+                        option2_status = self._evaluate_option2(
+                            website_config, option1, prefetched_option2[option1_text]
+                        )
+                    elif url:
                         option2_status = self._check_option2_for_option1(
                             soup, website_config, option1, stock_status, url
                         )
@@ -166,6 +310,8 @@ class StockChecker:
                     # 옵션2 결과를 전체 옵션에 추가
                     all_options.extend(option2_status['all_options'])
                     out_of_stock_options.extend(option2_status['out_of_stock_options'])
+                    for option2_text in option2_status.get('option2_texts', []):
+                        matrix_builder.add_cell(row, option2_text)
                     
                     # 옵션2에 품절이 있으면 전체 재고 상태 업데이트
                     if option2_status['out_of_stock_options']:
@@ -174,6 +320,7 @@ class StockChecker:
             
             stock_status['all_options'] = all_options
             stock_status['out_of_stock_options'] = out_of_stock_options
+            stock_status['matrix'] = matrix_builder.build()
             
             return stock_status
             
@@ -182,18 +329,205 @@ class StockChecker:
             # 예외 발생 시 단일 레벨 체크로 폴백
             return self._check_single_level_stock(soup, website_config, stock_status)
     
+    def _prefetch_option2(self, soup, website_config, option1_list, url):
+        """재고가 있는 옵션1들의 옵션2 목록을 미리 수집합니다.
+        
+        사이트에 옵션2 엔드포인트가 설정되어 있으면 브라우저 없이 HTTP로 가져오고,
+        가져오지 못한 옵션1만 single_page 모드일 때 브라우저로 수집합니다.
+        여기서 수집되지 않은 옵션1은 호출 측에서 옵션별 브라우저 방식으로 처리됩니다.
+        """
+        in_stock_option1 = [
+            option1 for option1 in option1_list
+            if website_config['out_of_stock_text'] not in option1['text']
+        ]
+        prefetched = {}
+        
+        resolver = self._get_option2_resolver(website_config)
+        if resolver:
+            for option1 in in_stock_option1:
+                with self.metrics.timer('option2_http'):
+                    option2_info = resolver.resolve(url, soup, option1)
+                if option2_info is not None:
+                    prefetched[option1['text']] = option2_info
+            logger.info(f"  └─ HTTP 엔드포인트로 옵션2 수집: {len(prefetched)}/{len(in_stock_option1)}개 옵션1")
+        
+        remaining = [option1 for option1 in in_stock_option1 if option1['text'] not in prefetched]
+        if remaining and website_config.get('option2_fetch_mode') == 'single_page':
+            with self.metrics.timer('browser'):
+                browser_results = self._enumerate_option2_single_page(website_config, remaining, url)
+            if browser_results:
+                prefetched.update(browser_results)
+        
+        return prefetched
+    
+    def _get_option2_resolver(self, website_config):
+        """웹사이트 설정에 맞는 옵션2 리졸버를 반환합니다 (설정별로 캐시)."""
+        cache_key = website_config.get('base_url')
+        if cache_key not in self.option2_resolvers:
+            from option_resolver import create_option2_resolver
+            self.option2_resolvers[cache_key] = create_option2_resolver(self.session, website_config)
+        return self.option2_resolvers[cache_key]
+    
+    def _enumerate_option2_single_page(self, website_config, option1_list, url):
+        """페이지를 한 번만 로드하고 같은 탭에서 옵션1을 차례로 선택하며 옵션2 목록을 수집합니다.
+        
+        Returns:
+            {옵션1 텍스트: 옵션2 정보} 딕셔너리. 브라우저를 사용할 수 없으면 None을 반환하여
+            옵션별 페이지 로드 방식으로 폴백하게 합니다. 옵션2가 바뀌기를 기다리다 시간이 초과된
+            옵션1은 결과에서 빠지며, 호출 측에서 옵션별 방식으로 체크합니다.
+        """
+        if not option1_list:
+            return {}
+        
+        option1_selector = website_config.get('option1_selector', '#option1')
+        option2_selector = website_config.get('option2_selector', '#option2')
+        wait_timeout = website_config.get('option2_wait_timeout', Config.OPTION2_WAIT_TIMEOUT)
+        
+        try:
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException
+        except ImportError:
+            logger.warning(f"    └─ Selenium이 설치되지 않았습니다. 정적 파싱만 가능합니다.")
+            return None
+        from html_parsing import make_soup
+        
+        results = {}
+        try:
+            logger.info(f"  └─ 단일 페이지 로드로 옵션1 {len(option1_list)}개의 옵션2 수집 중...")
+            
+            with self.browser_pool.session() as browser:
+                driver = browser.driver
+                browser.load(url)
+                
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, option1_selector))
+                )
+                
+                for option1 in option1_list:
+                    option1_text = option1['text']
+                    before = self._snapshot_option2(driver, option2_selector)
+                    
+                    if not self._select_option1_in_browser(driver, option1_selector, option1_text):
+                        logger.warning(f"    └─ 옵션1 '{option1_text}'을(를) 페이지에서 찾을 수 없음")
+                        continue
+                    
+                    # 옵션2가 다시 그려질 때까지 대기 (고정 sleep 대신 명시적 조건)
+                    try:
+                        WebDriverWait(driver, wait_timeout).until(
+                            lambda d: self._has_option2_changed(d, option2_selector, before)
+                        )
+                    except TimeoutException:
+                        # 지금 목록은 이전 옵션1의 것일 수 있으므로 기록하지 않고 옵션별 방식으로 다시 체크
+                        logger.warning(f"    └─ 옵션1 '{option1_text}' 선택 후 옵션2가 {wait_timeout}초 안에 바뀌지 않음, 옵션별 체크로 폴백")
+                        continue
+
+                    option2_html = self._read_option2_html(driver, option2_selector)
+                    if option2_html is None:
+                        results[option1_text] = {'options': [], 'total_count': 0}
+                        continue
+                    
+                    option2_soup = make_soup(option2_html)
+                    results[option1_text] = self._extract_option_info(option2_soup)
+            
+            logger.info(f"  └─ 단일 페이지 옵션2 수집 완료: {len(results)}개 옵션1")
+            return results
+            
+        except Exception as e:
+            logger.error(f"단일 페이지 옵션2 수집 중 오류: {e}")
+            return None
+    
+    def _select_option1_in_browser(self, driver, option1_selector, option1_text):
+        """브라우저에서 텍스트가 일치하는 옵션1을 선택합니다."""
+        from selenium.webdriver.common.by import By
+        
+        option1_select = driver.find_element(By.CSS_SELECTOR, option1_selector)
+        for option in option1_select.find_elements(By.TAG_NAME, 'option'):
+            if option.text == option1_text:
+                option.click()
+                return True
+        return False
+    
+    def _snapshot_option2(self, driver, option2_selector):
+        """옵션2 변화 감지를 위해 현재 요소와 내용을 기록합니다."""
+        from selenium.webdriver.common.by import By
+        
+        elements = driver.find_elements(By.CSS_SELECTOR, option2_selector)
+        if not elements:
+            return {'element': None, 'first_option': None, 'html': None}
+        
+        element = elements[0]
+        options = element.find_elements(By.TAG_NAME, 'option')
+        return {
+            'element': element,
+            'first_option': options[0] if options else None,
+            'html': element.get_attribute('innerHTML')
+        }
+    
+    def _has_option2_changed(self, driver, option2_selector, before):
+        """옵션2 요소가 교체되었거나 내용이 바뀌었는지 확인합니다."""
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import StaleElementReferenceException
+        
+        # 기존 요소가 DOM에서 제거되었으면 옵션2가 다시 그려진 것
+        for stale_candidate in (before['element'], before['first_option']):
+            if stale_candidate is None:
+                continue
+            try:
+                stale_candidate.is_enabled()
+            except StaleElementReferenceException:
+                return True
+        
+        elements = driver.find_elements(By.CSS_SELECTOR, option2_selector)
+        if not elements:
+            return False
+        return elements[0].get_attribute('innerHTML') != before['html']
+    
+    def _read_option2_html(self, driver, option2_selector):
+        """옵션2 요소의 HTML만 가져옵니다 (전체 페이지 소스 대신)."""
+        from selenium.webdriver.common.by import By
+        
+        elements = driver.find_elements(By.CSS_SELECTOR, option2_selector)
+        if not elements:
+            return None
+        return elements[0].get_attribute('outerHTML')
+    
+    def _evaluate_option2(self, website_config, option1, option2_info):
+        """수집된 옵션2 정보로 옵션1 조합별 품절 여부를 판정합니다."""
+        option2_status = {
+            'all_options': [],
+            'out_of_stock_options': [],
+            'option2_texts': []
+        }
+        
+        for option2 in option2_info['options']:
+            option2_text = option2['text']
+            combined_option = f"option1: {option1['text']} + option2: {option2_text}"
+            option2_status['all_options'].append(combined_option)
+            option2_status['option2_texts'].append(option2_text)
+            
+            if website_config['out_of_stock_text'] in option2_text:
+                logger.warning(f"    └─ 옵션2 품절 발견: {option2_text}")
+                option2_status['out_of_stock_options'].append(combined_option)
+        
+        logger.info(f"  └─ 옵션2 체크 완료: {len(option2_status['all_options'])}개 옵션, {len(option2_status['out_of_stock_options'])}개 품절")
+        return option2_status
+    
     def _check_option2_for_option1(self, soup, website_config, option1, stock_status, url):
         """특정 옵션1에 대한 옵션2를 체크합니다."""
         try:
             option2_status = {
                 'all_options': [],
-                'out_of_stock_options': []
+                'out_of_stock_options': [],
+                'option2_texts': []
             }
             
             logger.info(f"  └─ 옵션2 선택자 '{website_config.get('option2_selector', '#option2')}'로 옵션2 탐색 중...")
             
             # 옵션1 선택을 시뮬레이션하여 옵션2 업데이트
-            updated_soup = self._simulate_option1_selection(soup, website_config, option1, url)
+            with self.metrics.timer('browser'):
+                updated_soup = self._simulate_option1_selection(soup, website_config, option1, url)
             
             # 업데이트된 페이지에서 옵션2 찾기
             option2_element = updated_soup.select_one(website_config.get('option2_selector', '#option2'))
@@ -212,6 +546,7 @@ class StockChecker:
                 option2_text = option2['text']
                 combined_option = f"option1: {option1['text']} + option2: {option2_text}"
                 option2_status['all_options'].append(combined_option)
+                option2_status['option2_texts'].append(option2_text)
                 
                 logger.info(f"    └─ 옵션2 체크 중: {option2_text}")
                 
@@ -234,32 +569,17 @@ class StockChecker:
         try:
             logger.info(f"    └─ 옵션1 '{option1['text']}' 선택 시뮬레이션 중...")
             
-            # Selenium을 사용하여 JavaScript 실행
+            # Selenium을 사용하여 JavaScript 실행 (풀에서 재사용 가능한 브라우저 사용)
             try:
-                from selenium import webdriver
                 from selenium.webdriver.common.by import By
                 from selenium.webdriver.support.ui import WebDriverWait
                 from selenium.webdriver.support import expected_conditions as EC
-                from selenium.webdriver.chrome.service import Service
-                from webdriver_manager.chrome import ChromeDriverManager
-                
-                logger.info(f"    └─ Selenium WebDriver 초기화 중...")
-                
-                # Chrome 옵션 설정 (헤드리스 모드)
-                chrome_options = webdriver.ChromeOptions()
-                chrome_options.add_argument('--headless')  # 백그라운드 실행
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--window-size=1920,1080')
                 
-                # WebDriver 초기화
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                
-                try:
+                with self.browser_pool.session() as browser:
+                    driver = browser.driver
+                    
                     # 파라미터로 받은 URL 사용
-                    driver.get(url)
+                    browser.load(url)
                     
                     # 옵션1 선택
                     option1_select = WebDriverWait(driver, 10).until(
@@ -279,15 +599,12 @@ class StockChecker:
                     
                     # 업데이트된 페이지 소스 가져오기
                     updated_html = driver.page_source
-                    from bs4 import BeautifulSoup
-                    updated_soup = BeautifulSoup(updated_html, 'html.parser')
+                    from html_parsing import make_soup
+                    updated_soup = make_soup(updated_html, website_config)
                     
                     logger.info(f"    └─ 옵션1 선택 후 페이지 업데이트 완료")
                     return updated_soup
                     
-                finally:
-                    driver.quit()
-                    
             except ImportError:
                 logger.warning(f"    └─ Selenium이 설치되지 않았습니다. 정적 파싱만 가능합니다.")
                 return soup
@@ -304,7 +621,8 @@ class StockChecker:
         try:
             option2_status = {
                 'all_options': [],
-                'out_of_stock_options': []
+                'out_of_stock_options': [],
+                'option2_texts': []
             }
             
             logger.info(f"    └─ 정적 파싱으로 옵션2 탐색 중...")
@@ -324,6 +642,7 @@ class StockChecker:
                 option2_text = option2['text']
                 combined_option = f"option1: {option1['text']} + option2: {option2_text}"
                 option2_status['all_options'].append(combined_option)
+                option2_status['option2_texts'].append(option2_text)
                 
                 logger.info(f"      └─ 옵션2 체크 중: {option2_text}")
                 
@@ -343,6 +662,9 @@ class StockChecker:
     
     def _check_single_level_stock(self, soup, website_config, stock_status):
         """단일 레벨 옵션의 품절 상태를 체크합니다."""
+        matrix_builder = OptionMatrixBuilder(website_config['out_of_stock_text'], single_level=True)
+        stock_status['matrix'] = matrix_builder.build()
+        
         # .detail04 클래스 내의 select 옵션들을 찾습니다
         detail04 = soup.find('div', class_='detail04')
         if not detail04:
@@ -356,12 +678,14 @@ class StockChecker:
                 option_text = option.get_text(strip=True)
                 if option_text:
                     stock_status['all_options'].append(option_text)
+                    matrix_builder.add_row(option_text)
                     
                     # 품절 옵션 체크
                     if website_config['out_of_stock_text'] in option_text:
                         stock_status['is_available'] = False
                         stock_status['out_of_stock_options'].append(option_text)
         
+        stock_status['matrix'] = matrix_builder.build()
         return stock_status
     
     def _extract_option_info(self, select_element):
@@ -398,18 +722,20 @@ class StockChecker:
         
         previous_status = self.previous_states[url]
         
+        # 다음 비교는 현재 상태 기준 (변화가 있어도 갱신해야 같은 변화를 반복 감지하지 않음)
+        self.previous_states[url] = current_status
+        
         # 재고 상태 변화 감지
         if (previous_status['stock_status']['is_available'] != 
             current_status['stock_status']['is_available']):
             return True
         
-        # 품절 옵션 변화 감지
+        # 품절 옵션 변화 감지 (옵션 비트맵이 있으면 배치가 같을 때 비트 연산으로 비교)
+        previous_matrix = previous_status['stock_status'].get('matrix')
+        current_matrix = current_status['stock_status'].get('matrix')
+        if previous_matrix is not None and current_matrix is not None:
+            return not current_matrix.sold_out_equals(previous_matrix)
+        
         previous_out_of_stock = set(previous_status['stock_status']['out_of_stock_options'])
         current_out_of_stock = set(current_status['stock_status']['out_of_stock_options'])
-        
-        if previous_out_of_stock != current_out_of_stock:
-            return True
-        
-        # 상태 업데이트
-        self.previous_states[url] = current_status
-        return False
+        return previous_out_of_stock != current_out_of_stock
@@ -0,0 +1,120 @@
+from datetime import datetime
+
+# 재고 이벤트 유형
+OPTION_SOLD_OUT = 'option_sold_out'  # 옵션 품절
+OPTION_RESTOCKED = 'option_restocked'  # 옵션 재입고
+OPTION_ADDED = 'option_added'  # 새 옵션 등장
+OPTION_REMOVED = 'option_removed'  # 옵션 사라짐
+PRODUCT_UNAVAILABLE = 'product_unavailable'  # 상품에 품절 옵션이 생김 (is_available True → False)
+PRODUCT_AVAILABLE = 'product_available'  # 상품의 품절 옵션이 모두 해소됨 (is_available False → True)
+
+EVENT_TYPES = (
+    PRODUCT_UNAVAILABLE, PRODUCT_AVAILABLE,
+    OPTION_SOLD_OUT, OPTION_RESTOCKED, OPTION_ADDED, OPTION_REMOVED
+)
+
+# 로그/메일에 표시할 이벤트 이름
+EVENT_LABELS = {
+    OPTION_SOLD_OUT: '품절',
+    OPTION_RESTOCKED: '재입고',
+    OPTION_ADDED: '옵션 추가',
+    OPTION_REMOVED: '옵션 삭제',
+    PRODUCT_UNAVAILABLE: '상품 품절 발생',
+    PRODUCT_AVAILABLE: '상품 품절 해소'
+}
+
+# 메일 본문에 표시할 이벤트 아이콘
+EVENT_ICONS = {
+    OPTION_SOLD_OUT: '❌',
+    OPTION_RESTOCKED: '✅',
+    OPTION_ADDED: '➕',
+    OPTION_REMOVED: '➖',
+    PRODUCT_UNAVAILABLE: '⚠️',
+    PRODUCT_AVAILABLE: '🎉'
+}
+
+# OptionMatrix.diff() 결과 키 -> 이벤트 유형
+DIFF_EVENT_TYPES = (
+    ('sold_out', OPTION_SOLD_OUT),
+    ('restocked', OPTION_RESTOCKED),
+    ('added', OPTION_ADDED),
+    ('removed', OPTION_REMOVED)
+)
+
+class StockEvent:
+    """상품 하나에서 발생한 재고 변화 이벤트입니다."""
+
+    __slots__ = ('type', 'url', 'product_name', 'option', 'timestamp')
+
+    def __init__(self, event_type, url, product_name, option=None, timestamp=None):
+        self.type = event_type
+        self.url = url
+        self.product_name = product_name
+        self.option = option  # 옵션 라벨 (상품 단위 이벤트는 None)
+        self.timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def __repr__(self):
+        return f"StockEvent({self.type!r}, {self.option or self.product_name!r})"
+
+    def describe(self):
+        """사람이 읽을 수 있는 한 줄 설명을 반환합니다."""
+        label = EVENT_LABELS.get(self.type, self.type)
+        if self.option:
+            return f"[{label}] {self.product_name} - {self.option}"
+        return f"[{label}] {self.product_name}"
+
+    def to_dict(self):
+        """JSON으로 저장/전달할 수 있는 딕셔너리로 변환합니다."""
+        return {
+            'type': self.type,
+            'url': self.url,
+            'product_name': self.product_name,
+            'option': self.option,
+            'timestamp': self.timestamp
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict()로 만든 딕셔너리에서 복원합니다."""
+        return cls(data['type'], data['url'], data['product_name'], data.get('option'), data.get('timestamp'))
+
+def compute_stock_events(previous_status, current_status):
+    """이전/현재 체크 결과를 비교하여 재고 이벤트 목록을 반환합니다.
+
+    두 결과에 옵션 비트맵(stock_status['matrix'])이 있으면 비트맵 차이로 계산하고,
+    없으면 품절 옵션 목록을 비교합니다 (이 경우 옵션 추가/삭제는 알 수 없음).
+    """
+    if not previous_status:
+        return []
+
+    url = current_status.get('url')
+    product_name = current_status.get('product_name')
+    timestamp = current_status.get('timestamp')
+    previous_stock = previous_status['stock_status']
+    current_stock = current_status['stock_status']
+    events = []
+
+    if previous_stock['is_available'] and not current_stock['is_available']:
+        events.append(StockEvent(PRODUCT_UNAVAILABLE, url, product_name, timestamp=timestamp))
+    elif not previous_stock['is_available'] and current_stock['is_available']:
+        events.append(StockEvent(PRODUCT_AVAILABLE, url, product_name, timestamp=timestamp))
+
+    previous_matrix = previous_stock.get('matrix')
+    current_matrix = current_stock.get('matrix')
+    if previous_matrix is not None and current_matrix is not None:
+        changes = current_matrix.diff(previous_matrix)
+    else:
+        previous_out_of_stock = previous_stock['out_of_stock_options']
+        current_out_of_stock = current_stock['out_of_stock_options']
+        previous_set = set(previous_out_of_stock)
+        current_set = set(current_out_of_stock)
+        changes = {
+            'sold_out': [option for option in current_out_of_stock if option not in previous_set],
+            'restocked': [option for option in previous_out_of_stock if option not in current_set]
+        }
+
+    for key, event_type in DIFF_EVENT_TYPES:
+        for option in changes.get(key, ()):
+            events.append(StockEvent(event_type, url, product_name, option, timestamp))
+
+    return events
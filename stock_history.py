@@ -0,0 +1,344 @@
+import atexit
+import sqlite3
+import threading
+import time
+from config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 옵션 상태 값
+STATE_AVAILABLE = 0
+STATE_SOLD_OUT = 1
+STATE_ABSENT = 2  # 페이지에서 옵션이 사라짐
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    url TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS options (
+    id INTEGER PRIMARY KEY,
+    product_id INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    UNIQUE (product_id, label)
+);
+CREATE TABLE IF NOT EXISTS transitions (
+    option_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    state INTEGER NOT NULL,
+    PRIMARY KEY (option_id, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    product_id INTEGER NOT NULL,
+    start_ts INTEGER NOT NULL,
+    end_ts INTEGER NOT NULL,
+    checks INTEGER NOT NULL,
+    PRIMARY KEY (product_id, start_ts)
+) WITHOUT ROWID;
+"""
+
+class StockHistory:
+    """상품 옵션별 재고 이력을 변화가 있을 때만 기록하는 시계열 저장소입니다.
+
+    옵션 상태는 바뀐 시각만 transitions에 기록하고(런 길이 인코딩), 체크가 이어진 구간은
+    coverage에 (시작, 끝, 체크 수)로 묶어 둡니다. 같은 상태가 계속되는 체크는 메모리에서
+    구간 끝만 늘렸다가 flush_interval마다 기록하므로, 매분 체크해도 디스크 쓰기는 변화 횟수에 비례합니다.
+    """
+
+    def __init__(self, path=None, flush_interval=None, retention_days=None):
+        self.path = path or Config.HISTORY_DB_PATH
+        self.flush_interval = flush_interval or Config.HISTORY_FLUSH_INTERVAL
+        self.retention_days = Config.HISTORY_RETENTION_DAYS if retention_days is None else retention_days
+        self._lock = threading.RLock()
+        self._product_ids = {}  # url -> product id
+        self._option_ids = {}  # (product id, 라벨) -> option id
+        self._last_states = {}  # product id -> {option id: 상태} (처음 기록할 때 DB에서 불러옴)
+        self._coverage = {}  # product id -> [start_ts, end_ts, checks, 변경 여부]
+        self._closed = False
+        self._stop_event = threading.Event()
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self._thread = threading.Thread(target=self._run, name='stock-history-flusher', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, url, status, interval_seconds=None, timestamp=None):
+        """체크 결과를 기록합니다. 옵션 상태가 바뀐 경우에만 transitions에 새 행을 씁니다.
+
+        Args:
+            url: 상품 URL
+            status: StockChecker.check_stock_status() 결과
+            interval_seconds: 체크 간격 (이보다 충분히 오래 체크가 없으면 coverage 구간을 끊음)
+            timestamp: 체크 시각 (epoch 초, 기본값: 현재)
+        """
+        ts = int(timestamp if timestamp is not None else time.time())
+        states = _option_states(status['stock_status'])
+        gap_seconds = max(Config.HISTORY_MIN_GAP_SECONDS, (interval_seconds or 0) * 2.5)
+
+        with self._lock:
+            if self._closed:
+                return 0
+            product_id = self._product_id(url)
+            last_states = self._load_last_states(product_id)
+
+            changes = []
+            seen = set()
+            for label, state in states.items():
+                option_id = self._option_id(product_id, label)
+                seen.add(option_id)
+                if last_states.get(option_id) != state:
+                    changes.append((option_id, ts, state))
+                    last_states[option_id] = state
+            for option_id, state in list(last_states.items()):
+                if option_id not in seen and state != STATE_ABSENT:
+                    changes.append((option_id, ts, STATE_ABSENT))
+                    last_states[option_id] = STATE_ABSENT
+
+            if changes:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO transitions (option_id, ts, state) VALUES (?, ?, ?)", changes
+                    )
+
+            self._extend_coverage(product_id, ts, gap_seconds)
+            return len(changes)
+
+    def availability(self, url, start=None, end=None):
+        """구간 동안 옵션별 재고 유지 비율과 품절 횟수를 반환합니다.
+
+        체크가 이어진 구간(coverage)만 집계하며, 시각은 epoch 초입니다.
+
+        Returns:
+            list: {'option', 'observed_seconds', 'available_seconds', 'sold_out_seconds',
+                   'availability', 'sold_out_count'} 목록
+        """
+        end = int(end if end is not None else time.time())
+        start = int(start if start is not None else 0)
+        self.flush()
+
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM products WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return []
+            product_id = row[0]
+            intervals = self._conn.execute(
+                "SELECT start_ts, end_ts FROM coverage WHERE product_id = ? AND end_ts >= ? AND start_ts <= ? "
+                "ORDER BY start_ts", (product_id, start, end)
+            ).fetchall()
+            options = self._conn.execute(
+                "SELECT id, label FROM options WHERE product_id = ? ORDER BY id", (product_id,)
+            ).fetchall()
+
+            results = []
+            for option_id, label in options:
+                initial = self._conn.execute(
+                    "SELECT state FROM transitions WHERE option_id = ? AND ts <= ? ORDER BY ts DESC LIMIT 1",
+                    (option_id, start)
+                ).fetchone()
+                runs = self._conn.execute(
+                    "SELECT ts, state FROM transitions WHERE option_id = ? AND ts > ? AND ts <= ? ORDER BY ts",
+                    (option_id, start, end)
+                ).fetchall()
+                results.append(self._summarize(label, initial[0] if initial else None, runs, intervals, start, end))
+            return results
+
+    def transitions(self, url, start=None, end=None):
+        """구간 안의 옵션 상태 변화 목록 [(시각, 옵션 라벨, 상태)]를 시간순으로 반환합니다."""
+        end = int(end if end is not None else time.time())
+        start = int(start if start is not None else 0)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT t.ts, o.label, t.state FROM transitions t "
+                "JOIN options o ON o.id = t.option_id JOIN products p ON p.id = o.product_id "
+                "WHERE p.url = ? AND t.ts >= ? AND t.ts <= ? ORDER BY t.ts, o.id",
+                (url, start, end)
+            ).fetchall()
+
+    def compact(self, retention_days=None):
+        """보관 기간이 지난 이력을 정리합니다.
+
+        기준 시각 이전의 상태 변화는 옵션별 마지막 상태 하나만 기준 시각으로 옮겨 남기고,
+        기준 시각 이전에 끝난 coverage 구간은 삭제, 걸쳐 있는 구간은 기준 시각부터로 자릅니다.
+        """
+        retention_days = self.retention_days if retention_days is None else retention_days
+        if not retention_days:
+            return 0
+        cutoff = int(time.time() - retention_days * 86400)
+        self.flush()
+
+        with self._lock:
+            with self._conn:
+                # 옵션별 기준 시각 이전 마지막 상태 (기준 시각 정각에 이미 기록이 있으면 그 값이 우선)
+                carried = self._conn.execute(
+                    "SELECT t.option_id, t.state FROM transitions t JOIN ("
+                    "  SELECT option_id, MAX(ts) AS ts FROM transitions WHERE ts < ? GROUP BY option_id"
+                    ") last ON last.option_id = t.option_id AND last.ts = t.ts", (cutoff,)
+                ).fetchall()
+                deleted = self._conn.execute("DELETE FROM transitions WHERE ts < ?", (cutoff,)).rowcount
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO transitions (option_id, ts, state) VALUES (?, ?, ?)",
+                    [(option_id, cutoff, state) for option_id, state in carried]
+                )
+                self._conn.execute("DELETE FROM coverage WHERE end_ts < ?", (cutoff,))
+                self._conn.execute("UPDATE coverage SET start_ts = ? WHERE start_ts < ?", (cutoff, cutoff))
+
+            for entry in self._coverage.values():
+                entry[0] = max(entry[0], cutoff)
+
+        if deleted:
+            logger.info(f"재고 이력 정리: {retention_days}일 이전 상태 변화 {deleted}건")
+        return deleted
+
+    def flush(self):
+        """메모리에서 늘려 둔 coverage 구간을 기록합니다."""
+        with self._lock:
+            if self._closed:
+                return
+            rows = []
+            for product_id, entry in self._coverage.items():
+                if entry[3]:
+                    rows.append((product_id, entry[0], entry[1], entry[2]))
+                    entry[3] = False
+            if rows:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO coverage (product_id, start_ts, end_ts, checks) VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+
+    def close(self):
+        """남은 기록을 저장하고 DB를 닫습니다."""
+        if self._closed:
+            return
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._stop_event.set()
+            self._conn.close()
+
+    def _run(self):
+        """주기적으로 coverage를 기록하고, 하루에 한 번 보관 기간이 지난 이력을 정리합니다."""
+        last_compact = 0
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+                if time.time() - last_compact >= 86400:
+                    self.compact()
+                    last_compact = time.time()
+            except sqlite3.Error as e:
+                logger.error(f"재고 이력 저장 실패: {e}")
+
+    def _product_id(self, url):
+        product_id = self._product_ids.get(url)
+        if product_id is None:
+            with self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO products (url) VALUES (?)", (url,))
+            product_id = self._conn.execute("SELECT id FROM products WHERE url = ?", (url,)).fetchone()[0]
+            self._product_ids[url] = product_id
+        return product_id
+
+    def _option_id(self, product_id, label):
+        key = (product_id, label)
+        option_id = self._option_ids.get(key)
+        if option_id is None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO options (product_id, label) VALUES (?, ?)", (product_id, label)
+                )
+            option_id = self._conn.execute(
+                "SELECT id FROM options WHERE product_id = ? AND label = ?", (product_id, label)
+            ).fetchone()[0]
+            self._option_ids[key] = option_id
+        return option_id
+
+    def _load_last_states(self, product_id):
+        """상품의 옵션별 마지막 상태를 반환합니다 (처음이면 DB에서 불러옴)."""
+        last_states = self._last_states.get(product_id)
+        if last_states is None:
+            rows = self._conn.execute(
+                "SELECT o.id, o.label, ("
+                "  SELECT state FROM transitions t WHERE t.option_id = o.id ORDER BY ts DESC LIMIT 1"
+                ") FROM options o WHERE o.product_id = ?", (product_id,)
+            ).fetchall()
+            last_states = {}
+            for option_id, label, state in rows:
+                self._option_ids[(product_id, label)] = option_id
+                if state is not None:
+                    last_states[option_id] = state
+            self._last_states[product_id] = last_states
+        return last_states
+
+    def _extend_coverage(self, product_id, ts, gap_seconds):
+        entry = self._coverage.get(product_id)
+        if entry is None:
+            row = self._conn.execute(
+                "SELECT start_ts, end_ts, checks FROM coverage WHERE product_id = ? ORDER BY start_ts DESC LIMIT 1",
+                (product_id,)
+            ).fetchone()
+            entry = [row[0], row[1], row[2], False] if row else None
+
+        if entry is None or ts - entry[1] > gap_seconds:
+            # 체크가 끊겼던 구간은 집계에서 제외되도록 새 구간 시작
+            if entry is not None and entry[3]:
+                self.flush()
+            entry = [ts, ts, 0, True]
+
+        entry[1] = max(entry[1], ts)
+        entry[2] += 1
+        entry[3] = True
+        self._coverage[product_id] = entry
+
+    def _summarize(self, label, initial_state, runs, intervals, start, end):
+        """옵션 하나의 상태 변화와 coverage 구간을 겹쳐 상태별 시간을 계산합니다."""
+        # 상태 구간 [(시작, 끝, 상태)]
+        segments = []
+        state = initial_state
+        cursor = start
+        sold_out_count = 0
+        for ts, new_state in runs:
+            if state is not None:
+                segments.append((cursor, ts, state))
+            if new_state == STATE_SOLD_OUT and state != STATE_SOLD_OUT:
+                sold_out_count += 1
+            state = new_state
+            cursor = ts
+        if state is not None:
+            segments.append((cursor, end, state))
+
+        seconds = {STATE_AVAILABLE: 0, STATE_SOLD_OUT: 0, STATE_ABSENT: 0}
+        for segment_start, segment_end, segment_state in segments:
+            for interval_start, interval_end in intervals:
+                overlap = min(segment_end, interval_end, end) - max(segment_start, interval_start, start)
+                if overlap > 0:
+                    seconds[segment_state] += overlap
+
+        observed = seconds[STATE_AVAILABLE] + seconds[STATE_SOLD_OUT]
+        return {
+            'option': label,
+            'observed_seconds': observed,
+            'available_seconds': seconds[STATE_AVAILABLE],
+            'sold_out_seconds': seconds[STATE_SOLD_OUT],
+            'availability': seconds[STATE_AVAILABLE] / observed if observed else None,
+            'sold_out_count': sold_out_count
+        }
+
+def _option_states(stock_status):
+    """체크 결과에서 {옵션 라벨: 상태}를 만듭니다. 옵션 비트맵이 있으면 비트맵에서 읽습니다."""
+    matrix = stock_status.get('matrix')
+    if matrix is None:
+        out_of_stock = set(stock_status['out_of_stock_options'])
+        return {
+            option: STATE_SOLD_OUT if option in out_of_stock else STATE_AVAILABLE
+            for option in stock_status['all_options']
+        }
+
+    return {
+        label: STATE_SOLD_OUT if is_sold_out else STATE_AVAILABLE
+        for label, is_sold_out in matrix.option_states().items()
+    }
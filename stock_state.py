@@ -0,0 +1,233 @@
+import re
+import sys
+
+# 품절 문구를 지운 뒤 남는 빈 괄호 (예: "빨강 (품절)" → "빨강 ()")
+EMPTY_BRACKETS_PATTERN = re.compile(r'[\(\[\{<]\s*[\)\]\}>]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_option_name(text, out_of_stock_text):
+    """옵션 텍스트에서 품절 표시를 지운 이름을 intern하여 반환합니다.
+
+    같은 옵션은 품절 여부와 관계없이 같은 이름이 되므로 상태가 바뀌어도 같은 칸으로 비교됩니다.
+    """
+    name = text.replace(out_of_stock_text, '') if out_of_stock_text else text
+    name = EMPTY_BRACKETS_PATTERN.sub('', name)
+    name = WHITESPACE_PATTERN.sub(' ', name).strip(' -:/,')
+    return sys.intern(name or text)
+
+class OptionMatrix:
+    """상품 하나의 옵션 재고 상태를 (옵션1, 옵션2) 격자의 비트맵으로 표현합니다.
+
+    칸 (r, c)의 비트 위치는 r * len(columns) + c이며, present는 존재하는 조합,
+    sold_out은 품절인 조합, rows_sold_out은 옵션1 자체가 품절인 행을 나타냅니다.
+    비트맵은 파이썬 정수이므로 배치(rows, columns)가 같으면 비교와 차이 계산이
+    워드 단위 비트 연산으로 끝납니다. 옵션 이름은 intern되어 상품 간에 공유됩니다.
+    """
+
+    __slots__ = ('single_level', 'rows', 'columns', 'present', 'sold_out', 'rows_sold_out')
+
+    def __init__(self, rows=(), columns=(), present=0, sold_out=0, rows_sold_out=0, single_level=False):
+        self.single_level = single_level  # 단일 레벨 옵션이면 True (라벨에 "option1:" 접두어 없음)
+        self.rows = tuple(rows)  # 옵션1 이름
+        self.columns = tuple(columns)  # 옵션2 이름 (모든 옵션1에 걸친 합집합)
+        self.present = present
+        self.sold_out = sold_out
+        self.rows_sold_out = rows_sold_out
+
+    def __eq__(self, other):
+        if not isinstance(other, OptionMatrix):
+            return NotImplemented
+        if self.same_layout(other):
+            return (self.present == other.present and self.sold_out == other.sold_out
+                    and self.rows_sold_out == other.rows_sold_out)
+        return self._cell_states() == other._cell_states()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"OptionMatrix(rows={len(self.rows)}, columns={len(self.columns)}, "
+                f"cells={bin(self.present).count('1')}, sold_out={bin(self.sold_out).count('1')})")
+
+    def same_layout(self, other):
+        """옵션1/옵션2 배치가 같은지 확인합니다."""
+        return (self.single_level == other.single_level
+                and self.rows == other.rows and self.columns == other.columns)
+
+    def sold_out_equals(self, other):
+        """품절인 옵션 집합이 같은지 확인합니다. 배치가 같으면 비트맵 비교만 합니다."""
+        if self.same_layout(other):
+            return self.sold_out == other.sold_out and self.rows_sold_out == other.rows_sold_out
+        return self._sold_out_keys() == other._sold_out_keys()
+
+    def diff(self, previous):
+        """이전 상태 대비 변화를 라벨 목록으로 반환합니다.
+
+        Returns:
+            dict: 'sold_out'(새로 품절), 'restocked'(재입고), 'added'(새 옵션), 'removed'(사라진 옵션)
+        """
+        if previous is None:
+            previous = OptionMatrix(single_level=self.single_level)
+
+        if self.same_layout(previous):
+            return self._diff_bits(previous)
+        return self._diff_cells(previous)
+
+    def option_states(self):
+        """{옵션 라벨: 품절 여부}를 반환합니다. 옵션1 행과 (옵션1, 옵션2) 조합이 모두 포함됩니다."""
+        return {self._key_label(key): is_sold_out for key, is_sold_out in self._cell_states().items()}
+
+    def to_compact(self):
+        """JSON으로 저장할 수 있는 압축 형식으로 변환합니다."""
+        compact = {
+            'r': list(self.rows),
+            'c': list(self.columns),
+            'p': format(self.present, 'x'),
+            's': format(self.sold_out, 'x'),
+            'rs': format(self.rows_sold_out, 'x')
+        }
+        if self.single_level:
+            compact['single'] = True
+        return compact
+
+    @classmethod
+    def from_compact(cls, compact):
+        """to_compact()로 만든 형식에서 복원합니다."""
+        return cls(
+            rows=(sys.intern(name) for name in compact['r']),
+            columns=(sys.intern(name) for name in compact['c']),
+            present=int(compact['p'], 16),
+            sold_out=int(compact['s'], 16),
+            rows_sold_out=int(compact['rs'], 16),
+            single_level=compact.get('single', False)
+        )
+
+    def label(self, row, column=None):
+        """칸(또는 행)의 표시용 라벨을 반환합니다."""
+        if self.single_level:
+            return self.rows[row]
+        if column is None:
+            return f"option1: {self.rows[row]}"
+        return f"option1: {self.rows[row]} + option2: {self.columns[column]}"
+
+    def _diff_bits(self, previous):
+        both = self.present & previous.present
+        width = len(self.columns)
+
+        # 옵션1이 품절/재입고되어 옵션2 조합이 함께 사라지거나 생긴 칸은 추가/삭제로 보지 않음
+        toggled_rows = self.rows_sold_out ^ previous.rows_sold_out
+        row_mask = (1 << width) - 1
+        toggled_cells = 0
+        for row in _iter_bits(toggled_rows):
+            toggled_cells |= row_mask << (row * width)
+
+        return {
+            'sold_out': self._row_labels(self.rows_sold_out & toggled_rows)
+                        + self._labels(self.sold_out & ~previous.sold_out & both, width),
+            'restocked': self._row_labels(previous.rows_sold_out & toggled_rows)
+                         + self._labels(previous.sold_out & ~self.sold_out & both, width),
+            'added': self._labels(self.present & ~previous.present & ~toggled_cells, width),
+            'removed': previous._labels(previous.present & ~self.present & ~toggled_cells, width)
+        }
+
+    def _diff_cells(self, previous):
+        current_cells = self._cell_states()
+        previous_cells = previous._cell_states()
+        result = {'sold_out': [], 'restocked': [], 'added': [], 'removed': []}
+
+        # 품절 여부가 바뀐 옵션1 행 (해당 행의 옵션2 조합 증감은 추가/삭제로 보지 않음)
+        toggled_rows = {
+            key[0] for key, is_sold_out in current_cells.items()
+            if key[1] is None and key in previous_cells and previous_cells[key] != is_sold_out
+        }
+
+        for key, is_sold_out in current_cells.items():
+            was_sold_out = previous_cells.get(key)
+            if was_sold_out is None:
+                if key[1] is None or key[0] not in toggled_rows:
+                    result['added'].append(self._key_label(key))
+            elif is_sold_out and not was_sold_out:
+                result['sold_out'].append(self._key_label(key))
+            elif was_sold_out and not is_sold_out:
+                result['restocked'].append(self._key_label(key))
+
+        for key in previous_cells:
+            if key not in current_cells and (key[1] is None or key[0] not in toggled_rows):
+                result['removed'].append(previous._key_label(key))
+        return result
+
+    def _cell_states(self):
+        """{(옵션1 이름, 옵션2 이름 또는 None): 품절 여부}를 반환합니다. None은 옵션1 행 자체입니다."""
+        states = {}
+        for row, name in enumerate(self.rows):
+            states[(name, None)] = bool(self.rows_sold_out >> row & 1)
+
+        width = len(self.columns)
+        for bit in _iter_bits(self.present):
+            row, column = divmod(bit, width)
+            states[(self.rows[row], self.columns[column])] = bool(self.sold_out >> bit & 1)
+        return states
+
+    def _sold_out_keys(self):
+        return {key for key, is_sold_out in self._cell_states().items() if is_sold_out}
+
+    def _key_label(self, key):
+        row_name, column_name = key
+        if self.single_level:
+            return row_name
+        if column_name is None:
+            return f"option1: {row_name}"
+        return f"option1: {row_name} + option2: {column_name}"
+
+    def _labels(self, bits, width):
+        return [self.label(*divmod(bit, width)) for bit in _iter_bits(bits)]
+
+    def _row_labels(self, bits):
+        return [self.label(row) for row in _iter_bits(bits)]
+
+class OptionMatrixBuilder:
+    """옵션을 하나씩 추가하며 OptionMatrix를 만듭니다."""
+
+    def __init__(self, out_of_stock_text, single_level=False):
+        self.out_of_stock_text = out_of_stock_text
+        self.single_level = single_level
+        self._rows = {}  # 옵션1 이름 -> 행 번호
+        self._columns = {}  # 옵션2 이름 -> 열 번호
+        self._rows_sold_out = 0
+        self._cells = []  # (행, 열, 품절 여부)
+
+    def add_row(self, option1_text):
+        """옵션1을 추가하고 행 번호를 반환합니다."""
+        name = normalize_option_name(option1_text, self.out_of_stock_text)
+        row = self._rows.setdefault(name, len(self._rows))
+        if self.out_of_stock_text in option1_text:
+            self._rows_sold_out |= 1 << row
+        return row
+
+    def add_cell(self, row, option2_text):
+        """행에 옵션2 조합을 추가합니다."""
+        name = normalize_option_name(option2_text, self.out_of_stock_text)
+        column = self._columns.setdefault(name, len(self._columns))
+        self._cells.append((row, column, self.out_of_stock_text in option2_text))
+
+    def build(self):
+        width = len(self._columns)
+        present = 0
+        sold_out = 0
+        for row, column, is_sold_out in self._cells:
+            bit = 1 << (row * width + column)
+            present |= bit
+            if is_sold_out:
+                sold_out |= bit
+
+        return OptionMatrix(
+            rows=self._rows, columns=self._columns,
+            present=present, sold_out=sold_out, rows_sold_out=self._rows_sold_out,
+            single_level=self.single_level
+        )
+
+def _iter_bits(bits):
+    """정수 비트맵에서 켜진 비트 위치를 낮은 순서대로 반환합니다."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
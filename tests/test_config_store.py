@@ -0,0 +1,118 @@
+import json
+import os
+
+import pytest
+
+from config_store import ConfigStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'config.json')
+
+
+def _url(interval, email):
+    return {'interval': interval, 'receiver_email': email}
+
+
+def test_load_missing_file_returns_empty_config(path):
+    store = ConfigStore(path)
+    assert not store.exists()
+    assert store.load() == {'receiver_email': '', 'monitored_urls': {}}
+
+
+def test_save_writes_settings_only(path):
+    store = ConfigStore(path)
+    monitored = {'https://a.com/1': dict(_url(5, 'a@example.com'), status={'x': 1}, last_check=object())}
+    assert store.save('me@example.com', monitored)
+
+    with open(path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved == {'receiver_email': 'me@example.com', 'monitored_urls': {'https://a.com/1': _url(5, 'a@example.com')}}
+    assert not os.path.exists(store.journal_path)
+
+
+def test_journal_replay(path):
+    store = ConfigStore(path)
+    store.save('me@example.com', {'https://a.com/1': _url(5, 'a@example.com')})
+    assert store.set_url('https://a.com/2', 1, 'b@example.com')
+    assert store.remove_url('https://a.com/1')
+    assert store.set_receiver_email('new@example.com')
+    assert os.path.exists(store.journal_path)
+
+    loaded = ConfigStore(path).load()
+    assert loaded == {'receiver_email': 'new@example.com', 'monitored_urls': {'https://a.com/2': _url(1, 'b@example.com')}}
+
+
+def test_compaction_after_threshold(path):
+    store = ConfigStore(path, compact_threshold=3)
+    for index in range(5):
+        assert store.set_url(f'https://a.com/{index}', index + 1, 'a@example.com')
+
+    # 3줄을 넘기면 설정 파일을 다시 쓰고 기록을 비운 뒤 이어서 기록
+    with open(store.journal_path, encoding='utf-8') as f:
+        assert len(f.readlines()) == 1
+    assert len(ConfigStore(path).load()['monitored_urls']) == 5
+
+
+def test_truncated_journal_line_is_skipped_and_compacted(path):
+    store = ConfigStore(path)
+    store.set_url('https://a.com/1', 5, 'a@example.com')
+    with open(store.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "set", "url": "https://a.com/2"')
+
+    reloaded = ConfigStore(path)
+    assert list(reloaded.load()['monitored_urls']) == ['https://a.com/1']
+    assert not os.path.exists(reloaded.journal_path)
+    assert reloaded.set_url('https://a.com/3', 5, 'a@example.com')
+    assert list(ConfigStore(path).load()['monitored_urls']) == ['https://a.com/1', 'https://a.com/3']
+
+
+def test_read_only_load_does_not_compact(path):
+    store = ConfigStore(path)
+    store.set_url('https://a.com/1', 5, 'a@example.com')
+    with open(store.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "se')
+    with open(store.journal_path, encoding='utf-8') as f:
+        journal = f.read()
+
+    reader = ConfigStore(path, read_only=True)
+    assert list(reader.load()['monitored_urls']) == ['https://a.com/1']
+    with open(store.journal_path, encoding='utf-8') as f:
+        assert f.read() == journal
+    assert not reader.set_url('https://a.com/2', 5, 'a@example.com')
+    assert not reader.save('me@example.com', {})
+
+
+def test_unreadable_file_is_backed_up_before_overwrite(path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{broken')
+
+    store = ConfigStore(path)
+    assert store.load() is None
+    assert not store.set_url('https://a.com/1', 5, 'a@example.com')
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == '{broken'
+
+    assert store.save('me@example.com', {'https://a.com/2': _url(1, 'b@example.com')})
+    with open(store.backup_path, encoding='utf-8') as f:
+        assert f.read() == '{broken'
+    assert list(ConfigStore(path).load()['monitored_urls']) == ['https://a.com/2']
+
+
+def test_bad_intervals_are_not_loaded(path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'receiver_email': '', 'monitored_urls': {
+            'https://a.com/1': _url(0, 'a@example.com'),
+            'https://a.com/2': _url('nan', 'a@example.com'),
+            'https://a.com/3': _url(5, 'a@example.com'),
+        }}, f)
+    store = ConfigStore(path)
+    with open(store.journal_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'op': 'set', 'url': 'https://a.com/4', 'interval': -1, 'receiver_email': 'a@example.com'}) + '\n')
+        f.write(json.dumps({'op': 'set', 'url': 'https://a.com/5', 'interval': True, 'receiver_email': 'a@example.com'}) + '\n')
+
+    assert ConfigStore(path, read_only=True).load()['monitored_urls'] == {'https://a.com/3': _url(5, 'a@example.com')}
+    # 잘못된 기록은 손상된 줄로 보고 정리
+    assert list(store.load()['monitored_urls']) == ['https://a.com/3']
+    assert not os.path.exists(store.journal_path)
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from scheduler import CheckScheduler
+
+
+def test_staggered_first_checks_spread_over_interval():
+    scheduler = CheckScheduler(lambda url: None, jitter_ratio=0)
+    scheduler.add_staggered((f'https://a.com/{index}', 60) for index in range(4))
+    times = scheduler.next_check_times()
+    ordered = sorted(times, key=times.get)
+    assert ordered == [f'https://a.com/{index}' for index in range(4)]
+    gaps = [(times[later] - times[earlier]).total_seconds() for earlier, later in zip(ordered, ordered[1:])]
+    assert all(abs(gap - 15) < 1 for gap in gaps)
+
+
+def test_remove_and_readd_replaces_schedule():
+    scheduler = CheckScheduler(lambda url: None, jitter_ratio=0)
+    scheduler.add('https://a.com/1', 60)
+    scheduler.add('https://a.com/1', 600)
+    assert len(scheduler.next_check_times()) == 1
+    assert scheduler.remove('https://a.com/1')
+    assert not scheduler.remove('https://a.com/1')
+    assert scheduler.next_check_time() is None
+    assert scheduler.next_check_times() == {}
+
+
+def test_dispatches_due_urls_and_reschedules():
+    dispatched = []
+    done = threading.Event()
+
+    def dispatch(url):
+        dispatched.append(url)
+        if len(dispatched) >= 3:
+            done.set()
+
+    scheduler = CheckScheduler(dispatch, jitter_ratio=0)
+    scheduler.add('https://a.com/1', 0.05, delay_seconds=0)
+    scheduler.add('https://a.com/2', 3600)
+    scheduler.start()
+    try:
+        assert done.wait(2)
+    finally:
+        scheduler.stop()
+    assert set(dispatched) == {'https://a.com/1'}
+
+
+@pytest.mark.parametrize('interval', [0, -1, float('nan'), float('inf'), True, '60'])
+def test_rejects_bad_intervals(interval):
+    scheduler = CheckScheduler(lambda url: None, jitter_ratio=0)
+    with pytest.raises(ValueError):
+        scheduler.add('https://a.com/1', interval, 0)
+    with pytest.raises(ValueError):
+        scheduler.add_staggered([('https://a.com/2', 60), ('https://a.com/3', interval)])
+    assert scheduler.next_check_times() == {}
+
+
+def test_stop_returns_while_many_urls_are_due():
+    dispatched = threading.Event()
+    scheduler = CheckScheduler(lambda url: dispatched.set(), jitter_ratio=0.5)
+    for index in range(100):
+        scheduler.add(f'https://a.com/{index}', 0.001, 0)
+    scheduler.start()
+    assert dispatched.wait(2)
+    stopper = threading.Thread(target=scheduler.stop)
+    stopper.start()
+    stopper.join(2)
+    assert not stopper.is_alive()
@@ -0,0 +1,98 @@
+import json
+import math
+
+import pytest
+
+from url_import import detect_format, export_url_list, format_import_summary, parse_url_list
+
+
+def test_detect_format():
+    assert detect_format('', 'urls.JSON') == 'json'
+    assert detect_format('[]') == 'json'
+    assert detect_format('url,interval\nhttps://a.com') == 'csv'
+    assert detect_format('https://a.com\nhttps://b.com') == 'txt'
+
+
+def test_txt_skips_blank_and_comment_lines():
+    entries, errors = parse_url_list('https://a.com/1\n\n# 메모\n  https://a.com/2  \n', 'txt')
+    assert errors == []
+    assert [(entry['line'], entry['url']) for entry in entries] == [(1, 'https://a.com/1'), (4, 'https://a.com/2')]
+
+
+def test_csv_without_header_uses_column_positions():
+    entries, errors = parse_url_list('https://a.com/1,5,a@example.com\nhttps://a.com/2\n', 'csv')
+    assert errors == []
+    assert entries[0] == {'line': 1, 'url': 'https://a.com/1', 'interval': 5, 'receiver_email': 'a@example.com'}
+    assert entries[1] == {'line': 2, 'url': 'https://a.com/2', 'interval': None, 'receiver_email': None}
+
+
+def test_csv_header_finds_columns_by_name():
+    text = 'receiver_email\tURL\tinterval\nb@example.com\thttps://a.com/1\t0.5\n'
+    entries, errors = parse_url_list(text, 'csv')
+    assert errors == []
+    assert entries == [{'line': 2, 'url': 'https://a.com/1', 'interval': 0.5, 'receiver_email': 'b@example.com'}]
+
+
+def test_csv_header_without_url_column():
+    entries, errors = parse_url_list('address,interval\nhttps://a.com/1,5\n', 'csv')
+    assert entries == []
+    assert errors[0][0] == 1
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-inf', '1e400', '0', '-1', 'abc', '1e12'])
+def test_csv_rejects_bad_intervals(value):
+    entries, errors = parse_url_list(f'url,interval\nhttps://ownerclan.com/x,{value}\n', 'csv')
+    assert entries == []
+    assert [line for line, _ in errors] == [2]
+
+
+@pytest.mark.parametrize('value', [True, False, 'nan', float('inf'), [1], {'minutes': 1}])
+def test_json_rejects_bad_intervals(value):
+    text = json.dumps([{'url': 'https://a.com/1', 'interval': value}])
+    entries, errors = parse_url_list(text, 'json')
+    assert entries == []
+    assert [index for index, _ in errors] == [1]
+
+
+def test_json_shapes():
+    config_shape = json.dumps({'monitored_urls': {'https://a.com/1': {'interval': 5, 'receiver_email': 'a@example.com'}}})
+    entries, errors = parse_url_list(config_shape, 'json')
+    assert errors == []
+    assert entries == [{'line': 1, 'url': 'https://a.com/1', 'interval': 5, 'receiver_email': 'a@example.com'}]
+
+    entries, errors = parse_url_list(json.dumps(['https://a.com/1', {'url': 'https://a.com/2'}, {'name': 'x'}]), 'json')
+    assert [entry['url'] for entry in entries] == ['https://a.com/1', 'https://a.com/2']
+    assert [index for index, _ in errors] == [3]
+
+    assert parse_url_list('{broken', 'json')[1][0][0] == 0
+    assert parse_url_list('"https://a.com"', 'json')[1][0][0] == 0
+
+
+def test_parsed_intervals_are_finite_numbers():
+    entries, _ = parse_url_list('https://a.com/1,2.5\nhttps://a.com/2,10\n', 'csv')
+    assert all(isinstance(entry['interval'], (int, float)) and math.isfinite(entry['interval']) for entry in entries)
+    assert isinstance(entries[1]['interval'], int)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'json', 'txt'])
+def test_export_round_trip(fmt):
+    monitored = {
+        'https://a.com/1': {'interval': 5, 'receiver_email': 'a@example.com', 'status': {'x': 1}},
+        'https://a.com/2': {'interval': 0.5, 'receiver_email': 'b@example.com', 'status': None},
+    }
+    entries, errors = parse_url_list(export_url_list(monitored, fmt), fmt)
+    assert errors == []
+    assert [entry['url'] for entry in entries] == list(monitored)
+    if fmt != 'txt':
+        assert [(entry['interval'], entry['receiver_email']) for entry in entries] == [(5, 'a@example.com'), (0.5, 'b@example.com')]
+
+
+def test_summary_labels_positions():
+    summary = {
+        'total': 2, 'added': 0, 'already_monitored': 0, 'duplicates': 0, 'invalid': 2, 'unsupported': 0,
+        'probed': 0, 'probe_failed': 0, 'errors': [(0, 'JSON 형식 오류'), (3, '잘못된 체크 간격')],
+        'position_label': '항목'
+    }
+    text = format_import_summary(summary)
+    assert '  JSON 형식 오류' in text
+    assert '3번째 항목: 잘못된 체크 간격' in text
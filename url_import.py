@@ -0,0 +1,216 @@
+"""
+URL 목록 일괄 가져오기/내보내기
+
+지원 형식:
+    - txt:  한 줄에 URL 하나 (빈 줄과 '#'으로 시작하는 줄은 무시)
+    - csv:  url[,interval[,receiver_email]] (첫 줄이 URL이 아니면 머리글로 보고 열 이름으로 찾음)
+    - json: 설정 파일 형식 {"monitored_urls": {url: {...}}}, URL 문자열 목록,
+            또는 {"url", "interval", "receiver_email"} 객체 목록
+"""
+
+import csv
+import io
+import json
+import math
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from config import Config
+
+SUPPORTED_FORMATS = ('txt', 'csv', 'json')
+MAX_SUMMARY_ERRORS = 20  # 요약에 보여 줄 최대 오류 줄 수
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+def detect_format(text, filename=None):
+    """파일 이름(확장자) 또는 내용으로 형식을 추정합니다."""
+    if filename:
+        extension = filename.rsplit('.', 1)[-1].lower()
+        if extension in SUPPORTED_FORMATS:
+            return extension
+    stripped = text.lstrip()
+    if stripped.startswith(('{', '[')):
+        return 'json'
+    first_line = stripped.split('\n', 1)[0]
+    if ',' in first_line or '\t' in first_line:
+        return 'csv'
+    return 'txt'
+
+def parse_url_list(text, fmt=None):
+    """URL 목록 텍스트를 읽어 항목 목록과 형식 오류 목록을 반환합니다.
+
+    Returns:
+        tuple: ([{'line', 'url', 'interval', 'receiver_email'}], [(줄 번호, 오류 내용)])
+               interval/receiver_email은 지정되지 않았으면 None입니다.
+               json 형식에서는 줄 번호 대신 목록의 항목 번호이며, 파일 전체의 오류는 0입니다.
+    """
+    fmt = fmt or detect_format(text)
+    if fmt == 'json':
+        return _parse_json(text)
+    if fmt == 'csv':
+        return _parse_csv(text)
+
+    entries = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        url = line.strip()
+        if url and not url.startswith('#'):
+            entries.append(_entry(line_number, url))
+    return entries, []
+
+def export_url_list(monitored_urls, fmt='csv'):
+    """모니터링 중인 URL 설정을 지정한 형식의 텍스트로 반환합니다 (실행 상태는 제외)."""
+    if fmt == 'json':
+        return json.dumps({
+            'monitored_urls': {
+                url: {'interval': url_config['interval'], 'receiver_email': url_config['receiver_email']}
+                for url, url_config in monitored_urls.items()
+            }
+        }, ensure_ascii=False, indent=2)
+    if fmt == 'csv':
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(['url', 'interval', 'receiver_email'])
+        for url, url_config in monitored_urls.items():
+            writer.writerow([url, url_config['interval'], url_config['receiver_email']])
+        return output.getvalue()
+    return ''.join(f"{url}\n" for url in monitored_urls)
+
+def probe_product_names(fetch_name, urls, max_workers=None, max_per_host=None):
+    """URL을 동시에 한 번씩 조회하여 상품명을 모읍니다.
+
+    같은 웹사이트에는 max_per_host개까지만 동시에 요청합니다.
+
+    Args:
+        fetch_name: fetch_name(url) -> 상품명 또는 None (예: StockChecker.fetch_product_name)
+
+    Returns:
+        dict: {url: 상품명 또는 None(조회 실패)}
+    """
+    max_workers = max_workers or Config.MAX_CONCURRENT_CHECKS
+    max_per_host = max_per_host or Config.MAX_CONCURRENT_CHECKS_PER_HOST
+    host_limits = defaultdict(lambda: threading.BoundedSemaphore(max_per_host))
+    limits_lock = threading.Lock()
+
+    def probe(url):
+        with limits_lock:
+            limit = host_limits[urlparse(url).netloc.lower()]
+        with limit:
+            return fetch_name(url)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='url-probe') as executor:
+        for url, name in zip(urls, executor.map(probe, urls)):
+            results[url] = name
+    return results
+
+def is_valid_email(email):
+    """이메일 형식이 올바른지 확인합니다."""
+    return isinstance(email, str) and EMAIL_PATTERN.match(email) is not None
+
+def position_label(fmt):
+    """오류 위치 번호의 단위를 반환합니다 (json은 목록의 항목 번호)."""
+    return '항목' if fmt == 'json' else '줄'
+
+def format_import_summary(summary):
+    """import_urls() 결과를 사람이 읽을 수 있는 여러 줄 문자열로 만듭니다."""
+    lines = [
+        f"읽은 항목: {summary['total']}개",
+        f"추가됨: {summary['added']}개",
+        f"이미 모니터링 중: {summary['already_monitored']}개",
+        f"파일 내 중복: {summary['duplicates']}개",
+        f"잘못된 형식: {summary['invalid']}개",
+        f"지원하지 않는 웹사이트: {summary['unsupported']}개",
+    ]
+    if summary['probed']:
+        lines.append(f"상품명 확인: {summary['probed'] - summary['probe_failed']}/{summary['probed']}개 (실패 {summary['probe_failed']}개)")
+    if summary['errors']:
+        lines.append("")
+        lines.append("오류 (일부):")
+        unit = summary.get('position_label', '줄')
+        lines.extend(f"  {line_number}번째 {unit}: {message}" if line_number else f"  {message}"
+                     for line_number, message in summary['errors'][:MAX_SUMMARY_ERRORS])
+        if len(summary['errors']) > MAX_SUMMARY_ERRORS:
+            lines.append(f"  ... 외 {len(summary['errors']) - MAX_SUMMARY_ERRORS}건")
+    return "\n".join(lines)
+
+def _entry(line_number, url, interval=None, receiver_email=None):
+    return {'line': line_number, 'url': url, 'interval': interval, 'receiver_email': receiver_email or None}
+
+def parse_interval(value):
+    """체크 간격(분)을 숫자로 변환합니다. 비어 있으면 None, 잘못된 값이면 ValueError."""
+    if value is None or (isinstance(value, str) and value.strip() == ''):
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"숫자가 아닙니다: {value!r}")
+    try:
+        interval = float(value)
+    except OverflowError:
+        raise ValueError("너무 큰 값입니다")
+    # nan/inf는 스케줄러의 다음 체크 시각 계산과 힙 정렬을 깨뜨리므로 거부
+    if not math.isfinite(interval):
+        raise ValueError(f"유한한 숫자가 아닙니다: {value}")
+    if not Config.IMPORT_MIN_INTERVAL_MINUTES <= interval <= Config.IMPORT_MAX_INTERVAL_MINUTES:
+        raise ValueError(
+            f"{Config.IMPORT_MIN_INTERVAL_MINUTES}~{Config.IMPORT_MAX_INTERVAL_MINUTES}분 범위를 벗어났습니다: {value}"
+        )
+    return int(interval) if interval.is_integer() else interval
+
+def _parse_csv(text):
+    entries = []
+    errors = []
+    first_line = text.lstrip().split('\n', 1)[0]
+    reader = csv.reader(io.StringIO(text), delimiter='\t' if '\t' in first_line else ',')
+    columns = {'url': 0, 'interval': 1, 'receiver_email': 2}
+    first_row = True
+    for row in reader:
+        line_number = reader.line_num
+        if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+            continue
+        is_first, first_row = first_row, False
+        if is_first and '://' not in row[0]:
+            # 머리글: 열 이름으로 위치를 찾음 (url 열은 필수)
+            header = [cell.strip().lower() for cell in row]
+            if 'url' not in header:
+                errors.append((line_number, "머리글에 url 열이 없습니다"))
+                return entries, errors
+            columns = {name: header.index(name) if name in header else None for name in columns}
+            continue
+
+        def cell(name):
+            index = columns[name]
+            return row[index].strip() if index is not None and index < len(row) else None
+
+        try:
+            entries.append(_entry(line_number, cell('url'), parse_interval(cell('interval')), cell('receiver_email')))
+        except ValueError as e:
+            errors.append((line_number, f"잘못된 체크 간격: {e}"))
+    return entries, errors
+
+def _parse_json(text):
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        return [], [(0, f"JSON 형식 오류: {e}")]
+
+    if isinstance(data, dict):
+        data = data.get('monitored_urls', data)
+        if isinstance(data, dict):
+            data = [dict(url_config, url=url) if isinstance(url_config, dict) else {'url': url}
+                    for url, url_config in data.items()]
+    if not isinstance(data, list):
+        return [], [(0, "URL 목록 또는 monitored_urls 객체가 필요합니다")]
+
+    entries = []
+    errors = []
+    for index, item in enumerate(data, 1):
+        if isinstance(item, str):
+            entries.append(_entry(index, item.strip()))
+        elif isinstance(item, dict) and isinstance(item.get('url'), str):
+            try:
+                entries.append(_entry(index, item['url'].strip(), parse_interval(item.get('interval')), item.get('receiver_email')))
+            except ValueError as e:
+                errors.append((index, f"잘못된 체크 간격: {e}"))
+        else:
+            errors.append((index, "url 항목이 없습니다"))
+    return entries, errors